@@ -0,0 +1,104 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+# Compare sync (threadpool) and async (AsyncSession) handlers on the same endpoints.
+#
+#   python -m benchmark.bench_async --requests 500 --concurrency 50
+#
+# Each mode runs in its own process against a fresh SQLite database, because
+# DB_ASYNC is read once when src.database is imported.
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENDPOINTS = ["/api/home/component", "/api/home/page", "/api/shop/filter", "/api/shop/list"]
+
+
+async def drive(app, endpoints, total, concurrency):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+
+        async def call(index):
+            nonlocal errors
+            async with semaphore:
+                response = await client.get(endpoints[index % len(endpoints)])
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*[call(i) for i in range(total)])
+        elapsed = time.perf_counter() - start
+
+    return {"requests": total, "errors": errors, "seconds": elapsed, "rps": total / elapsed}
+
+
+def worker(args):
+    sys.path.insert(0, BACKEND)
+    import main
+
+    time.sleep(1)  # products are published "now" by the seeder
+    result = asyncio.run(drive(main.app, args.endpoints, args.requests, args.concurrency))
+    print(json.dumps(result))
+
+
+def run_mode(mode, args):
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ)
+        env.update({
+            "APP_ENV": "development",
+            "DB_CONNECTION": "sqlite",
+            "DB_NAME": os.path.join(workdir, "benchmark.db"),
+            "DB_ASYNC": "true" if mode == "async" else "false",
+            "ALGORITHM": env.get("ALGORITHM", "HS256"),
+            "JWT_SECRET_KEY": env.get("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key"),
+        })
+        for step in (["src.migrate", "upgrade", "head"], ["src.seed"]):
+            subprocess.run([sys.executable, "-m", *step], cwd=BACKEND, env=env, capture_output=True, check=True)
+        command = [
+            sys.executable, "-m", "benchmark.bench_async", "--worker",
+            "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+            "--endpoints", *args.endpoints
+        ]
+        output = subprocess.run(command, cwd=workdir, env={**env, "PYTHONPATH": BACKEND}, capture_output=True, text=True, check=True)
+        return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async handler throughput")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--endpoints", nargs="+", default=ENDPOINTS)
+    parser.add_argument("--worker", action="store_true")
+    args = parser.parse_args()
+
+    if args.worker:
+        return worker(args)
+
+    print(f"{'mode':<8}{'requests':>10}{'errors':>8}{'seconds':>10}{'req/s':>10}")
+    for mode in ("sync", "async"):
+        result = run_mode(mode, args)
+        print(f"{mode:<8}{result['requests']:>10}{result['errors']:>8}{result['seconds']:>10.2f}{result['rps']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
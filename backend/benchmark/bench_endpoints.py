@@ -0,0 +1,277 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+# Every route, one after the other, through an in-process ASGI client on a
+# database filled by `python -m src.seed --bulk`. Per route: p50/p95/p99
+# latency, requests/s, SQL statements per request and the peak Python
+# memory one request allocates. Results are written as JSON; --compare
+# prints the change against an earlier file.
+#
+#   python -m benchmark.bench_endpoints --users 2000 --products 5000 --requests 200 --output endpoints.json
+#   python -m benchmark.bench_endpoints --async --output endpoints-async.json --compare endpoints.json
+#   python -m benchmark.bench_endpoints --db mysql ...   (DB_* of the environment; the database is topped up, use a scratch one)
+#
+# The app runs in a fresh interpreter, so the process RSS is its own.
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHECKOUT = {"payment_id": 1, "email": "bench@example.com", "phone": "1234567", "first_name": "Bench", "last_name": "Mark", "gender": "M", "address": "Street 1", "country": "Country", "city": "City", "zip_code": "12345", "notes": "benchmark"}
+
+
+def scenarios(context: dict) -> list:
+    """
+    (name, method, path, request options, preparation outside the timing).
+    Paths and preparations are callables because they depend on state the
+    previous requests created.
+    """
+    product, size, colour = context["product"], context["size"], context["colour"]
+    cart = {"size_id": size, "colour_id": colour, "qty": 1}
+    counter = iter(range(10 ** 9))
+    return [
+        ("home component", "GET", "/api/home/component", {}, None),
+        ("home page", "GET", "/api/home/page", {}, None),
+        ("shop filter", "GET", "/api/shop/filter", {}, None),
+        ("shop list", "GET", "/api/shop/list?limit=12", {}, None),
+        ("shop list filtered", "GET", "/api/shop/list?limit=12&category=1,2&order=products.price&dir=asc", {}, None),
+        ("shop search", "GET", "/api/shop/list?limit=12&search=product", {}, None),
+        ("product detail", "GET", f"/api/order/cart/{product}", {"auth": True}, None),
+        ("cart add", "POST", f"/api/order/cart/{product}", {"auth": True, "json": cart}, None),
+        ("review list", "GET", f"/api/order/review/{product}", {"auth": True}, None),
+        ("review add", "POST", f"/api/order/review/{product}", {"auth": True, "json": {"rating": 80, "review": "benchmark review"}}, None),
+        ("session", "GET", "/api/order/session", {"auth": True}, None),
+        ("initial", "GET", "/api/order/initial", {"auth": True}, None),
+        ("checkout", "POST", "/api/order/checkout", {"auth": True, "json": CHECKOUT}, ("POST", f"/api/order/cart/{product}", {"auth": True, "json": cart})),
+        ("order list", "GET", "/api/order/list", {"auth": True}, None),
+        ("order detail", "GET", lambda: f"/api/order/detail/{context['order']}", {"auth": True}, None),
+        ("profile detail", "GET", "/api/profile/detail", {"auth": True}, None),
+        ("profile activity", "GET", "/api/profile/activity", {"auth": True}, None),
+        ("profile update", "POST", "/api/profile/update", {"auth": True, "json": context["profile"]}, None),
+        ("auth login", "POST", "/api/auth/login", {"json": {"email": context["email"], "password": context["password"]}}, None),
+        ("auth register", "POST", "/api/auth/register", {"json": lambda: {"name": "Benchmark User", "email": f"bench{next(counter)}@example.org", "password": "Qwerty123!", "password_confirm": "Qwerty123!"}}, None)
+    ]
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def worker(args):
+    import asyncio
+    import resource
+    import time
+    import tracemalloc
+
+    sys.path.insert(0, BACKEND)
+    import httpx
+    import main
+    from sqlalchemy import and_, desc, event, func
+    from src import database
+    from src.model import Order, Product, ProductInventory, User
+    from src.seed import SEED_PASSWORD
+
+    statements = [0]
+
+    def count(*_):
+        statements[0] += 1
+
+    for engine in database.sync_engines():
+        event.listen(engine, "before_cursor_execute", count)
+
+    # a customer with order history, and the top rated product
+    db = database.SessionLocal()
+    order = db.query(Order).order_by(Order.id).first()
+    user = order.user if order != None else db.query(User).order_by(User.id).first()
+    product = db.query(Product).filter(and_(Product.status == 1, Product.published_date <= func.now())).order_by(desc(Product.total_rating)).first()
+    inventory = db.query(ProductInventory).filter(ProductInventory.product_id == product.id).first()
+    context = {
+        "email": user.email,
+        "password": SEED_PASSWORD,
+        "profile": {"email": user.email, "phone": user.phone or "1234567", "first_name": user.first_name or "Bench", "last_name": user.last_name or "Mark", "gender": user.gender or "M"},
+        "product": product.id,
+        "size": inventory.size_id,
+        "colour": inventory.colour_id,
+        "order": order.id if order != None else None
+    }
+    db.close()
+
+    async def run():
+        results = {}
+        lifespan = main.app.router.lifespan_context(main.app)
+        await lifespan.__aenter__()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://benchmark") as client:
+            response = await client.post("/api/auth/login", json={"email": context["email"], "password": context["password"]})
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+            async def send(method, path, options):
+                body = options.get("json")
+                return await client.request(
+                    method,
+                    path() if callable(path) else path,
+                    json=body() if callable(body) else body,
+                    headers=headers if options.get("auth") else None
+                )
+
+            for name, method, path, options, prepare in scenarios(context):
+                if args.only and name not in args.only:
+                    continue
+                latencies, errors, queries = [], 0, 0
+                for index in range(args.warmup + args.requests):
+                    if prepare != None:
+                        await send(*prepare)
+                    before = statements[0]
+                    start = time.perf_counter()
+                    response = await send(method, path, options)
+                    elapsed = time.perf_counter() - start
+                    if index >= args.warmup:
+                        latencies.append(elapsed * 1000)
+                        queries += statements[0] - before
+                        errors += response.status_code >= 400
+                    if name == "checkout" and response.status_code < 400:
+                        session = database.SessionLocal()
+                        context["order"] = session.query(Order.id).join(User, User.id == Order.user_id).filter(and_(User.email == context["email"], Order.status == 1)).order_by(desc(Order.id)).limit(1).scalar()
+                        session.close()
+
+                # allocation peak of single requests, apart from the timed loop
+                tracemalloc.start()
+                peak = 0
+                for _ in range(args.memory_requests):
+                    if prepare != None:
+                        await send(*prepare)
+                    tracemalloc.reset_peak()
+                    current = tracemalloc.get_traced_memory()[0]
+                    await send(method, path, options)
+                    peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+                tracemalloc.stop()
+
+                results[name] = {
+                    "requests": len(latencies),
+                    "errors": errors,
+                    "p50_ms": round(percentile(latencies, 0.50), 3),
+                    "p95_ms": round(percentile(latencies, 0.95), 3),
+                    "p99_ms": round(percentile(latencies, 0.99), 3),
+                    "rps": round(len(latencies) / (sum(latencies) / 1000), 1),
+                    "queries": round(queries / len(latencies), 2),
+                    "peak_kib": round(peak / 1024, 1)
+                }
+        await lifespan.__aexit__(None, None, None)
+        return results
+
+    endpoints = asyncio.run(run())
+    print(json.dumps({"endpoints": endpoints, "max_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}))
+
+
+def revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment(args, workdir: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "APP_ENV": "development",
+        "DB_ASYNC": "true" if args.use_async else "false",
+        "ALGORITHM": env.get("ALGORITHM", "HS256"),
+        "JWT_SECRET_KEY": env.get("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key"),
+        "PYTHONPATH": BACKEND
+    })
+    if args.db == "sqlite":
+        env.update({"DB_CONNECTION": "sqlite", "DB_NAME": os.path.join(workdir, "benchmark.db"), "DB_REPLICAS": ""})
+    return env
+
+
+def prepare(args, env: dict):
+    subprocess.run([sys.executable, "-m", "src.migrate", "upgrade", "head"], cwd=BACKEND, env=env, check=True, capture_output=True)
+    subprocess.run([
+        sys.executable, "-m", "src.seed", "--bulk", "--seed", str(args.seed),
+        "--users", str(args.users), "--products", str(args.products), "--orders", str(args.orders),
+        "--reviews", str(args.reviews), "--activities", str(args.activities)
+    ], cwd=BACKEND, env=env, check=True, capture_output=True)
+
+
+def compare(results: dict, path: str):
+    with open(path) as handle:
+        previous = json.load(handle)["endpoints"]
+    print(f"\nagainst {path}")
+    print(f"{'endpoint':<22}{'p50 ms':>10}{'was':>10}{'change':>9}{'queries':>9}{'was':>7}")
+    for name, result in results.items():
+        if name in previous:
+            before = previous[name]
+            change = result["p50_ms"] / before["p50_ms"] - 1 if before["p50_ms"] > 0 else 0.0
+            print(f"{name:<22}{result['p50_ms']:>10.2f}{before['p50_ms']:>10.2f}{change:>+9.0%}{result['queries']:>9.1f}{before['queries']:>7.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="per-route latency, throughput, SQL statements and memory")
+    parser.add_argument("--db", choices=("sqlite", "mysql"), default="sqlite")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="serve handlers on an AsyncSession")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--orders", type=int, default=5000)
+    parser.add_argument("--reviews", type=int, default=10000)
+    parser.add_argument("--activities", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--requests", type=int, default=100, help="timed requests per route")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--memory-requests", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="route names to run, e.g. \"shop list\" \"checkout\"")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="earlier JSON results to compare with")
+    parser.add_argument("--worker", action="store_true")
+    args = parser.parse_args()
+
+    if args.worker:
+        return worker(args)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = environment(args, workdir)
+        prepare(args, env)
+        command = [sys.executable, "-m", "benchmark.bench_endpoints", "--worker", "--requests", str(args.requests), "--warmup", str(args.warmup), "--memory-requests", str(args.memory_requests)]
+        if args.only:
+            command += ["--only", *args.only]
+        output = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True, check=True).stdout
+        measured = json.loads(output.strip().splitlines()[-1])
+
+    result = {
+        "revision": revision(),
+        "python": platform.python_version(),
+        "database": args.db,
+        "async": args.use_async,
+        "scale": {"users": args.users, "products": args.products, "orders": args.orders, "reviews": args.reviews, "activities": args.activities, "seed": args.seed},
+        "requests": args.requests,
+        **measured
+    }
+
+    print(f"{'endpoint':<22}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'queries':>9}{'peak KiB':>10}{'errors':>8}")
+    for name, row in result["endpoints"].items():
+        print(f"{name:<22}{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['rps']:>9.1f}{row['queries']:>9.1f}{row['peak_kib']:>10.1f}{row['errors']:>8}")
+    print(f"max RSS {result['max_rss_mib']} MiB")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(result, handle, indent=2)
+            handle.write("\n")
+    if args.compare:
+        compare(result["endpoints"], args.compare)
+
+
+if __name__ == "__main__":
+    main()
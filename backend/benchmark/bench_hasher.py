@@ -0,0 +1,71 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+# Logins/sec (bcrypt verify) against the number of hasher worker processes.
+#
+#   python -m benchmark.bench_hasher --logins 200 --threads 40 --workers 0 1 2 4
+#
+# `threads` plays the request threadpool; workers=0 is the old inline bcrypt.
+
+import argparse
+import os
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hasher import PasswordHasher, HasherSaturated, _hash
+
+PASSWORD = "Qwerty123!"
+
+
+def run(workers: int, logins: int, threads: int, max_pending: int) -> dict:
+    hasher = PasswordHasher(workers, max_pending)
+    hashed = _hash(PASSWORD)
+    hasher.verify(PASSWORD, hashed)  # start the pool outside the timing
+    rejected = 0
+
+    def login(_):
+        nonlocal rejected
+        try:
+            return hasher.verify(PASSWORD, hashed)
+        except HasherSaturated:
+            rejected += 1
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(login, range(logins)))
+    elapsed = time.perf_counter() - start
+    hasher.shutdown()
+
+    accepted = sum(1 for result in results if result)
+    return {"workers": workers, "accepted": accepted, "rejected": rejected, "seconds": elapsed, "logins_per_second": accepted / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bcrypt logins/sec against hasher worker count")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=40)
+    parser.add_argument("--max-pending", type=int, default=1000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'accepted':>10}{'rejected':>10}{'seconds':>10}{'logins/s':>10}")
+    for workers in args.workers:
+        result = run(workers, args.logins, args.threads, args.max_pending)
+        print(f"{result['workers']:>8}{result['accepted']:>10}{result['rejected']:>10}{result['seconds']:>10.2f}{result['logins_per_second']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
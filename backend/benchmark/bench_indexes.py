@@ -0,0 +1,196 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+# Insert throughput and hot-query latency with the legacy index set (one
+# single-column index on every non-text column, as the old models declared
+# them plus the foreign key indexes MySQL adds) against the composite
+# indexes declared in src/model.py.
+#
+#   python -m benchmark.bench_indexes --products 5000 --users 500 --inserts 10000
+#
+# Each index set gets its own throwaway SQLite database with the same data.
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BATCH = 50
+
+
+def legacy_metadata(metadata):
+    from sqlalchemy import Index, MetaData, Text, UniqueConstraint
+    from sqlalchemy.dialects.mysql import LONGTEXT
+
+    legacy = MetaData()
+    for table in metadata.sorted_tables:
+        copy = table.to_metadata(legacy)
+        copy.indexes.clear()
+        copy.constraints = {constraint for constraint in copy.constraints if not isinstance(constraint, UniqueConstraint)}
+        for column in copy.columns:
+            if column.unique:
+                Index(f"ix_{copy.name}_{column.name}", column, unique=True)
+            elif not isinstance(column.type, (Text, LONGTEXT)):
+                # foreign keys included: InnoDB creates their index implicitly
+                Index(f"ix_{copy.name}_{column.name}", column)
+    return legacy
+
+
+def populate(engine, products: int, users: int, rng: random.Random):
+    from src.model import User, Product, Size, Colour, ProductInventory, Order, Activity
+
+    now = datetime.datetime.now()
+    with engine.begin() as connection:
+        connection.execute(User.__table__.insert(), [{"id": index, "email": f"user{index}@example.com", "password": "x" * 60, "status": 1} for index in range(1, users + 1)])
+        connection.execute(Size.__table__.insert(), [{"id": index, "name": f"Size {index}", "status": 1} for index in range(1, 4)])
+        connection.execute(Colour.__table__.insert(), [{"id": index, "code": f"#00000{index}", "name": f"Colour {index}", "status": 1} for index in range(1, 4)])
+        connection.execute(Product.__table__.insert(), [{
+            "id": index,
+            "sku": f"P{index:07d}",
+            "name": f"Product {index}",
+            "price": rng.randint(10, 5000),
+            "total_rating": rng.randint(0, 1000),
+            "total_order": rng.randint(0, 500),
+            "published_date": now - datetime.timedelta(days=rng.randint(-30, 365)),
+            "details": "",
+            "description": "",
+            "status": 1 if rng.random() < 0.9 else 0
+        } for index in range(1, products + 1)])
+        connection.execute(ProductInventory.__table__.insert(), [
+            {"product_id": product, "size_id": size, "colour_id": colour, "stock": 100}
+            for product in range(1, products + 1) for size in range(1, 4) for colour in range(1, 4)
+        ])
+        connection.execute(Order.__table__.insert(), [{
+            "user_id": rng.randint(1, users),
+            "payment_id": None,
+            "invoice_number": f"INV{index:08d}",
+            "status": 1 if rng.random() < 0.8 else 0,
+            "created_at": now - datetime.timedelta(minutes=index)
+        } for index in range(1, users * 10 + 1)])
+        connection.execute(Activity.__table__.insert(), [{
+            "user_id": rng.randint(1, users),
+            "event": "Sign In",
+            "subject": "Account",
+            "description": "User signed in",
+            "status": 1,
+            "created_at": now - datetime.timedelta(minutes=index)
+        } for index in range(1, users * 20 + 1)])
+
+
+def inserts(engine, total: int, users: int, products: int, rng: random.Random) -> dict:
+    # Driver-level executemany in transactions of `BATCH` rows, so that the
+    # time goes to the table and its indexes rather than to statement building.
+    now = datetime.datetime.now()
+    stamp = lambda index: (now + datetime.timedelta(microseconds=index)).isoformat(" ")
+    statements = {
+        "activities": ("INSERT INTO activities (user_id, event, subject, description, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       lambda index: (rng.randint(1, users), "Add To Cart", "Cart", "Product added", 1, stamp(index), stamp(index))),
+        "orders": ("INSERT INTO orders (user_id, invoice_number, total_item, subtotal, total_discount, total_taxes, total_shipment, total_paid, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                   lambda index: (rng.randint(1, users), f"NEW{rng.getrandbits(40):012x}", rng.randint(1, 9), rng.randint(10, 5000), 0, rng.randint(1, 500), 2, rng.randint(10, 5000), 0, stamp(index), stamp(index))),
+        "orders_details": ("INSERT INTO orders_details (order_id, inventory_id, price, qty, total, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           lambda index: (rng.randint(1, users * 10), rng.randint(1, products * 9), rng.randint(10, 5000), rng.randint(1, 9), rng.randint(10, 5000), 1, stamp(index), stamp(index)))
+    }
+    results = {}
+    connection = engine.raw_connection()
+    for name, (sql, row) in statements.items():
+        start = time.perf_counter()
+        for batch in range(0, total, BATCH):
+            connection.cursor().executemany(sql, [row(index) for index in range(batch, min(batch + BATCH, total))])
+            connection.commit()
+        results[name] = total / (time.perf_counter() - start)
+    connection.close()
+    return results
+
+
+def queries(session_factory, repeat: int, users: int, products: int, rng: random.Random) -> dict:
+    from sqlalchemy import and_, desc, func
+    from sqlalchemy.orm import load_only
+    from src.model import Product, ProductInventory, Order, OrderDetail, Activity
+    from src.product_card import CARD_COLUMNS
+
+    visible = and_(Product.status == 1, Product.published_date <= func.now())
+    shapes = {
+        "home top rated": lambda db: db.query(Product).options(load_only(*CARD_COLUMNS)).filter(visible).order_by(desc(Product.total_rating)).limit(6).all(),
+        "best sellers": lambda db: db.query(Product).options(load_only(*CARD_COLUMNS)).filter(visible).order_by(desc(Product.total_order)).limit(3).all(),
+        "shop by price": lambda db: db.query(Product).options(load_only(*CARD_COLUMNS)).filter(Product.status == 1).order_by(desc(Product.price), desc(Product.id)).limit(25).offset(100).all(),
+        "max rating": lambda db: db.query(func.max(Product.total_rating)).filter(visible).scalar(),
+        "open order": lambda db: db.query(Order).filter(and_(Order.status == 0, Order.user_id == rng.randint(1, users))).order_by(desc(Order.id)).first(),
+        "order history": lambda db: db.query(Order).filter(Order.user_id == rng.randint(1, users)).order_by(desc(Order.created_at), desc(Order.id)).limit(10).all(),
+        "inventory variant": lambda db: db.query(ProductInventory).filter(and_(ProductInventory.product_id == rng.randint(1, products), ProductInventory.size_id == rng.randint(1, 3), ProductInventory.colour_id == rng.randint(1, 3))).first(),
+        "cart line": lambda db: db.query(OrderDetail).filter(and_(OrderDetail.inventory_id == rng.randint(1, products * 9), OrderDetail.order_id == rng.randint(1, users * 10))).first(),
+        "activity page": lambda db: db.query(Activity).filter(Activity.user_id == rng.randint(1, users)).order_by(desc(Activity.id)).limit(10).all()
+    }
+    results = {}
+    db = session_factory()
+    for name, shape in shapes.items():
+        shape(db)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            shape(db)
+        results[name] = (time.perf_counter() - start) * 1000 / repeat
+    db.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="legacy single-column indexes against composite indexes")
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--inserts", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    os.environ.update({"DB_CONNECTION": "sqlite", "DB_NAME": os.path.join(workdir, "unused.db"), "DB_ASYNC": "false"})
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from src.database import Base
+    import src.model  # noqa: F401
+
+    engines, indexes, insert_rates, latencies = {}, {}, {}, {}
+    for name, metadata in (("legacy", legacy_metadata(Base.metadata)), ("composite", Base.metadata)):
+        engines[name] = create_engine(f"sqlite:///{os.path.join(workdir, name)}.db")
+        metadata.create_all(bind=engines[name])
+        populate(engines[name], args.products, args.users, random.Random(args.seed))
+        with engines[name].connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+        indexes[name] = sum(len(table.indexes) for table in metadata.sorted_tables)
+
+    # alternate the two databases and keep the best round, so that drift of
+    # the machine does not end up on one side
+    for attempt in range(args.rounds):
+        for name, engine in engines.items():
+            rates = inserts(engine, args.inserts, args.users, args.products, random.Random(args.seed + attempt))
+            timings = queries(sessionmaker(bind=engine), args.repeat, args.users, args.products, random.Random(args.seed + attempt))
+            insert_rates[name] = {key: max(value, insert_rates.get(name, {}).get(key, 0.0)) for key, value in rates.items()}
+            latencies[name] = {key: min(value, latencies.get(name, {}).get(key, value)) for key, value in timings.items()}
+
+    legacy_count, legacy_inserts, legacy_queries = indexes["legacy"], insert_rates["legacy"], latencies["legacy"]
+    composite_count, composite_inserts, composite_queries = indexes["composite"], insert_rates["composite"], latencies["composite"]
+    print(f"indexes: legacy {legacy_count}, composite {composite_count}")
+    print(f"{'insert':<20}{'legacy rows/s':>16}{'composite rows/s':>18}{'speedup':>10}")
+    for name in legacy_inserts:
+        print(f"{name:<20}{legacy_inserts[name]:>16.0f}{composite_inserts[name]:>18.0f}{composite_inserts[name] / legacy_inserts[name]:>10.2f}")
+    print(f"{'query':<20}{'legacy ms':>16}{'composite ms':>18}{'speedup':>10}")
+    for name in legacy_queries:
+        print(f"{name:<20}{legacy_queries[name]:>16.3f}{composite_queries[name]:>18.3f}{legacy_queries[name] / composite_queries[name]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
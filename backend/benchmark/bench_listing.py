@@ -0,0 +1,137 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+# Product listing pages with large descriptions: full entities (every column,
+# categories loaded lazily per card, a "top product" row for the rating)
+# against the card projection (load_only, one selectinload, MAX() scalar).
+#
+#   python -m benchmark.bench_listing --products 2000 --text-kb 32 --page 50
+#
+# Runs against a throwaway SQLite database. Memory is the tracemalloc peak
+# while one page is loaded and serialized.
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def populate(db, products: int, text_kb: int, rng: random.Random):
+    from src.model import Product, Category, products_categories
+
+    categories = [Category(id=index, name=f"Category {index}", status=1, displayed=1) for index in range(1, 9)]
+    db.add_all(categories)
+    filler = "lorem ipsum dolor sit amet " * (text_kb * 1024 // 27 + 1)
+    db.bulk_insert_mappings(Product, [{
+        "id": index,
+        "sku": f"P{index:07d}",
+        "name": f"Product {index}",
+        "image": f"uploads/product{index}.png",
+        "price": rng.randint(10, 5000),
+        "total_rating": rng.randint(100, 1000),
+        "total_order": rng.randint(0, 500),
+        "details": filler[:text_kb * 512],
+        "description": filler[:text_kb * 1024],
+        "status": 1
+    } for index in range(1, products + 1)])
+    db.execute(products_categories.insert(), [
+        {"product_id": index, "category_id": category}
+        for index in range(1, products + 1) for category in rng.sample(range(1, 9), 2)
+    ])
+    db.commit()
+
+
+def full_page(db, page: int, size: int) -> list:
+    from decimal import Decimal
+    from sqlalchemy import desc
+    from sqlalchemy.orm import undefer
+    from src.model import Product
+
+    top = db.query(Product).options(undefer(Product.details), undefer(Product.description)).order_by(desc(Product.total_rating)).first()
+    rows = db.query(Product).options(undefer(Product.details), undefer(Product.description)).order_by(desc(Product.id)).limit(size).offset(page * size).all()
+    return [{
+        "id": row.id,
+        "name": row.name,
+        "image": row.image,
+        "category": ", ".join(category.name for category in row.categories),
+        "price": row.price,
+        "price_old": Decimal(row.price) * Decimal("1.05"),
+        "total_rating": -(-row.total_rating * 5 // top.total_rating)
+    } for row in rows]
+
+
+def card_page(db, page: int, size: int) -> list:
+    from sqlalchemy import desc
+    from src.model import Product
+    from src.product_card import card_options, product_cards
+
+    rows = db.query(Product).options(*card_options()).order_by(desc(Product.id)).limit(size).offset(page * size).all()
+    return product_cards(db, rows, all_categories=True)
+
+
+def measure(session_factory, loader, pages: int, size: int) -> dict:
+    from sqlalchemy import event
+    from src.database import engine
+
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    elapsed, peak = 0.0, 0
+    for page in range(pages):
+        db = session_factory()
+        tracemalloc.start()
+        start = time.perf_counter()
+        loader(db, page, size)
+        elapsed += time.perf_counter() - start
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        db.close()
+    event.remove(engine, "before_cursor_execute", count)
+    return {"ms_per_page": elapsed * 1000 / pages, "peak_kb": peak / 1024, "queries_per_page": statements / pages}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="product listing with full entities against the card projection")
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--text-kb", type=int, default=32)
+    parser.add_argument("--page", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    os.environ.update({"DB_CONNECTION": "sqlite", "DB_NAME": os.path.join(workdir, "listing.db"), "DB_ASYNC": "false"})
+
+    from src.database import Base, engine, SessionLocal
+    import src.model  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    populate(db, args.products, args.text_kb, random.Random(args.seed))
+    db.close()
+
+    print(f"{'loader':>8}{'ms/page':>10}{'peak KB':>12}{'queries':>10}")
+    for name, loader in (("full", full_page), ("card", card_page)):
+        result = measure(SessionLocal, loader, args.pages, args.page)
+        print(f"{name:>8}{result['ms_per_page']:>10.2f}{result['peak_kb']:>12.0f}{result['queries_per_page']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
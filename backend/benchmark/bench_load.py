@@ -0,0 +1,313 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+# Concurrent virtual shoppers on weighted journeys, so that browsing and
+# checkout compete for the same rows (the draft order, inventory stock,
+# Product.total_order) and for the connection pool.
+#
+#   python -m benchmark.bench_load --vus 50 --duration 30
+#   python -m benchmark.bench_load --vus 100 --duration 60 --weights browse=30 checkout=40 --hot 10 --output load.json
+#   python -m benchmark.bench_load --db mysql --async ...   (DB_* of the environment; use a scratch database)
+#
+# Reports requests/s, journeys/s and p50/p95/p99 per journey step, errors by
+# kind (HTTP status, deadlock, lock wait, pool timeout) and pool saturation.
+# The app runs in-process behind httpx's ASGI transport in a fresh
+# interpreter; sync handlers get the usual threadpool.
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+
+from benchmark.bench_endpoints import environment, percentile, prepare, revision
+
+JOURNEYS = {"browse": 35, "search": 15, "filter": 15, "checkout": 20, "history": 10, "profile": 5}
+
+CHECKOUT = {"payment_id": 1, "email": "shopper@example.com", "phone": "1234567", "first_name": "Load", "last_name": "Shopper", "gender": "F", "address": "Street 1", "country": "Country", "city": "City", "zip_code": "12345", "notes": "load test"}
+
+
+def failure(error: Exception) -> str:
+    from sqlalchemy import exc
+
+    message = str(error).lower()
+    if isinstance(error, exc.TimeoutError):
+        return "pool timeout"
+    if "deadlock" in message or "(1213" in message:
+        return "deadlock"
+    if "database is locked" in message or "lock wait timeout" in message or "(1205" in message:
+        return "lock wait"
+    return type(error).__name__
+
+
+class Shopper:
+    """
+    One virtual user: signs in as its own seeded customer the first time a
+    journey needs it and keeps the token, like a browser session would.
+    """
+
+    def __init__(self, client, stats, rng, context: dict, email: str, think: float):
+        self.client = client
+        self.stats = stats
+        self.rng = rng
+        self.context = context
+        self.email = email
+        self.think = think
+        self.headers = None
+
+    async def step(self, journey: str, step: str, method: str, path: str, body: dict | None = None, auth: bool = False):
+        import asyncio
+        import time
+
+        if self.think > 0:
+            await asyncio.sleep(self.rng.uniform(0, self.think))
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, json=body, headers=self.headers if auth else None)
+            kind = f"HTTP {response.status_code}" if response.status_code >= 400 else None
+        except Exception as error:
+            response, kind = None, failure(error)
+        self.stats.record(journey, step, (time.perf_counter() - start) * 1000, kind)
+        return response if kind == None else None
+
+    async def sign_in(self, journey: str) -> bool:
+        if self.headers == None:
+            response = await self.step(journey, "login", "POST", "/api/auth/login", {"email": self.email, "password": self.context["password"]})
+            if response != None:
+                self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        return self.headers != None
+
+    def listing(self) -> str:
+        order, direction = self.rng.choice((("products.id", "desc"), ("products.price", "asc"), ("products.price", "desc"), ("products.total_rating", "desc")))
+        return f"/api/shop/list?limit=12&order={order}&dir={direction}"
+
+    async def browse(self):
+        await self.step("browse", "home", "GET", "/api/home/page")
+        await self.step("browse", "home component", "GET", "/api/home/component")
+        listing = self.listing()
+        response = await self.step("browse", "shop list", "GET", listing)
+        if response != None and response.json()["next_cursor"] != None:
+            await self.step("browse", "shop next page", "GET", f"{listing}&cursor={response.json()['next_cursor']}")
+
+    async def search(self):
+        term = f"product {self.rng.randint(1, max(self.context['products'] // 10, 1))}"
+        await self.step("search", "shop filter", "GET", "/api/shop/filter")
+        await self.step("search", "search", "GET", f"/api/shop/list?limit=12&order=relevance&search={term}")
+
+    async def filter(self):
+        categories = ",".join(str(category) for category in self.rng.sample(self.context["categories"], min(2, len(self.context["categories"]))))
+        low = self.rng.randint(10, 2000)
+        await self.step("filter", "shop filter", "GET", "/api/shop/filter")
+        await self.step("filter", "by category", "GET", f"/api/shop/list?limit=12&category={categories}")
+        await self.step("filter", "by brand and price", "GET", f"/api/shop/list?limit=12&brand={self.rng.choice(self.context['brands'])}&priceMin={low}&priceMax={low + 1000}&order=products.price&dir=asc")
+
+    async def checkout(self):
+        if not await self.sign_in("checkout"):
+            return
+        for product, size, colour in self.rng.sample(self.context["hot"], min(self.rng.randint(1, 3), len(self.context["hot"]))):
+            await self.step("checkout", "product detail", "GET", f"/api/order/cart/{product}", auth=True)
+            await self.step("checkout", "add to cart", "POST", f"/api/order/cart/{product}", {"size_id": size, "colour_id": colour, "qty": self.rng.randint(1, 2)}, auth=True)
+        await self.step("checkout", "initial", "GET", "/api/order/initial", auth=True)
+        await self.step("checkout", "checkout", "POST", "/api/order/checkout", CHECKOUT, auth=True)
+
+    async def history(self):
+        if not await self.sign_in("history"):
+            return
+        response = await self.step("history", "order list", "GET", "/api/order/list", auth=True)
+        orders = response.json()["list"] if response != None else []
+        if len(orders) > 0:
+            await self.step("history", "order detail", "GET", f"/api/order/detail/{self.rng.choice(orders)['id']}", auth=True)
+
+    async def profile(self):
+        if not await self.sign_in("profile"):
+            return
+        response = await self.step("profile", "profile detail", "GET", "/api/profile/detail", auth=True)
+        await self.step("profile", "activity", "GET", "/api/profile/activity", auth=True)
+        if response != None:
+            user = response.json()
+            form = {key: user.get(key) for key in ("email", "phone", "first_name", "last_name", "gender", "address", "country", "city", "zip_code")}
+            await self.step("profile", "update", "POST", "/api/profile/update", form, auth=True)
+
+
+class Statistics:
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, journey: str, step: str, elapsed: float, kind: str | None):
+        self.latencies.setdefault(f"{journey}: {step}", []).append(elapsed)
+        if kind != None:
+            self.errors.setdefault(f"{journey}: {step}", {}).setdefault(kind, 0)
+            self.errors[f"{journey}: {step}"][kind] += 1
+
+
+def worker(args):
+    import asyncio
+    import random
+    import time
+
+    import httpx
+    import main
+    from sqlalchemy import and_, desc, func
+    from src import database
+    from src.model import Brand, Category, Product, ProductInventory, User
+    from src.seed import SEED_PASSWORD
+
+    db = database.SessionLocal()
+    emails = [email for email, in db.query(User.email).order_by(User.id).limit(args.vus)]
+    top = [id for id, in db.query(Product.id).filter(and_(Product.status == 1, Product.published_date <= func.now())).order_by(desc(Product.total_rating)).limit(args.hot)]
+    variants = {}
+    for row in db.query(ProductInventory.product_id, ProductInventory.size_id, ProductInventory.colour_id).filter(ProductInventory.product_id.in_(top)).order_by(ProductInventory.id):
+        variants.setdefault(row.product_id, [])
+        if len(variants[row.product_id]) < 2:
+            variants[row.product_id].append(tuple(row))
+    context = {
+        "password": SEED_PASSWORD,
+        "products": db.query(func.count(Product.id)).scalar(),
+        "categories": [id for id, in db.query(Category.id)],
+        "brands": [id for id, in db.query(Brand.id)],
+        # two variants of each of the top rated products: the rows checkouts fight over
+        "hot": [variant for product in top for variant in variants.get(product, [])]
+    }
+    db.close()
+
+    weights = dict(JOURNEYS)
+    for weight in args.weights or []:
+        name, _, value = weight.partition("=")
+        weights[name] = float(value)
+    journeys = [name for name in weights if weights[name] > 0]
+
+    stats = Statistics()
+    saturation = {"samples": 0, "busy": 0, "peak_checked_out": 0}
+
+    async def sample_pool(stop):
+        while not stop.is_set():
+            status = database.pool_status()
+            pool = status.get("async", status["sync"])
+            saturation["samples"] += 1
+            saturation["peak_checked_out"] = max(saturation["peak_checked_out"], pool["checked_out"])
+            saturation["busy"] += pool["checked_out"] >= pool["size"] + max(pool["max_overflow"], 0)
+            await asyncio.sleep(0.05)
+
+    async def run():
+        lifespan = main.app.router.lifespan_context(main.app)
+        await lifespan.__aenter__()
+        completed = {name: 0 for name in journeys}
+        before = database.pool_status()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://load", timeout=None) as client:
+            deadline = time.perf_counter() + args.duration
+
+            async def shopper(index: int):
+                # shoppers arrive spread over the ramp, not all signing in at once
+                await asyncio.sleep(args.ramp * index / args.vus)
+                user_rng = random.Random(f"{args.seed}:{index}")
+                user = Shopper(client, stats, user_rng, context, emails[index % len(emails)], args.think / 1000)
+                while time.perf_counter() < deadline:
+                    journey = user_rng.choices(journeys, [weights[name] for name in journeys])[0]
+                    await getattr(user, journey)()
+                    completed[journey] += 1
+
+            stop = asyncio.Event()
+            sampler = asyncio.create_task(sample_pool(stop))
+            start = time.perf_counter()
+            await asyncio.gather(*[shopper(index) for index in range(args.vus)])
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await sampler
+        after = database.pool_status()
+        await lifespan.__aexit__(None, None, None)
+        return completed, elapsed, before, after
+
+    completed, elapsed, before, after = asyncio.run(run())
+    pool_before, pool_after = before.get("async", before["sync"]), after.get("async", after["sync"])
+
+    steps = {}
+    for name, latencies in stats.latencies.items():
+        steps[name] = {
+            "requests": len(latencies),
+            "errors": stats.errors.get(name, {}),
+            "p50_ms": round(percentile(latencies, 0.50), 2),
+            "p95_ms": round(percentile(latencies, 0.95), 2),
+            "p99_ms": round(percentile(latencies, 0.99), 2)
+        }
+    kinds = {}
+    for errors in stats.errors.values():
+        for kind, count in errors.items():
+            kinds[kind] = kinds.get(kind, 0) + count
+    requests = sum(step["requests"] for step in steps.values())
+    print(json.dumps({
+        "seconds": round(elapsed, 2),
+        "requests": requests,
+        "requests_per_second": round(requests / elapsed, 1),
+        "journeys": completed,
+        "journeys_per_second": round(sum(completed.values()) / elapsed, 1),
+        "errors": kinds,
+        "steps": steps,
+        "pool": {
+            "size": pool_after["size"],
+            "max_overflow": pool_after["max_overflow"],
+            "peak_checked_out": saturation["peak_checked_out"],
+            "saturated_share": round(saturation["busy"] / max(saturation["samples"], 1), 3),
+            "waits": pool_after["waits"] - pool_before["waits"],
+            "timeouts": pool_after["timeouts"] - pool_before["timeouts"],
+            "max_wait_ms": round(pool_after["max_wait_seconds"] * 1000, 1)
+        }
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="weighted shopper journeys with many concurrent virtual users")
+    parser.add_argument("--db", choices=("sqlite", "mysql"), default="sqlite")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="serve handlers on an AsyncSession")
+    parser.add_argument("--vus", type=int, default=50, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of load")
+    parser.add_argument("--ramp", type=float, default=5, help="seconds over which the virtual users start")
+    parser.add_argument("--think", type=float, default=0, help="up to this many ms between the steps of a journey")
+    parser.add_argument("--weights", nargs="+", help=f"journey=weight, defaults {' '.join(f'{name}={weight}' for name, weight in JOURNEYS.items())}")
+    parser.add_argument("--hot", type=int, default=20, help="top rated products the checkouts buy from")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--orders", type=int, default=5000)
+    parser.add_argument("--reviews", type=int, default=10000)
+    parser.add_argument("--activities", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--worker", action="store_true")
+    args = parser.parse_args()
+
+    if args.worker:
+        return worker(args)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = environment(args, workdir)
+        prepare(args, env)
+        output = subprocess.run([sys.executable, "-m", "benchmark.bench_load", "--worker", *sys.argv[1:]], cwd=workdir, env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{args.vus} virtual users for {result['seconds']}s: {result['requests_per_second']} requests/s, {result['journeys_per_second']} journeys/s")
+    print("journeys: " + ", ".join(f"{name} {count}" for name, count in result["journeys"].items()))
+    print(f"\n{'step':<32}{'requests':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  errors")
+    for name, step in sorted(result["steps"].items()):
+        errors = ", ".join(f"{kind} {count}" for kind, count in step["errors"].items())
+        print(f"{name:<32}{step['requests']:>9}{step['p50_ms']:>9.1f}{step['p95_ms']:>9.1f}{step['p99_ms']:>9.1f}  {errors}")
+    print("\nerrors: " + (", ".join(f"{kind} {count}" for kind, count in result["errors"].items()) or "none"))
+    pool = result["pool"]
+    print(f"pool: peak {pool['peak_checked_out']} of {pool['size']}+{pool['max_overflow']} checked out, saturated {pool['saturated_share']:.0%} of samples, {pool['waits']} waits (max {pool['max_wait_ms']} ms), {pool['timeouts']} timeouts")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump({"revision": revision(), "database": args.db, "async": args.use_async, "vus": args.vus, "weights": args.weights, **result}, handle, indent=2)
+            handle.write("\n")
+
+
+if __name__ == "__main__":
+    main()
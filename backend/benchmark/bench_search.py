@@ -0,0 +1,124 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+# Product search latency against catalog size: the old four-column
+# `ilike('%x%')` scan against the in-process inverted index.
+#
+#   python -m benchmark.bench_search --sizes 1000 10000 50000 --queries 200
+#
+# Runs against a throwaway SQLite database; the FULLTEXT path needs MySQL.
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORDS = (
+    "laptop phone camera lens battery charger wireless bluetooth speaker audio video screen display "
+    "ultra slim pro max mini portable gaming office travel outdoor waterproof leather steel carbon "
+    "black white silver gold blue red green compact zoom optical digital smart fast quiet light"
+).split()
+VOCABULARY = []
+
+
+def vocabulary(rng: random.Random, size: int) -> list:
+    syllables = ["ka", "to", "ri", "mel", "zan", "pro", "vex", "lu", "ston", "ar", "qui", "bel", "dor", "sin", "tra"]
+    return WORDS + ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(size)]
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    # Zipf-like: a few words are everywhere, most are rare
+    return " ".join(VOCABULARY[min(int(rng.paretovariate(1.0)) - 1, len(VOCABULARY) - 1)] for _ in range(words))
+
+
+def populate(db, size: int, rng: random.Random):
+    from src.model import Product
+
+    db.query(Product).delete()
+    db.bulk_insert_mappings(Product, [{
+        "id": index,
+        "sku": f"P{index:07d}",
+        "name": sentence(rng, 3).title(),
+        "price": rng.randint(10, 5000),
+        "details": sentence(rng, 40),
+        "description": sentence(rng, 80),
+        "status": 1
+    } for index in range(1, size + 1)])
+    db.commit()
+
+
+def timed(fn, queries: list) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) * 1000 / len(queries)
+
+
+def run(db, size: int, total: int, rng: random.Random) -> dict:
+    from sqlalchemy import or_
+    from src.model import Product
+    from src.search import LocalSearchIndex, normalize_query, normalize_sku
+
+    populate(db, size, rng)
+    queries = [rng.choice([sentence(rng, 1), sentence(rng, 2), sentence(rng, 1)[:4], f"P{rng.randint(1, size):07d}"]) for _ in range(total)]
+
+    def scan(query):
+        db.query(Product.id).filter(Product.status == 1).filter(or_(
+            Product.name.ilike(f"%{query}%"), Product.sku.ilike(f"%{query}%"),
+            Product.description.ilike(f"%{query}%"), Product.details.ilike(f"%{query}%")
+        )).all()
+
+    start = time.perf_counter()
+    index = LocalSearchIndex()
+    for row in db.query(Product.id, Product.sku, Product.name, Product.details, Product.description):
+        index.add(row.id, row.sku, row.name, row.details, row.description)
+    build = time.perf_counter() - start
+
+    return {
+        "size": size,
+        "ilike_ms": timed(scan, queries),
+        "index_ms": timed(lambda query: index.search(normalize_query(query), normalize_sku(query), 1000), queries),
+        "build_seconds": build,
+        "terms": len(index.postings)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="product search latency against catalog size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    os.environ.update({"DB_CONNECTION": "sqlite", "DB_NAME": os.path.join(workdir, "search.db"), "DB_ASYNC": "false"})
+
+    from src.database import Base, engine, SessionLocal
+    import src.model  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    rng = random.Random(args.seed)
+    VOCABULARY.extend(vocabulary(rng, 5000))
+
+    print(f"{'products':>10}{'ilike ms':>12}{'index ms':>12}{'speedup':>10}{'build s':>10}{'terms':>8}")
+    for size in args.sizes:
+        result = run(db, size, args.queries, rng)
+        print(f"{result['size']:>10}{result['ilike_ms']:>12.2f}{result['index_ms']:>12.3f}{result['ilike_ms'] / result['index_ms']:>10.1f}{result['build_seconds']:>10.2f}{result['terms']:>8}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
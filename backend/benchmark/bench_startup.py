@@ -0,0 +1,133 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+# Worker boot time: `import main`, the lifespan startup and the first
+# request, each measured in a fresh interpreter, plus the slowest imports
+# from `python -X importtime`. Results are compared with the recorded
+# baseline in benchmark/startup_baseline.json.
+#
+#   python -m benchmark.bench_startup --runs 5
+#   python -m benchmark.bench_startup --runs 5 --save     (record a new baseline)
+#
+# Exits with status 1 when the median boot is more than --tolerance slower
+# than the baseline.
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(BACKEND, "benchmark", "startup_baseline.json")
+
+BOOT = """
+import time
+started = time.perf_counter()
+import asyncio, json
+import main
+imported = time.perf_counter()
+
+async def boot():
+    import httpx
+    lifespan = main.app.router.lifespan_context(main.app)
+    await lifespan.__aenter__()
+    ready = time.perf_counter()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://bench") as client:
+        response = await client.get("/api/ping")
+    served = time.perf_counter()
+    await lifespan.__aexit__(None, None, None)
+    return ready, served, response.status_code
+
+ready, served, status = asyncio.run(boot())
+print(json.dumps({"import_ms": (imported - started) * 1000, "startup_ms": (ready - imported) * 1000, "first_request_ms": (served - ready) * 1000, "status": status}))
+"""
+
+
+def environment(workdir: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "APP_ENV": "production",
+        "DB_CONNECTION": "sqlite",
+        "DB_NAME": os.path.join(workdir, "startup.db"),
+        "DB_ASYNC": "false",
+        "JWT_SECRET_KEY": env.get("JWT_SECRET_KEY", "startup-benchmark-secret"),
+        "ALGORITHM": env.get("ALGORITHM", "HS256")
+    })
+    return env
+
+
+def prepare(env: dict):
+    subprocess.run([sys.executable, "-m", "src.migrate", "upgrade", "head"], cwd=BACKEND, env=env, check=True, capture_output=True)
+
+
+def boot(env: dict, workdir: str) -> dict:
+    output = subprocess.run([sys.executable, "-c", BOOT], cwd=workdir, env=dict(env, PYTHONPATH=BACKEND), check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(env: dict, workdir: str, count: int) -> list:
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=workdir, env=dict(env, PYTHONPATH=BACKEND), check=True, capture_output=True, text=True).stderr
+    modules = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+        # direct imports of main and of the src modules
+        if match and (len(match.group(2)) <= 2 or (len(match.group(2)) <= 6 and not match.group(3).startswith("src."))):
+            modules.append((int(match.group(1)) / 1000, match.group(3)))
+    return [{"module": name, "ms": round(ms, 1)} for ms, name in sorted(modules, reverse=True) if name != "main"][:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="worker import and boot time against the recorded baseline")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save", action="store_true", help="record the result as the new baseline")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    env = environment(workdir)
+    prepare(env)
+    boot(env, workdir)
+
+    runs = [boot(env, workdir) for _ in range(args.runs)]
+    result = {key: round(statistics.median(run[key] for run in runs), 1) for key in ("import_ms", "startup_ms", "first_request_ms")}
+    result["boot_ms"] = round(result["import_ms"] + result["startup_ms"] + result["first_request_ms"], 1)
+    result["slowest_imports"] = slowest_imports(env, workdir, args.top)
+
+    baseline = None
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as handle:
+            baseline = json.load(handle)
+
+    print(f"{'phase':<18}{'median ms':>12}{'baseline ms':>14}")
+    for key in ("import_ms", "startup_ms", "first_request_ms", "boot_ms"):
+        recorded = f"{baseline[key]:>14.1f}" if baseline != None else f"{'-':>14}"
+        print(f"{key:<18}{result[key]:>12.1f}{recorded}")
+    print("slowest imports:")
+    for entry in result["slowest_imports"]:
+        print(f"  {entry['ms']:>8.1f} ms  {entry['module']}")
+
+    if args.save:
+        with open(BASELINE, "w") as handle:
+            json.dump(result, handle, indent=2)
+            handle.write("\n")
+        print(f"baseline written to {os.path.relpath(BASELINE, BACKEND)}")
+    elif baseline != None and result["boot_ms"] > baseline["boot_ms"] * (1 + args.tolerance):
+        print(f"boot is {result['boot_ms'] / baseline['boot_ms'] - 1:.0%} slower than the baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,84 @@
-"""
-* This file is part of the Sandy Andryanto Online Store Website.
-*
-* @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
-* @copyright  2025
-*
-* For the full copyright and license information,
-* please view the LICENSE.md file that was distributed
-* with this source code.
-"""
-
-from src.model import *
-from src.database import engine, Base
-from src import database
-from src.seed import Seed
-from src.view_auth import view_auth
-from src.view_home import view_home
-from src.view_profile import view_profile
-from src.view_order import view_order
-from src.view_shop import view_shop
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from pathlib import Path
-
-Base.metadata.create_all(bind=engine)
-
-seed = Seed()
-seed.run()
-
-Path("uploads").mkdir(parents=True, exist_ok=True)
-
-app = FastAPI()
-app.include_router(view_auth)
-app.include_router(view_home)
-app.include_router(view_profile)
-app.include_router(view_order)
-app.include_router(view_shop)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-UPLOAD_FOLDER = Path("uploads")
+"""
+* This file is part of the Sandy Andryanto Online Store Website.
+*
+* @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+* @copyright  2025
+*
+* For the full copyright and license information,
+* please view the LICENSE.md file that was distributed
+* with this source code.
+"""
+
+from src.model import *
+from src.database import engine, replica_engines, async_engine, async_replica_engines
+from src import database
+from src.migrate import check_schema
+from src.view_auth import view_auth
+from src.view_home import view_home
+from src.view_profile import view_profile
+from src.view_order import view_order
+from src.view_shop import view_shop
+from src.view_internal import view_internal
+from src.consistency import ConsistencyMiddleware, CONSISTENCY_HEADER
+from src.metrics import MetricsMiddleware
+from src import metrics
+from src.querylog import QueryLogMiddleware
+from src.tracing import TracingMiddleware, trace_export
+from src.profiler import ProfilerMiddleware, profiler
+from src.hasher import HasherSaturated, hasher
+from src.pagination import InvalidCursor
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+Path("uploads").mkdir(parents=True, exist_ok=True)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # seeding is a separate one-shot command: python -m src.seed
+    check_schema(engine)
+    metrics.start()
+    yield
+    profiler.stop(wait=True)
+    metrics.stop()
+    trace_export.close()
+    hasher.shutdown()
+    for pool in ([async_engine] if async_engine != None else []) + async_replica_engines:
+        await pool.dispose()
+    for pool in [engine] + replica_engines:
+        pool.dispose()
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(view_auth)
+app.include_router(view_home)
+app.include_router(view_profile)
+app.include_router(view_order)
+app.include_router(view_shop)
+app.include_router(view_internal)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=[CONSISTENCY_HEADER],
+)
+app.add_middleware(ProfilerMiddleware)
+app.add_middleware(ConsistencyMiddleware)
+app.add_middleware(QueryLogMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+
+@app.exception_handler(HasherSaturated)
+async def hasher_saturated_handler(request: Request, exc: HasherSaturated):
+    return JSONResponse(content="Too many sign in attempts are being processed. Please try again.", status_code=503, headers={"Retry-After": "1"})
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(content="The cursor is invalid or belongs to a different sort order.", status_code=400)
+
+UPLOAD_FOLDER = Path("uploads")
 app.mount("/uploads", StaticFiles(directory=UPLOAD_FOLDER), name="uploads")
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""${message}
+
+Revision ID: ${up_revision}
+Revises: ${down_revision | comma,n}
+Create Date: ${create_date}
+"""
+
+# This file is part of the Sandy Andryanto Online Store Website.
+#
+# @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+# @copyright  2025
+#
+# For the full copyright and license information,
+# please view the LICENSE.md file that was distributed
+# with this source code.
+
+from alembic import op
+import sqlalchemy as sa
+${imports if imports else ""}
+
+revision = ${repr(up_revision)}
+down_revision = ${repr(down_revision)}
+branch_labels = ${repr(branch_labels)}
+depends_on = ${repr(depends_on)}
+
+
+def upgrade():
+    ${upgrades if upgrades else "pass"}
+
+
+def downgrade():
+    ${downgrades if downgrades else "pass"}
@@ -0,0 +1,618 @@
+"""Initial schema: the tables and single-column indexes as the models first declared them.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:07:21.628331
+"""
+
+# This file is part of the Sandy Andryanto Online Store Website.
+#
+# @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+# @copyright  2025
+#
+# For the full copyright and license information,
+# please view the LICENSE.md file that was distributed
+# with this source code.
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('brands',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('image', sa.String(length=255), nullable=True),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('brands', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_brands_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_brands_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_brands_image'), ['image'], unique=False)
+        batch_op.create_index(batch_op.f('ix_brands_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_brands_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_brands_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('categories',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('image', sa.String(length=255), nullable=True),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('displayed', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('categories', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_categories_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_categories_displayed'), ['displayed'], unique=False)
+        batch_op.create_index(batch_op.f('ix_categories_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_categories_image'), ['image'], unique=False)
+        batch_op.create_index(batch_op.f('ix_categories_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_categories_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_categories_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('colours',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('code', sa.String(length=255), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('colours', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_colours_code'), ['code'], unique=False)
+        batch_op.create_index(batch_op.f('ix_colours_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_colours_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_colours_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_colours_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_colours_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('newsLetters',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('ip_address', sa.String(length=45), nullable=False),
+    sa.Column('email', sa.String(length=180), nullable=False),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('newsLetters', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_newsLetters_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_newsLetters_email'), ['email'], unique=False)
+        batch_op.create_index(batch_op.f('ix_newsLetters_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_newsLetters_ip_address'), ['ip_address'], unique=False)
+        batch_op.create_index(batch_op.f('ix_newsLetters_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_newsLetters_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('payments',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_payments_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_payments_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_payments_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_payments_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_payments_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('settings',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('key_name', sa.String(length=255), nullable=False),
+    sa.Column('key_value', mysql.LONGTEXT(), nullable=False),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('settings', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_settings_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_settings_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_settings_key_name'), ['key_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_settings_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_settings_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('sizes',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('sizes', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_sizes_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_sizes_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_sizes_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_sizes_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_sizes_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('users',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('email', sa.String(length=180), nullable=False),
+    sa.Column('phone', sa.String(length=64), nullable=True),
+    sa.Column('password', sa.String(length=255), nullable=False),
+    sa.Column('image', sa.String(length=255), nullable=True),
+    sa.Column('first_name', sa.String(length=191), nullable=True),
+    sa.Column('last_name', sa.String(length=191), nullable=True),
+    sa.Column('gender', sa.String(length=2), nullable=True),
+    sa.Column('city', sa.String(length=255), nullable=True),
+    sa.Column('zip_code', sa.String(length=64), nullable=True),
+    sa.Column('country', sa.String(length=255), nullable=True),
+    sa.Column('address', sa.Text(), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_city'), ['city'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_country'), ['country'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_email'), ['email'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_first_name'), ['first_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_gender'), ['gender'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_image'), ['image'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_last_name'), ['last_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_password'), ['password'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_phone'), ['phone'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_updated_at'), ['updated_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_zip_code'), ['zip_code'], unique=False)
+
+    op.create_table('activities',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('user_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('event', sa.String(length=255), nullable=False),
+    sa.Column('subject', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('activities', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_activities_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_activities_event'), ['event'], unique=False)
+        batch_op.create_index(batch_op.f('ix_activities_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_activities_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_activities_subject'), ['subject'], unique=False)
+        batch_op.create_index(batch_op.f('ix_activities_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('authentications',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('user_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('type', sa.String(length=180), nullable=False),
+    sa.Column('credential', sa.String(length=180), nullable=False),
+    sa.Column('token', sa.String(length=180), nullable=False),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('expired_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('authentications', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_authentications_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_authentications_credential'), ['credential'], unique=False)
+        batch_op.create_index(batch_op.f('ix_authentications_expired_at'), ['expired_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_authentications_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_authentications_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_authentications_token'), ['token'], unique=False)
+        batch_op.create_index(batch_op.f('ix_authentications_type'), ['type'], unique=False)
+        batch_op.create_index(batch_op.f('ix_authentications_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('orders',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('user_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('payment_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('invoice_number', sa.String(length=180), nullable=False),
+    sa.Column('total_item', mysql.INTEGER(unsigned=True), nullable=True),
+    sa.Column('subtotal', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('total_discount', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('total_taxes', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('total_shipment', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('total_paid', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['payment_id'], ['payments.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_orders_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_invoice_number'), ['invoice_number'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_subtotal'), ['subtotal'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_total_discount'), ['total_discount'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_total_item'), ['total_item'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_total_paid'), ['total_paid'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_total_shipment'), ['total_shipment'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_total_taxes'), ['total_taxes'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('products',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('brand_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('image', sa.String(length=255), nullable=True),
+    sa.Column('sku', sa.String(length=20), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('price', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('total_order', mysql.INTEGER(unsigned=True), nullable=True),
+    sa.Column('total_rating', mysql.INTEGER(unsigned=True), nullable=True),
+    sa.Column('published_date', sa.DateTime(), nullable=True),
+    sa.Column('details', mysql.LONGTEXT(), nullable=False),
+    sa.Column('description', mysql.LONGTEXT(), nullable=False),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['brand_id'], ['brands.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_products_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_image'), ['image'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_price'), ['price'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_published_date'), ['published_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_sku'), ['sku'], unique=True)
+        batch_op.create_index(batch_op.f('ix_products_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_total_order'), ['total_order'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_total_rating'), ['total_rating'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('orders_billings',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('order_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', mysql.LONGTEXT(), nullable=False),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('orders_billings', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_orders_billings_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_billings_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_billings_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_billings_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_billings_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('orders_carts',
+    sa.Column('order_id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('product_id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.PrimaryKeyConstraint('order_id', 'product_id')
+    )
+    op.create_table('products_categories',
+    sa.Column('product_id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('category_id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.PrimaryKeyConstraint('product_id', 'category_id')
+    )
+    op.create_table('products_images',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('product_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('path', sa.String(length=255), nullable=False),
+    sa.Column('sort', mysql.INTEGER(unsigned=True), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('products_images', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_products_images_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_images_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_images_path'), ['path'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_images_sort'), ['sort'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_images_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_images_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('products_inventories',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('product_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('size_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('colour_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('stock', mysql.INTEGER(unsigned=True), nullable=True),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['colour_id'], ['colours.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.ForeignKeyConstraint(['size_id'], ['sizes.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('products_inventories', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_products_inventories_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_inventories_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_inventories_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_inventories_stock'), ['stock'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_inventories_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('products_reviews',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('product_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('user_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('rating', mysql.INTEGER(unsigned=True), nullable=True),
+    sa.Column('review', mysql.LONGTEXT(), nullable=False),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('products_reviews', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_products_reviews_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_reviews_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_reviews_rating'), ['rating'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_reviews_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_reviews_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('products_wishlists',
+    sa.Column('product_id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('user_id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('product_id', 'user_id')
+    )
+    op.create_table('orders_details',
+    sa.Column('id', mysql.BIGINT(unsigned=True), nullable=False),
+    sa.Column('order_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('inventory_id', mysql.BIGINT(unsigned=True), nullable=True),
+    sa.Column('price', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('qty', mysql.INTEGER(unsigned=True), nullable=True),
+    sa.Column('total', sa.Numeric(precision=18, scale=4), nullable=False),
+    sa.Column('status', mysql.TINYINT(unsigned=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['inventory_id'], ['products_inventories.id'], ),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    mariadb_engine='InnoDB',
+    mysql_engine='InnoDB'
+    )
+    with op.batch_alter_table('orders_details', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_orders_details_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_details_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_details_price'), ['price'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_details_qty'), ['qty'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_details_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_details_total'), ['total'], unique=False)
+        batch_op.create_index(batch_op.f('ix_orders_details_updated_at'), ['updated_at'], unique=False)
+
+
+
+def downgrade():
+    with op.batch_alter_table('orders_details', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_orders_details_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_orders_details_total'))
+        batch_op.drop_index(batch_op.f('ix_orders_details_status'))
+        batch_op.drop_index(batch_op.f('ix_orders_details_qty'))
+        batch_op.drop_index(batch_op.f('ix_orders_details_price'))
+        batch_op.drop_index(batch_op.f('ix_orders_details_id'))
+        batch_op.drop_index(batch_op.f('ix_orders_details_created_at'))
+
+    op.drop_table('orders_details')
+    op.drop_table('products_wishlists')
+    with op.batch_alter_table('products_reviews', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_products_reviews_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_products_reviews_status'))
+        batch_op.drop_index(batch_op.f('ix_products_reviews_rating'))
+        batch_op.drop_index(batch_op.f('ix_products_reviews_id'))
+        batch_op.drop_index(batch_op.f('ix_products_reviews_created_at'))
+
+    op.drop_table('products_reviews')
+    with op.batch_alter_table('products_inventories', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_products_inventories_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_products_inventories_stock'))
+        batch_op.drop_index(batch_op.f('ix_products_inventories_status'))
+        batch_op.drop_index(batch_op.f('ix_products_inventories_id'))
+        batch_op.drop_index(batch_op.f('ix_products_inventories_created_at'))
+
+    op.drop_table('products_inventories')
+    with op.batch_alter_table('products_images', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_products_images_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_products_images_status'))
+        batch_op.drop_index(batch_op.f('ix_products_images_sort'))
+        batch_op.drop_index(batch_op.f('ix_products_images_path'))
+        batch_op.drop_index(batch_op.f('ix_products_images_id'))
+        batch_op.drop_index(batch_op.f('ix_products_images_created_at'))
+
+    op.drop_table('products_images')
+    op.drop_table('products_categories')
+    op.drop_table('orders_carts')
+    with op.batch_alter_table('orders_billings', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_orders_billings_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_orders_billings_status'))
+        batch_op.drop_index(batch_op.f('ix_orders_billings_name'))
+        batch_op.drop_index(batch_op.f('ix_orders_billings_id'))
+        batch_op.drop_index(batch_op.f('ix_orders_billings_created_at'))
+
+    op.drop_table('orders_billings')
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_products_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_products_total_rating'))
+        batch_op.drop_index(batch_op.f('ix_products_total_order'))
+        batch_op.drop_index(batch_op.f('ix_products_status'))
+        batch_op.drop_index(batch_op.f('ix_products_sku'))
+        batch_op.drop_index(batch_op.f('ix_products_published_date'))
+        batch_op.drop_index(batch_op.f('ix_products_price'))
+        batch_op.drop_index(batch_op.f('ix_products_name'))
+        batch_op.drop_index(batch_op.f('ix_products_image'))
+        batch_op.drop_index(batch_op.f('ix_products_id'))
+        batch_op.drop_index(batch_op.f('ix_products_created_at'))
+
+    op.drop_table('products')
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_orders_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_orders_total_taxes'))
+        batch_op.drop_index(batch_op.f('ix_orders_total_shipment'))
+        batch_op.drop_index(batch_op.f('ix_orders_total_paid'))
+        batch_op.drop_index(batch_op.f('ix_orders_total_item'))
+        batch_op.drop_index(batch_op.f('ix_orders_total_discount'))
+        batch_op.drop_index(batch_op.f('ix_orders_subtotal'))
+        batch_op.drop_index(batch_op.f('ix_orders_status'))
+        batch_op.drop_index(batch_op.f('ix_orders_invoice_number'))
+        batch_op.drop_index(batch_op.f('ix_orders_id'))
+        batch_op.drop_index(batch_op.f('ix_orders_created_at'))
+
+    op.drop_table('orders')
+    with op.batch_alter_table('authentications', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_authentications_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_authentications_type'))
+        batch_op.drop_index(batch_op.f('ix_authentications_token'))
+        batch_op.drop_index(batch_op.f('ix_authentications_status'))
+        batch_op.drop_index(batch_op.f('ix_authentications_id'))
+        batch_op.drop_index(batch_op.f('ix_authentications_expired_at'))
+        batch_op.drop_index(batch_op.f('ix_authentications_credential'))
+        batch_op.drop_index(batch_op.f('ix_authentications_created_at'))
+
+    op.drop_table('authentications')
+    with op.batch_alter_table('activities', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_activities_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_activities_subject'))
+        batch_op.drop_index(batch_op.f('ix_activities_status'))
+        batch_op.drop_index(batch_op.f('ix_activities_id'))
+        batch_op.drop_index(batch_op.f('ix_activities_event'))
+        batch_op.drop_index(batch_op.f('ix_activities_created_at'))
+
+    op.drop_table('activities')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_zip_code'))
+        batch_op.drop_index(batch_op.f('ix_users_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_users_status'))
+        batch_op.drop_index(batch_op.f('ix_users_phone'))
+        batch_op.drop_index(batch_op.f('ix_users_password'))
+        batch_op.drop_index(batch_op.f('ix_users_last_name'))
+        batch_op.drop_index(batch_op.f('ix_users_image'))
+        batch_op.drop_index(batch_op.f('ix_users_id'))
+        batch_op.drop_index(batch_op.f('ix_users_gender'))
+        batch_op.drop_index(batch_op.f('ix_users_first_name'))
+        batch_op.drop_index(batch_op.f('ix_users_email'))
+        batch_op.drop_index(batch_op.f('ix_users_created_at'))
+        batch_op.drop_index(batch_op.f('ix_users_country'))
+        batch_op.drop_index(batch_op.f('ix_users_city'))
+
+    op.drop_table('users')
+    with op.batch_alter_table('sizes', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_sizes_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_sizes_status'))
+        batch_op.drop_index(batch_op.f('ix_sizes_name'))
+        batch_op.drop_index(batch_op.f('ix_sizes_id'))
+        batch_op.drop_index(batch_op.f('ix_sizes_created_at'))
+
+    op.drop_table('sizes')
+    with op.batch_alter_table('settings', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_settings_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_settings_status'))
+        batch_op.drop_index(batch_op.f('ix_settings_key_name'))
+        batch_op.drop_index(batch_op.f('ix_settings_id'))
+        batch_op.drop_index(batch_op.f('ix_settings_created_at'))
+
+    op.drop_table('settings')
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_payments_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_payments_status'))
+        batch_op.drop_index(batch_op.f('ix_payments_name'))
+        batch_op.drop_index(batch_op.f('ix_payments_id'))
+        batch_op.drop_index(batch_op.f('ix_payments_created_at'))
+
+    op.drop_table('payments')
+    with op.batch_alter_table('newsLetters', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_newsLetters_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_newsLetters_status'))
+        batch_op.drop_index(batch_op.f('ix_newsLetters_ip_address'))
+        batch_op.drop_index(batch_op.f('ix_newsLetters_id'))
+        batch_op.drop_index(batch_op.f('ix_newsLetters_email'))
+        batch_op.drop_index(batch_op.f('ix_newsLetters_created_at'))
+
+    op.drop_table('newsLetters')
+    with op.batch_alter_table('colours', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_colours_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_colours_status'))
+        batch_op.drop_index(batch_op.f('ix_colours_name'))
+        batch_op.drop_index(batch_op.f('ix_colours_id'))
+        batch_op.drop_index(batch_op.f('ix_colours_created_at'))
+        batch_op.drop_index(batch_op.f('ix_colours_code'))
+
+    op.drop_table('colours')
+    with op.batch_alter_table('categories', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_categories_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_categories_status'))
+        batch_op.drop_index(batch_op.f('ix_categories_name'))
+        batch_op.drop_index(batch_op.f('ix_categories_image'))
+        batch_op.drop_index(batch_op.f('ix_categories_id'))
+        batch_op.drop_index(batch_op.f('ix_categories_displayed'))
+        batch_op.drop_index(batch_op.f('ix_categories_created_at'))
+
+    op.drop_table('categories')
+    with op.batch_alter_table('brands', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_brands_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_brands_status'))
+        batch_op.drop_index(batch_op.f('ix_brands_name'))
+        batch_op.drop_index(batch_op.f('ix_brands_image'))
+        batch_op.drop_index(batch_op.f('ix_brands_id'))
+        batch_op.drop_index(batch_op.f('ix_brands_created_at'))
+
+    op.drop_table('brands')
@@ -0,0 +1,30 @@
+"""FULLTEXT index for product search (MySQL only; SQLite uses the in-process index).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:20:00.000000
+"""
+
+# This file is part of the Sandy Andryanto Online Store Website.
+#
+# @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+# @copyright  2025
+#
+# For the full copyright and license information,
+# please view the LICENSE.md file that was distributed
+# with this source code.
+
+from src.migrate import create_index, drop_index
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_index('products_fulltext', 'products', ['name', 'details', 'description'], fulltext=True)
+
+
+def downgrade():
+    drop_index('products_fulltext', 'products', fulltext=True)
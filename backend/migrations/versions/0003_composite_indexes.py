@@ -0,0 +1,96 @@
+"""Composite indexes for the hot queries; drops the single-column indexes nothing reads.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:30:00.000000
+
+The new indexes are built before the old ones are dropped, so every query
+keeps an index throughout. On MySQL both run in place without blocking
+writes (see src.migrate.create_index).
+"""
+
+# This file is part of the Sandy Andryanto Online Store Website.
+#
+# @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+# @copyright  2025
+#
+# For the full copyright and license information,
+# please view the LICENSE.md file that was distributed
+# with this source code.
+
+from alembic import context, op
+from src.migrate import create_index, drop_index, is_mysql
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('products_status_rating', 'products', ['status', 'total_rating'], False),
+    ('products_status_order', 'products', ['status', 'total_order'], False),
+    ('products_status_price', 'products', ['status', 'price'], False),
+    ('products_published', 'products', ['published_date'], False),
+    ('ix_products_brand_id', 'products', ['brand_id'], False),
+    ('orders_user_status', 'orders', ['user_id', 'status'], False),
+    ('orders_user_created', 'orders', ['user_id', 'created_at'], False),
+    ('orders_details_order_inventory', 'orders_details', ['order_id', 'inventory_id'], False),
+    ('ix_orders_details_inventory_id', 'orders_details', ['inventory_id'], False),
+    ('ix_orders_billings_order_id', 'orders_billings', ['order_id'], False),
+    ('ix_activities_user_id', 'activities', ['user_id'], False),
+    ('authentications_user_type', 'authentications', ['user_id', 'type', 'status'], False),
+    ('products_images_product_sort', 'products_images', ['product_id', 'sort'], False),
+    ('products_reviews_product_rating', 'products_reviews', ['product_id', 'rating'], False),
+    ('products_inventories_variant', 'products_inventories', ['product_id', 'size_id', 'colour_id'], True)
+]
+
+# ix_<table>_<column> indexes of revision 0001 that are dropped
+LEGACY = {
+    'activities': ['created_at', 'event', 'id', 'status', 'subject', 'updated_at'],
+    'authentications': ['created_at', 'credential', 'expired_at', 'id', 'status', 'type', 'updated_at'],
+    'brands': ['id', 'updated_at'],
+    'categories': ['id', 'updated_at'],
+    'colours': ['id', 'updated_at'],
+    'newsLetters': ['id', 'updated_at'],
+    'orders': ['created_at', 'id', 'invoice_number', 'status', 'subtotal', 'total_discount', 'total_item', 'total_paid', 'total_shipment', 'total_taxes', 'updated_at'],
+    'orders_billings': ['created_at', 'id', 'name', 'status', 'updated_at'],
+    'orders_details': ['created_at', 'id', 'price', 'qty', 'status', 'total', 'updated_at'],
+    'payments': ['id', 'updated_at'],
+    'products': ['created_at', 'id', 'image', 'name', 'price', 'published_date', 'status', 'total_order', 'total_rating', 'updated_at'],
+    'products_images': ['created_at', 'id', 'path', 'sort', 'status', 'updated_at'],
+    'products_inventories': ['created_at', 'id', 'status', 'stock', 'updated_at'],
+    'products_reviews': ['created_at', 'id', 'rating', 'status', 'updated_at'],
+    'settings': ['id', 'updated_at'],
+    'sizes': ['id', 'updated_at'],
+    'users': ['city', 'country', 'created_at', 'first_name', 'gender', 'id', 'image', 'last_name', 'password', 'status', 'updated_at', 'zip_code']
+}
+
+
+def upgrade():
+    if not context.is_offline_mode():
+        duplicates = op.get_bind().execute(sa.text(
+            "SELECT COUNT(*) FROM (SELECT product_id FROM products_inventories GROUP BY product_id, size_id, colour_id HAVING COUNT(*) > 1) variants"
+        )).scalar()
+        if duplicates > 0:
+            raise RuntimeError(f"{duplicates} product variants have more than one products_inventories row; merge them before adding the unique key.")
+
+    for name, table, columns, unique in INDEXES:
+        create_index(name, table, columns, unique=unique)
+    for table, columns in LEGACY.items():
+        for column in columns:
+            drop_index(f'ix_{table}_{column}', table)
+
+
+def downgrade():
+    for table, columns in LEGACY.items():
+        for column in columns:
+            create_index(f'ix_{table}_{column}', table, [column])
+    if is_mysql():
+        # InnoDB refuses to drop the last index a foreign key can use; give each
+        # foreign key a plain index back, as InnoDB itself created before 0003.
+        foreign_keys = {(table, columns[0]) for _, table, columns, _ in INDEXES if columns[0] in ('user_id', 'brand_id', 'order_id', 'inventory_id', 'product_id')}
+        for table, column in sorted(foreign_keys):
+            create_index(f'{table}_{column}_foreign', table, [column])
+    for name, table, columns, unique in reversed(INDEXES):
+        drop_index(name, table)
@@ -1,54 +1,60 @@
-"""
- * This file is part of the Sandy Andryanto Online Store Website.
- *
- * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
- * @copyright  2025
- *
- * For the full copyright and license information,
- * please view the LICENSE.md file that was distributed
- * with this source code.
-"""
-
-import time
-import jwt
-import os
-
-from typing import Dict
-from dotenv import load_dotenv
-from .database import get_db
-from .model import User
-
-def token_response(token: str):
-    return {
-        "access_token": token
-    }  
-
-def signJWT(UserId: str) -> Dict[str, str]:
-    load_dotenv()
-    JWT_SECRET = os.getenv("JWT_SECRET_KEY")
-    ALGORITHM = os.getenv("ALGORITHM")
-    payload = {
-        "UserId": UserId,
-        "expires": time.time() + 9000000000
-    }
-    token = jwt.encode(payload, JWT_SECRET, algorithm= ALGORITHM)
-    return token_response(token)
-
-
-def decodeJWT(token: str) -> dict:
-    load_dotenv()
-    JWT_SECRET = os.getenv("JWT_SECRET_KEY")
-    ALGORITHM = os.getenv("ALGORITHM")
-    try:
-        decoded_token = jwt.decode(token, JWT_SECRET, algorithms=[ALGORITHM])
-        return decoded_token if decoded_token["expires"] >= time.time() else None
-    except:
-        return {}
-    
-def auth_user(token: str) -> dict:
-    db = next(get_db())
-    user_decode = decodeJWT(token)
-    email = user_decode["UserId"]
-    result = db.query(User).filter(User.email == email).first().__dict__
-    result.pop("password")
-    return result
\ No newline at end of file
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+import hashlib
+import time
+import jwt
+
+from typing import Dict
+from .cache import TTLCache
+from .config import settings
+
+TOKEN_VERSION = 2
+
+token_cache = TTLCache(settings.token_cache_size, settings.token_cache_ttl)
+
+def token_response(token: str):
+    return {
+        "access_token": token
+    }  
+
+def signJWT(UserId: str, user_id: int) -> Dict[str, str]:
+    payload = {
+        "UserId": UserId,
+        "sub": str(user_id),
+        "ver": TOKEN_VERSION,
+        "expires": time.time() + settings.jwt_expires_seconds
+    }
+    token = jwt.encode(payload, settings.jwt_secret, algorithm= settings.jwt_algorithm)
+    return token_response(token)
+
+
+def decodeJWT(token: str) -> dict:
+    digest = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    cached = token_cache.get(digest)
+    if cached != None:
+        return cached if cached["expires"] >= now else None
+    try:
+        decoded_token = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+    except:
+        return {}
+    if decoded_token["expires"] < now:
+        return None
+    token_cache.set(digest, decoded_token, min(settings.token_cache_ttl, decoded_token["expires"] - now))
+    return decoded_token
+
+
+def token_user_id(payload: dict) -> int | None:
+    # Tokens issued before TOKEN_VERSION 2 only carry the e-mail address
+    if payload.get("ver", 1) >= 2 and "sub" in payload:
+        return int(payload["sub"])
+    return None
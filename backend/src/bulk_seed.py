@@ -0,0 +1,317 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from decimal import Decimal
+from functools import cache
+from faker import Faker
+from sqlalchemy import func, select
+from .config import load_env
+from .database import Base, engine, DB_CONNECTION
+from .model import User, Product, ProductInventory, ProductReview, Order, Activity, Brand, Category, Size, Colour, Payment, Setting
+from .seed import PRODUCT_IMAGES, password_hash
+
+import datetime
+import multiprocessing
+import os
+import random
+import time
+import uuid
+
+load_env()
+
+SEED_BATCH_SIZE = int(os.getenv("SEED_BATCH_SIZE", "5000"))
+
+# Faker is slow per call; every chunk draws its text from pools of this size.
+TEXT_POOL = 64
+ACTIVITIES = (
+    ("Sign In", "Sign In To Application"),
+    ("Add Product To Cart", "Add Cart"),
+    ("Add Product To Wishlist", "Add Wishlist"),
+    ("Completed Checkout Current Order", "Checkout Order"),
+    ("Canceling Current Order", "Cancel Order")
+)
+
+
+@dataclass(frozen=True)
+class Scale:
+    users: int = 0
+    products: int = 0
+    orders: int = 0
+    reviews: int = 0
+    activities: int = 0
+
+
+@cache
+def faker() -> Faker:
+    return Faker()
+
+
+def text_pools(fake: Faker) -> dict:
+    return {
+        "paragraph": [fake.paragraph() for _ in range(TEXT_POOL)],
+        "first_name": [fake.first_name() for _ in range(TEXT_POOL)],
+        "last_name": [fake.last_name() for _ in range(TEXT_POOL)],
+        "city": [fake.city() for _ in range(TEXT_POOL)],
+        "country": [fake.country() for _ in range(TEXT_POOL)],
+        "address": [fake.street_address() for _ in range(TEXT_POOL)]
+    }
+
+
+def moment(rng: random.Random, now: datetime.datetime, days: int = 365) -> datetime.datetime:
+    return now - datetime.timedelta(seconds=rng.randint(0, days * 86400))
+
+
+def user_rows(ids: range, rng: random.Random, pool: dict, context: dict) -> dict:
+    users, authentications = [], []
+    for id in ids:
+        first_name, last_name = rng.choice(pool["first_name"]), rng.choice(pool["last_name"])
+        created = moment(rng, context["now"])
+        users.append({
+            "id": id,
+            "email": f"{first_name}.{last_name}.{id}@example.com".lower().replace(" ", ""),
+            "phone": f"+1-555-{id:09d}",
+            "password": context["password"],
+            "first_name": first_name,
+            "last_name": last_name,
+            "gender": rng.choice(("M", "F")),
+            "city": rng.choice(pool["city"]),
+            "zip_code": f"{rng.randint(10000, 99999)}",
+            "country": rng.choice(pool["country"]),
+            "address": rng.choice(pool["address"]),
+            "status": 1,
+            "created_at": created,
+            "updated_at": created
+        })
+        # confirmed e-mail, so that every user can sign in
+        authentications.append({
+            "user_id": id,
+            "type": "email-confirm",
+            "credential": users[-1]["email"],
+            "token": str(uuid.UUID(int=rng.getrandbits(128))),
+            "status": 1,
+            "expired_at": created,
+            "created_at": created,
+            "updated_at": created
+        })
+    return {"users": users, "authentications": authentications}
+
+
+def product_rows(ids: range, rng: random.Random, pool: dict, context: dict) -> dict:
+    rows = {"products": [], "products_categories": [], "products_images": [], "products_inventories": []}
+    for id in ids:
+        created = moment(rng, context["now"])
+        rows["products"].append({
+            "id": id,
+            "brand_id": rng.choice(context["brands"]),
+            "image": rng.choice(context["images"]),
+            "sku": f"B{id:09d}",
+            "name": f"Product {id}",
+            "price": Decimal(rng.randint(1000, 500000)) / 100,
+            "total_order": rng.randint(0, 1000),
+            "total_rating": rng.randint(0, 1000),
+            # a few products are scheduled for later and stay hidden
+            "published_date": created + datetime.timedelta(days=rng.randint(0, 30)),
+            "details": rng.choice(pool["paragraph"]),
+            "description": rng.choice(pool["paragraph"]),
+            "status": 1 if rng.random() < 0.95 else 0,
+            "created_at": created,
+            "updated_at": created
+        })
+        for category in rng.sample(context["categories"], min(3, len(context["categories"]))):
+            rows["products_categories"].append({"product_id": id, "category_id": category})
+        for sort in range(1, 4):
+            rows["products_images"].append({"product_id": id, "path": rng.choice(context["images"]), "sort": sort, "status": 1, "created_at": created, "updated_at": created})
+        for colour in context["colours"]:
+            for size in context["sizes"]:
+                rows["products_inventories"].append({"product_id": id, "colour_id": colour, "size_id": size, "stock": rng.randint(1, 100), "status": 1, "created_at": created, "updated_at": created})
+    return rows
+
+
+def order_rows(ids: range, rng: random.Random, pool: dict, context: dict) -> dict:
+    rows = {"orders": [], "orders_details": []}
+    low, high = context["inventories"]
+    for id in ids:
+        created = moment(rng, context["now"])
+        subtotal = Decimal(0)
+        lines = rng.randint(1, 4)
+        for inventory in rng.sample(range(low, high + 1), min(lines, high - low + 1)):
+            price, qty = Decimal(rng.randint(1000, 500000)) / 100, rng.randint(1, 3)
+            subtotal += price * qty
+            rows["orders_details"].append({"order_id": id, "inventory_id": inventory, "price": price, "qty": qty, "total": price * qty, "status": 1, "created_at": created, "updated_at": created})
+        taxes, shipment = subtotal * context["taxes"] / 100, context["shipment"]
+        rows["orders"].append({
+            "id": id,
+            "user_id": rng.randint(*context["users"]),
+            "payment_id": rng.choice(context["payments"]),
+            "invoice_number": f"INV{id:010d}",
+            "total_item": lines,
+            "subtotal": subtotal,
+            "total_discount": Decimal(0),
+            "total_taxes": taxes,
+            "total_shipment": shipment,
+            "total_paid": subtotal + taxes + shipment,
+            # 1: checked out; an open cart (0) per user is left to the application
+            "status": 1,
+            "created_at": created,
+            "updated_at": created
+        })
+    return rows
+
+
+def review_rows(ids: range, rng: random.Random, pool: dict, context: dict) -> dict:
+    reviews = []
+    for id in ids:
+        created = moment(rng, context["now"])
+        reviews.append({
+            "id": id,
+            "product_id": rng.randint(*context["products"]),
+            "user_id": rng.randint(*context["users"]),
+            "rating": rng.randint(0, 100),
+            "review": rng.choice(pool["paragraph"]),
+            "status": 1,
+            "created_at": created,
+            "updated_at": created
+        })
+    return {"products_reviews": reviews}
+
+
+def activity_rows(ids: range, rng: random.Random, pool: dict, context: dict) -> dict:
+    activities = []
+    for id in ids:
+        created = moment(rng, context["now"])
+        event, subject = rng.choice(ACTIVITIES)
+        activities.append({
+            "id": id,
+            "user_id": rng.randint(*context["users"]),
+            "event": event,
+            "subject": subject,
+            "description": rng.choice(pool["paragraph"]),
+            "status": 1,
+            "created_at": created,
+            "updated_at": created
+        })
+    return {"activities": activities}
+
+
+# field of Scale -> (table whose ids are generated, row builder, id ranges it references)
+GENERATORS = {
+    "users": (User.__table__, user_rows, ()),
+    "products": (Product.__table__, product_rows, ()),
+    "orders": (Order.__table__, order_rows, ("users", "inventories")),
+    "reviews": (ProductReview.__table__, review_rows, ("users", "products")),
+    "activities": (Activity.__table__, activity_rows, ("users",))
+}
+
+
+def seed_chunk(name: str, first: int, last: int, context: dict) -> int:
+    """
+    Inserts ids first..last-1 of `name` (and their child rows) in one
+    transaction. The data depends only on the seed and the ids, so a run
+    gives the same rows whatever the number of processes.
+    """
+    rng = random.Random(f"{context['seed']}:{name}:{first}")
+    fake = faker()
+    fake.seed_instance(rng.getrandbits(64))
+    rows = GENERATORS[name][1](range(first, last), rng, text_pools(fake), context)
+    with engine.begin() as connection:
+        for table, values in rows.items():
+            if len(values) > 0:
+                connection.execute(Base.metadata.tables[table].insert(), values)
+    return last - first
+
+
+def id_range(connection, table) -> tuple:
+    low, high = connection.execute(select(func.min(table.c.id), func.max(table.c.id))).one()
+    return (low or 0, high or 0)
+
+
+class BulkSeed:
+    """
+    Load-test datasets: tops each table of `scale` up to the requested number
+    of rows with Core executemany inserts of `batch` rows per transaction.
+    New rows take the ids after the current maximum, so references are drawn
+    from id ranges and the tables are expected to have dense ids (as seeded
+    ones do). Every chunk is independent; with `processes` > 1 the chunks of
+    a table are spread over a process pool, the tables still run in
+    dependency order.
+    """
+
+    def __init__(self, scale: Scale, batch: int = SEED_BATCH_SIZE, seed: int = 1, processes: int = 1):
+        self.scale = scale
+        self.batch = batch
+        self.seed = seed
+        # SQLite has a single writer, parallel chunks would only wait on each other
+        self.processes = processes if DB_CONNECTION == "mysql" else 1
+
+    def ranges(self, context: dict):
+        with engine.connect() as connection:
+            context["users"] = id_range(connection, User.__table__)
+            context["products"] = id_range(connection, Product.__table__)
+            context["inventories"] = id_range(connection, ProductInventory.__table__)
+
+    def context(self) -> dict:
+        with engine.connect() as connection:
+            ids = lambda model: list(connection.execute(select(model.id).order_by(model.id)).scalars())
+            settings = dict(connection.execute(select(Setting.key_name, Setting.key_value)).all())
+            return {
+                "seed": self.seed,
+                # whole days, so that a rerun on the same day gives the same rows
+                "now": datetime.datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0),
+                "password": password_hash(),
+                "images": PRODUCT_IMAGES,
+                "brands": ids(Brand),
+                "categories": ids(Category),
+                "sizes": ids(Size),
+                "colours": ids(Colour),
+                "payments": ids(Payment),
+                "taxes": Decimal(settings.get("taxes_value", "10")),
+                "shipment": Decimal(settings.get("total_shipment", "50"))
+            }
+
+    def run(self, report=print):
+        context = self.context()
+        self.ranges(context)
+        executor = None
+        if self.processes > 1:
+            executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            for field in fields(self.scale):
+                name = field.name
+                table, _, references = GENERATORS[name]
+                empty = [reference for reference in references if context[reference][1] == 0]
+                if len(empty) > 0:
+                    report(f"{name}: skipped, no {' or '.join(empty)} to reference")
+                    continue
+                with engine.connect() as connection:
+                    total = connection.execute(select(func.count()).select_from(table)).scalar()
+                    start = id_range(connection, table)[1] + 1
+                missing = getattr(self.scale, name) - total
+                if missing <= 0:
+                    report(f"{name}: {total} rows, nothing to add")
+                    continue
+
+                started = time.perf_counter()
+                chunks = [(name, first, min(first + self.batch, start + missing), context) for first in range(start, start + missing, self.batch)]
+                if executor != None:
+                    list(executor.map(seed_chunk, *zip(*chunks)))
+                else:
+                    for chunk in chunks:
+                        seed_chunk(*chunk)
+                elapsed = time.perf_counter() - started
+                report(f"{name}: {missing} rows added in {elapsed:.1f}s ({missing / elapsed:.0f} rows/s)")
+
+                # later tables reference the rows just added
+                self.ranges(context)
+        finally:
+            if executor != None:
+                executor.shutdown()
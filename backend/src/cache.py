@@ -0,0 +1,132 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from collections import OrderedDict
+from .config import load_env
+
+import os
+import threading
+import time
+
+load_env()
+
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+
+
+class TTLCache:
+    """
+    Bounded, thread-safe LRU cache whose entries also expire after `ttl` seconds.
+    Entries live in the worker process only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry == None:
+                self.misses += 1
+                return default
+            value, expires = entry
+            if expires < now:
+                del self.entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl: float | None = None):
+        expires = time.monotonic() + (self.ttl if ttl == None else ttl)
+        with self.lock:
+            self.entries[key] = (value, expires)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry == None:
+                return None
+            self.invalidations += 1
+            return entry[0]
+
+    def clear(self):
+        with self.lock:
+            self.invalidations += len(self.entries)
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups > 0 else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+
+
+class UserCache:
+    """
+    User projections (no password) keyed by id, with an email -> id index.
+    Every hit is one `users` query the request did not have to run.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.by_id = TTLCache(maxsize, ttl)
+        self.by_email = TTLCache(maxsize, ttl)
+
+    def get_by_id(self, user_id: int) -> dict | None:
+        user = self.by_id.get(user_id)
+        return dict(user) if user != None else None
+
+    def get_by_email(self, email: str) -> dict | None:
+        user_id = self.by_email.get(email)
+        return self.get_by_id(user_id) if user_id != None else None
+
+    def put(self, user: dict):
+        self.by_id.set(user["id"], dict(user))
+        self.by_email.set(user["email"], user["id"])
+
+    def invalidate(self, user_id: int | None = None, email: str | None = None):
+        if user_id != None:
+            cached = self.by_id.delete(user_id)
+            if cached != None:
+                self.by_email.delete(cached["email"])
+        if email != None:
+            self.by_email.delete(email)
+
+    def stats(self) -> dict:
+        by_id = self.by_id.stats()
+        return {"queries_saved": by_id["hits"], "by_id": by_id, "by_email": self.by_email.stats()}
+
+
+user_cache = UserCache(USER_CACHE_SIZE, USER_CACHE_TTL)
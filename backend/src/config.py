@@ -0,0 +1,47 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from dataclasses import dataclass
+from functools import cache
+from dotenv import load_dotenv
+
+import os
+
+
+@cache
+def load_env():
+    # Every module reads its settings at import; parse .env once per process.
+    load_dotenv()
+
+
+@dataclass(frozen=True)
+class Settings:
+    app_env: str
+    jwt_secret: str
+    jwt_algorithm: str
+    jwt_expires_seconds: float
+    token_cache_size: int
+    token_cache_ttl: float
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        load_env()
+        return cls(
+            app_env=os.getenv("APP_ENV", "production"),
+            jwt_secret=os.getenv("JWT_SECRET_KEY"),
+            jwt_algorithm=os.getenv("ALGORITHM"),
+            jwt_expires_seconds=float(os.getenv("JWT_EXPIRES_SECONDS", "9000000000")),
+            token_cache_size=int(os.getenv("TOKEN_CACHE_SIZE", "10000")),
+            token_cache_ttl=float(os.getenv("TOKEN_CACHE_TTL", "300"))
+        )
+
+
+settings = Settings.from_env()
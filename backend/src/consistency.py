@@ -0,0 +1,95 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from .config import load_env, settings
+
+import hashlib
+import hmac
+import os
+import time
+
+load_env()
+
+CONSISTENCY_HEADER = "X-Consistency-Token"
+CONSISTENCY_COOKIE = "consistency_token"
+CONSISTENCY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))
+CONSISTENCY_SECRET = (settings.jwt_secret or "").encode()
+
+
+class ConsistencyState:
+
+    def __init__(self, primary: bool = False):
+        self.primary = primary
+        self.wrote = False
+
+
+request_consistency: ContextVar[ConsistencyState | None] = ContextVar("request_consistency", default=None)
+
+
+def consistency_state() -> ConsistencyState | None:
+    return request_consistency.get()
+
+
+def sign_token(expires: float) -> str:
+    value = str(int(expires))
+    signature = hmac.new(CONSISTENCY_SECRET, value.encode(), hashlib.sha256).hexdigest()[:32]
+    return f"{value}.{signature}"
+
+
+def verify_token(token: str | None) -> bool:
+    if not token or "." not in token:
+        return False
+    value, _ = token.split(".", 1)
+    if not value.isdigit() or int(value) < time.time():
+        return False
+    return hmac.compare_digest(sign_token(int(value)), token)
+
+
+class ConsistencyMiddleware:
+    """
+    Read-your-writes for replica routing. A request whose session wrote to the
+    primary answers with a short-lived signed token (header and cookie); requests
+    that present a valid token keep their reads on the primary until it expires.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope.get("headers") or [])
+        token = headers.get(CONSISTENCY_HEADER.lower().encode(), b"").decode()
+        if not token:
+            cookie = SimpleCookie(headers.get(b"cookie", b"").decode())
+            token = cookie[CONSISTENCY_COOKIE].value if CONSISTENCY_COOKIE in cookie else None
+
+        state = ConsistencyState(primary=verify_token(token))
+        reset = request_consistency.set(state)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and state.wrote:
+                issued = sign_token(time.time() + CONSISTENCY_SECONDS)
+                cookie = f"{CONSISTENCY_COOKIE}={issued}; Max-Age={int(CONSISTENCY_SECONDS)}; Path=/; SameSite=Lax"
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (CONSISTENCY_HEADER.encode(), issued.encode()),
+                    (b"set-cookie", cookie.encode())
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_consistency.reset(reset)
@@ -1,49 +1,228 @@
-"""
- * This file is part of the Sandy Andryanto Online Store Website.
- *
- * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
- * @copyright  2025
- *
- * For the full copyright and license information,
- * please view the LICENSE.md file that was distributed
- * with this source code.
-"""
-
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT")
-DB_NAME = os.getenv("DB_NAME")
-DB_USERNAME = os.getenv("DB_USERNAME")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-URL_DATABASE = (
-    "mysql+pymysql://"
-    + DB_USERNAME
-    + ":"
-    + DB_PASSWORD
-    + "@"
-    + DB_HOST
-    + ":"
-    + DB_PORT
-    + "/"
-    + DB_NAME
-)
-
-engine = create_engine(URL_DATABASE)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-Base = declarative_base()
-
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from sqlalchemy import create_engine, event, Select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker, Session
+from .pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from .consistency import consistency_state
+from .metrics import METRICS_ENABLED
+from .querylog import SQL_QUERY_LOG
+from .tracing import TRACE_SAMPLE_RATE, span
+from . import metrics, querylog, tracing
+import os
+import random
+import time
+from itertools import chain
+from .config import load_env
+
+load_env()
+
+DB_CONNECTION = os.getenv("DB_CONNECTION", "mysql")
+DB_HOST = os.getenv("DB_HOST")
+DB_PORT = os.getenv("DB_PORT")
+DB_NAME = os.getenv("DB_NAME")
+DB_USERNAME = os.getenv("DB_USERNAME")
+DB_PASSWORD = os.getenv("DB_PASSWORD")
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+DB_DRIVER = os.getenv("DB_DRIVER", "pymysql")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_REPLICAS = [replica.strip() for replica in os.getenv("DB_REPLICAS", "").split(",") if replica.strip()]
+
+
+def database_url(is_async: bool = False, replica: str | None = None) -> str:
+    if DB_CONNECTION == "sqlite":
+        driver = "sqlite+aiosqlite" if is_async else "sqlite"
+        return f"{driver}:///{replica or DB_NAME}"
+    host, port = DB_HOST, DB_PORT
+    if replica != None:
+        host, _, replica_port = replica.partition(":")
+        port = replica_port or DB_PORT
+    driver = "mysql+aiomysql" if is_async else f"mysql+{DB_DRIVER}"
+    return f"{driver}://{DB_USERNAME}:{DB_PASSWORD}@{host}:{port}/{DB_NAME}"
+
+
+def engine_options(is_async: bool = False) -> dict:
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING
+    }
+    if DB_CONNECTION == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+class RoutingSession(Session):
+    """
+    Sends SELECTs of read-only sessions (info["read_only"]) to a replica and
+    everything else to the primary. Writes mark the request so that the
+    consistency token keeps the caller's next reads on the primary.
+    """
+
+    def __init__(self, primary=None, replicas=None, **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replicas = replicas or []
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        state = consistency_state()
+        if isinstance(clause, Select) and not self._flushing:
+            if self.replicas and self.info.get("read_only") and not (state != None and state.primary):
+                return random.choice(self.replicas)
+        elif state != None:
+            state.wrote = True
+        return self.primary
+
+
+URL_DATABASE = database_url()
+
+engine = create_engine(URL_DATABASE, **engine_options())
+replica_engines = [create_engine(database_url(replica=replica), **engine_options()) for replica in DB_REPLICAS]
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, primary=engine, replicas=replica_engines)
+
+async_engine = create_async_engine(database_url(True), **engine_options(True)) if DB_ASYNC else None
+async_replica_engines = [create_async_engine(database_url(True, replica), **engine_options(True)) for replica in DB_REPLICAS] if DB_ASYNC else []
+AsyncSessionLocal = async_sessionmaker(
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    primary=async_engine.sync_engine,
+    replicas=[replica.sync_engine for replica in async_replica_engines]
+) if DB_ASYNC else None
+
+Base = declarative_base()
+
+
+def get_db():
+    with span("get_db"):
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        with span("get_db.close"):
+            db.close()
+
+
+def get_read_db():
+    with span("get_db", read_only=True):
+        db = SessionLocal(info={"read_only": True})
+    try:
+        yield db
+    finally:
+        with span("get_db.close"):
+            db.close()
+
+
+async def get_async_db():
+    with span("get_db"):
+        db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        with span("get_db.close"):
+            await db.close()
+
+
+async def get_async_read_db():
+    with span("get_db", read_only=True):
+        db = AsyncSessionLocal(info={"read_only": True})
+    try:
+        yield db
+    finally:
+        with span("get_db.close"):
+            await db.close()
+
+
+def pool_status() -> dict:
+    status = {"sync": engine.pool.status_payload()}
+    if len(replica_engines) > 0:
+        status["replicas"] = [replica.pool.status_payload() for replica in replica_engines]
+    if async_engine != None:
+        status["async"] = async_engine.pool.status_payload()
+    if len(async_replica_engines) > 0:
+        status["async_replicas"] = [replica.pool.status_payload() for replica in async_replica_engines]
+    return status
+
+
+def sync_engines() -> list:
+    # every engine, as the sync Engine that cursor events are registered on
+    return [engine] + replica_engines + [pool.sync_engine for pool in [async_engine] + async_replica_engines if pool != None]
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("statement_started", []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["statement_started"].pop()
+    seconds = time.perf_counter() - started
+    querylog.record_statement(statement, parameters, executemany, seconds)
+    metrics.record_statement(seconds)
+    tracing.record_statement(statement, started, seconds)
+
+
+# one timing of every statement of every engine, for the request's QueryLog
+# (src/querylog.py), its metrics (src/metrics.py) and its trace (src/tracing.py)
+if SQL_QUERY_LOG or METRICS_ENABLED or TRACE_SAMPLE_RATE > 0:
+    for target in sync_engines():
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+        event.listen(target, "after_cursor_execute", after_cursor_execute)
+
+if TRACE_SAMPLE_RATE > 0:
+    event.listen(Session, "before_flush", tracing.before_flush)
+    event.listen(Session, "after_flush_postexec", tracing.after_flush)
+
+
+def on_commit(models: tuple, callback, keys: bool = False):
+    """
+    Calls `callback()` after every commit that inserted, changed or deleted
+    rows of `models`, whether through the unit of work or a bulk
+    Query.update()/delete(). Rolled back changes are ignored. With keys=True
+    the callback receives the set of changed (model class, id) pairs, or None
+    when a bulk statement made the affected rows unknown.
+    """
+    key = f"changed_{id(callback)}"
+
+    @event.listens_for(Session, "after_flush")
+    def flushed(session, flush_context):
+        changed = [model for model in chain(session.new, session.dirty, session.deleted) if isinstance(model, models)]
+        if len(changed) > 0:
+            pending = session.info.setdefault(key, set())
+            if pending != None:
+                pending.update((type(model), model.id) for model in changed)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def executed(orm_execute_state):
+        if orm_execute_state.is_update or orm_execute_state.is_delete:
+            mapper = orm_execute_state.bind_mapper
+            if mapper != None and issubclass(mapper.class_, models):
+                orm_execute_state.session.info[key] = None
+
+    @event.listens_for(Session, "after_commit")
+    def committed(session):
+        if key in session.info:
+            changed = session.info.pop(key)
+            if keys:
+                callback(changed)
+            else:
+                callback()
+
+    @event.listens_for(Session, "after_rollback")
+    def rolled_back(session):
+        session.info.pop(key, None)
@@ -0,0 +1,194 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from collections import Counter
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from .config import load_env
+from .database import on_commit
+from .model import Product, Category, Brand, products_categories
+
+import os
+import threading
+import time
+
+load_env()
+
+FACETS_TTL = float(os.getenv("FACETS_TTL", "300"))
+FACETS_PENDING_SECONDS = 10
+
+
+class FacetStore:
+    """
+    Category counts, brand counts and the price range of the shop sidebar.
+    Every product contributes one entry (brand, categories, price, visible);
+    a commit that touches products only reloads those products and applies
+    the difference, so the sidebar never scans `products_categories`.
+    Category or brand changes, bulk statements and FACETS_TTL (for changes
+    made by other workers) rebuild the store. Prices only count products
+    that are active and published; products published in the future are
+    re-checked every FACETS_PENDING_SECONDS.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.products = None
+        self.dirty = set()
+        self.pending = set()
+        self.pending_checked = 0.0
+        self.built_at = 0.0
+        self.categories = {}
+        self.brands = {}
+        self.category_counts = Counter()
+        self.brand_counts = Counter()
+        self.prices = Counter()
+        self.facets = None
+        self.rebuilds = 0
+        self.updates = 0
+        self.hits = 0
+
+    def load_products(self, db: Session, ids: set | None) -> dict:
+        published = (Product.published_date <= func.now()).label("published")
+        rows = db.query(Product.id, Product.brand_id, Product.price, Product.status, published)
+        links = db.query(products_categories.c.product_id, products_categories.c.category_id)
+        if ids != None:
+            rows = rows.filter(Product.id.in_(ids))
+            links = links.filter(products_categories.c.product_id.in_(ids))
+
+        category_ids = {}
+        for product_id, category_id in links.all():
+            category_ids.setdefault(product_id, []).append(category_id)
+
+        products = {}
+        for row in rows.all():
+            products[row.id] = (
+                row.brand_id,
+                tuple(category_ids.get(row.id, ())),
+                row.price if row.status == 1 and row.published else None,
+                row.status == 1 and row.published == False
+            )
+        return products
+
+    def apply(self, product_id: int, entry: tuple | None):
+        previous = self.products.pop(product_id, None)
+        if previous != None:
+            self.count(previous, -1)
+        self.pending.discard(product_id)
+        if entry != None:
+            self.products[product_id] = entry
+            self.count(entry, 1)
+            if entry[3]:
+                self.pending.add(product_id)
+
+    def count(self, entry: tuple, delta: int):
+        brand_id, category_ids, price, _ = entry
+        counters = [(self.brand_counts, brand_id)] + [(self.category_counts, category_id) for category_id in category_ids]
+        if price != None:
+            counters.append((self.prices, price))
+        for counter, key in counters:
+            if key == None:
+                continue
+            counter[key] += delta
+            if counter[key] <= 0:
+                del counter[key]
+
+    def rebuild(self, db: Session):
+        generation = self.generation
+        categories = {row.id: row.name for row in db.query(Category.id, Category.name).all()}
+        brands = {row.id: row.name for row in db.query(Brand.id, Brand.name).all()}
+        products = self.load_products(db, None)
+        with self.lock:
+            if generation != self.generation:
+                return
+            self.products = {}
+            self.pending = set()
+            self.category_counts = Counter()
+            self.brand_counts = Counter()
+            self.prices = Counter()
+            for product_id, entry in products.items():
+                self.apply(product_id, entry)
+            self.categories = categories
+            self.brands = brands
+            self.built_at = time.time()
+            self.pending_checked = self.built_at
+            self.facets = None
+            self.rebuilds += 1
+
+    def update(self, db: Session, ids: set):
+        generation = self.generation
+        try:
+            products = self.load_products(db, ids)
+        except Exception:
+            with self.lock:
+                self.dirty.update(ids)
+            raise
+        with self.lock:
+            if generation != self.generation or self.products == None:
+                return
+            for product_id in ids:
+                self.apply(product_id, products.get(product_id))
+            self.facets = None
+            self.updates += 1
+
+    def get(self, db: Session) -> dict:
+        now = time.time()
+        with self.lock:
+            rebuild = self.products == None or self.built_at + self.ttl < now
+            ids = set(self.dirty)
+            self.dirty.clear()
+            if len(self.pending) > 0 and self.pending_checked + FACETS_PENDING_SECONDS < now:
+                ids.update(self.pending)
+                self.pending_checked = now
+
+        if rebuild:
+            self.rebuild(db)
+        elif len(ids) > 0:
+            self.update(db, ids)
+
+        with self.lock:
+            if self.facets == None:
+                self.facets = {
+                    "categories": [{"id": key, "name": self.categories[key], "total": total} for key, total in sorted(self.category_counts.items()) if key in self.categories],
+                    "brands": [{"id": key, "name": self.brands[key], "total": total} for key, total in sorted(self.brand_counts.items()) if key in self.brands],
+                    "maxPrice": max(self.prices) if len(self.prices) > 0 else None,
+                    "minPrice": min(self.prices) if len(self.prices) > 0 else None
+                }
+            else:
+                self.hits += 1
+            return self.facets
+
+    def changed(self, changed: set | None):
+        with self.lock:
+            if changed == None or any(model != Product for model, _ in changed):
+                self.generation += 1
+                self.products = None
+            else:
+                self.dirty.update(product_id for _, product_id in changed)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "ttl": self.ttl,
+                "products": len(self.products) if self.products != None else None,
+                "categories": len(self.category_counts),
+                "brands": len(self.brand_counts),
+                "pending": len(self.pending),
+                "rebuilds": self.rebuilds,
+                "updates": self.updates,
+                "hits": self.hits,
+                "age_seconds": time.time() - self.built_at if self.products != None else None
+            }
+
+
+facet_store = FacetStore(FACETS_TTL)
+on_commit((Product, Category, Brand), facet_store.changed, keys=True)
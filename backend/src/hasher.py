@@ -0,0 +1,124 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from .config import load_env
+
+import asyncio
+import multiprocessing
+import os
+import threading
+
+load_env()
+
+HASHER_WORKERS = int(os.getenv("HASHER_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+HASHER_MAX_PENDING = int(os.getenv("HASHER_MAX_PENDING", str(HASHER_WORKERS * 8)))
+
+_context = None
+
+
+def _crypt_context():
+    global _context
+    if _context == None:
+        from passlib.context import CryptContext
+        _context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _context
+
+
+def _hash(password: str) -> str:
+    return _crypt_context().hash(password)
+
+
+def _verify(password: str, hashed: str) -> bool:
+    return _crypt_context().verify(password, hashed)
+
+
+class HasherSaturated(Exception):
+    pass
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a bounded process pool so that a login burst cannot take
+    over the request threadpool. At most `max_pending` operations may be queued
+    or running; further calls fail fast with HasherSaturated. With workers=0
+    bcrypt runs inline in the calling thread.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self.completed = 0
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def pool(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor == None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            return self.executor
+
+    def run(self, fn, *args):
+        # imported here, the bcrypt processes import this module as well
+        from .tracing import span
+
+        with span("bcrypt." + fn.__name__.lstrip("_"), workers=self.workers):
+            if self.workers <= 0:
+                return fn(*args)
+
+            with self.lock:
+                if self.pending >= self.max_pending:
+                    self.rejected += 1
+                    raise HasherSaturated()
+                self.pending += 1
+
+            try:
+                future = self.pool().submit(fn, *args)
+                return self.wait(future)
+            finally:
+                with self.lock:
+                    self.pending -= 1
+                    self.completed += 1
+
+    def wait(self, future):
+        # Handlers served on an AsyncSession run inside SQLAlchemy's greenlet,
+        # where blocking on the future would stall the event loop.
+        from sqlalchemy.util.concurrency import await_only, in_greenlet
+        if in_greenlet():
+            return await_only(asyncio.wrap_future(future))
+        return future.result()
+
+    def hash(self, password: str) -> str:
+        return self.run(_hash, password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self.run(_verify, password, hashed)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+    def shutdown(self):
+        with self.lock:
+            if self.executor != None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+
+hasher = PasswordHasher(HASHER_WORKERS, HASHER_MAX_PENDING)
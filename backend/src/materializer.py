@@ -0,0 +1,154 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from concurrent.futures import Future
+from fastapi import Request
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+from .database import SessionLocal
+from .tracing import jsonable_encoder
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+
+
+def wait(future: Future):
+    # Handlers served on an AsyncSession run inside SQLAlchemy's greenlet, on
+    # the event loop, where blocking on the future would stall it (see hasher).
+    if in_greenlet():
+        return await_only(asyncio.wrap_future(future))
+    return future.result()
+
+
+class Document:
+
+    def __init__(self, body: bytes, built_at: float, build_seconds: float):
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.built_at = built_at
+        self.build_seconds = build_seconds
+
+
+class MaterializedDocument:
+    """
+    A JSON payload that is identical for every visitor, built by `build(db)`
+    and kept as serialized bytes. Serving it costs one memory read; the
+    document is rebuilt in a background thread once it is older than
+    `interval` seconds or after `invalidate()` (a catalog change), while the
+    previous version keeps being served. Only the very first request of a
+    worker builds inline; requests arriving meanwhile wait for that build
+    instead of running their own.
+    """
+
+    def __init__(self, name: str, build, interval: float):
+        self.name = name
+        self.build = build
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.document = None
+        self.stale = False
+        self.refreshing = False
+        self.building = None
+        self.refreshes = 0
+        self.failures = 0
+        self.served = 0
+        self.not_modified = 0
+
+    def render(self, db: Session) -> Document:
+        started = time.perf_counter()
+        body = json.dumps(jsonable_encoder(self.build(db)), separators=(",", ":")).encode()
+        return Document(body, time.time(), time.perf_counter() - started)
+
+    def refresh(self, db: Session) -> Document:
+        with self.lock:
+            self.stale = False
+        document = self.render(db)
+        with self.lock:
+            self.document = document
+            self.refreshes += 1
+        return document
+
+    def refresh_in_background(self):
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+        threading.Thread(target=self.background_refresh, name=f"materialize-{self.name}", daemon=True).start()
+
+    def background_refresh(self):
+        db = SessionLocal(info={"read_only": True})
+        try:
+            self.refresh(db)
+        except Exception:
+            with self.lock:
+                self.failures += 1
+        finally:
+            db.close()
+            with self.lock:
+                self.refreshing = False
+
+    def first_build(self, db: Session) -> Document:
+        with self.lock:
+            building, waiting = self.building, self.building != None
+            if not waiting:
+                building = self.building = Future()
+        if waiting:
+            return wait(building)
+        try:
+            document = self.refresh(db)
+            building.set_result(document)
+            return document
+        except BaseException as error:
+            # the waiting requests fail with it, the next one builds again
+            building.set_exception(error)
+            raise
+        finally:
+            with self.lock:
+                self.building = None
+
+    def invalidate(self):
+        with self.lock:
+            self.stale = True
+
+    def get(self, db: Session) -> Document:
+        document = self.document
+        if document == None:
+            return self.first_build(db)
+        if self.stale or document.built_at + self.interval < time.time():
+            self.refresh_in_background()
+        return document
+
+    def response(self, request: Request, db: Session) -> Response:
+        document = self.get(db)
+        headers = {"ETag": document.etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == document.etag:
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        self.served += 1
+        return Response(content=document.body, media_type="application/json", headers=headers)
+
+    def stats(self) -> dict:
+        document = self.document
+        return {
+            "interval": self.interval,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "served": self.served,
+            "not_modified": self.not_modified,
+            "stale": self.stale,
+            "bytes": len(document.body) if document != None else None,
+            "age_seconds": time.time() - document.built_at if document != None else None,
+            "refresh_seconds": document.build_seconds if document != None else None
+        }
@@ -0,0 +1,281 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from bisect import bisect_left
+from contextvars import ContextVar
+from .config import load_env
+
+import glob
+import json
+import os
+import threading
+import time
+
+load_env()
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+METRICS_DIR = os.getenv("METRICS_DIR")
+METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+
+
+class Registry:
+    """
+    Counters, gauges and fixed-bucket histograms of one worker, keyed by
+    metric name and label values. render() takes the snapshot() of every
+    worker, so that several workers are exposed as one.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.families = {}
+
+    def declare(self, name: str, kind: str, help: str, labels: tuple = (), buckets: tuple = ()):
+        self.families[name] = {"kind": kind, "help": help, "labels": labels, "buckets": buckets, "series": {}}
+
+    def inc(self, name: str, labels: tuple = (), value: float = 1.0):
+        with self.lock:
+            series = self.families[name]["series"]
+            series[labels] = series.get(labels, 0.0) + value
+
+    def observe(self, name: str, labels: tuple, value: float):
+        family = self.families[name]
+        position = bisect_left(family["buckets"], value)
+        with self.lock:
+            series = family["series"].get(labels)
+            if series == None:
+                series = family["series"][labels] = [[0] * (len(family["buckets"]) + 1), 0.0]
+            series[0][position] += 1
+            series[1] += value
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                name: {"kind": family["kind"], "series": [[list(labels), [list(value[0]), value[1]] if family["kind"] == "histogram" else value] for labels, value in family["series"].items()]}
+                for name, family in self.families.items()
+            }
+
+    def render(self, snapshots: list) -> str:
+        lines = []
+        for name, family in self.families.items():
+            merged = {}
+            for snapshot in snapshots:
+                for labels, value in snapshot.get(name, {}).get("series", []):
+                    labels = tuple(labels)
+                    if family["kind"] == "histogram":
+                        current = merged.setdefault(labels, [[0] * (len(family["buckets"]) + 1), 0.0])
+                        current[0] = [total + count for total, count in zip(current[0], value[0])]
+                        current[1] += value[1]
+                    else:
+                        merged[labels] = merged.get(labels, 0.0) + value
+            lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['kind']}")
+            for labels, value in sorted(merged.items()):
+                pairs = list(zip(family["labels"], labels))
+                if family["kind"] != "histogram":
+                    lines.append(f"{name}{label_text(pairs)} {number(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(family["buckets"] + ("+Inf",), value[0]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{label_text(pairs + [('le', bound if bound == '+Inf' else number(bound))])} {cumulative}")
+                lines.append(f"{name}_sum{label_text(pairs)} {number(value[1])}")
+                lines.append(f"{name}_count{label_text(pairs)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def label_text(pairs: list) -> str:
+    if len(pairs) == 0:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+registry = Registry()
+registry.declare("http_requests_total", "counter", "Requests served.", ("method", "route", "status"))
+registry.declare("http_requests_in_flight", "gauge", "Requests being served.")
+registry.declare("http_request_duration_seconds", "histogram", "Time to the end of the response body.", ("method", "route"), LATENCY_BUCKETS)
+registry.declare("http_response_size_bytes", "histogram", "Response body size.", ("method", "route"), SIZE_BUCKETS)
+registry.declare("http_request_db_queries", "histogram", "SQL statements executed per request.", ("method", "route"), QUERY_BUCKETS)
+registry.declare("http_request_db_seconds", "histogram", "Time spent in SQL statements per request.", ("method", "route"), LATENCY_BUCKETS)
+registry.declare("threadpool_queue_wait_seconds", "histogram", "Time a sync handler waited for a threadpool worker.", ("route",), WAIT_BUCKETS)
+
+
+class RequestMetrics:
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+request_metrics: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def record_threadpool_wait(route: str, seconds: float):
+    if METRICS_ENABLED:
+        registry.observe("threadpool_queue_wait_seconds", (route,), seconds)
+
+
+def route_label(scope: dict) -> str:
+    # the route template, never the raw path, to keep the number of series bounded
+    route = scope.get("route")
+    if route != None:
+        return route.path
+    if scope.get("root_path"):
+        return scope["root_path"] + "/{path}"
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Per-request latency, status, response size, SQL statements and SQL time,
+    labelled by route template. The statements reach the request through
+    the request_metrics context variable, which the threadpool and the
+    AsyncSession greenlet both inherit.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            return await self.app(scope, receive, send)
+
+        state = RequestMetrics()
+        reset = request_metrics.set(state)
+        start = time.perf_counter()
+        status, size = 500, 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        registry.inc("http_requests_in_flight")
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_metrics.reset(reset)
+            registry.inc("http_requests_in_flight", value=-1)
+            labels = (scope["method"], route_label(scope))
+            registry.inc("http_requests_total", labels + (str(status),))
+            registry.observe("http_request_duration_seconds", labels, time.perf_counter() - start)
+            registry.observe("http_response_size_bytes", labels, size)
+            registry.observe("http_request_db_queries", labels, state.queries)
+            registry.observe("http_request_db_seconds", labels, state.db_seconds)
+
+
+def record_statement(seconds: float):
+    # called by the cursor listener of src/database.py
+    state = request_metrics.get()
+    if state != None:
+        state.queries += 1
+        state.db_seconds += seconds
+
+
+class WorkerFiles:
+    """
+    Aggregation across uvicorn/gunicorn workers: each worker writes its
+    snapshot to METRICS_DIR every METRICS_FLUSH_SECONDS (and at shutdown),
+    and a scrape of any worker sums the files. Counters and histograms of
+    stopped workers keep counting, as Prometheus expects; gauges only count
+    for workers that are still running. Empty the directory on deploy.
+    """
+
+    def __init__(self, directory: str, interval: float):
+        self.directory = directory
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def path(self, pid: int) -> str:
+        return os.path.join(self.directory, f"worker-{pid}.json")
+
+    def flush(self):
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot = {"pid": os.getpid(), "metrics": registry.snapshot()}
+        temporary = self.path(os.getpid()) + ".tmp"
+        with open(temporary, "w") as handle:
+            json.dump(snapshot, handle)
+        os.replace(temporary, self.path(os.getpid()))
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def start(self):
+        self.flush()
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name="metrics-flush", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread != None:
+            self.thread.join()
+            self.thread = None
+        self.flush()
+
+    def snapshots(self) -> list:
+        self.flush()
+        snapshots = []
+        for path in glob.glob(os.path.join(self.directory, "worker-*.json")):
+            try:
+                with open(path) as handle:
+                    data = json.load(handle)
+            except (OSError, ValueError):
+                continue
+            metrics = data["metrics"]
+            if not alive(data["pid"]):
+                metrics = {name: family for name, family in metrics.items() if family["kind"] != "gauge"}
+            snapshots.append(metrics)
+        return snapshots
+
+
+def alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+worker_files = WorkerFiles(METRICS_DIR, METRICS_FLUSH_SECONDS) if METRICS_DIR else None
+
+
+def start():
+    if worker_files != None and METRICS_ENABLED:
+        worker_files.start()
+
+
+def stop():
+    if worker_files != None and METRICS_ENABLED:
+        worker_files.stop()
+
+
+def render() -> str:
+    snapshots = worker_files.snapshots() if worker_files != None else [registry.snapshot()]
+    return registry.render(snapshots)
@@ -0,0 +1,250 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from decimal import Decimal, InvalidOperation
+from sqlalchemy import and_, or_, case, column, func, select, table
+from sqlalchemy.exc import OperationalError
+from .config import load_env
+from .cache import TTLCache
+from .database import on_commit
+
+import base64
+import datetime
+import json
+import os
+
+load_env()
+
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "100"))
+PAGE_COUNT_WINDOW = os.getenv("PAGE_COUNT_WINDOW", "true").lower() in ("1", "true", "yes")
+PAGE_COUNT_CAP = int(os.getenv("PAGE_COUNT_CAP", "10000"))
+PAGE_TOTALS_TTL = float(os.getenv("PAGE_TOTALS_TTL", "30"))
+PAGE_TOTALS_SIZE = 10000
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def page_size(limit: int) -> int:
+    return max(1, min(limit, PAGE_SIZE_MAX))
+
+
+def encode_value(value):
+    if isinstance(value, Decimal):
+        return {"d": str(value)}
+    if isinstance(value, datetime.datetime):
+        return {"t": value.isoformat()}
+    return value
+
+
+def decode_value(value, column):
+    # a value of the column's own type, or InvalidCursor; never something the driver cannot bind
+    if value == None:
+        return None
+    if isinstance(value, dict) and "d" in value and isinstance(value["d"], str):
+        value = Decimal(value["d"])
+    elif isinstance(value, dict) and "t" in value and isinstance(value["t"], str):
+        value = datetime.datetime.fromisoformat(value["t"])
+    if isinstance(value, bool) or not isinstance(value, column.type.python_type):
+        raise InvalidCursor()
+    if isinstance(value, Decimal) and not value.is_finite():
+        raise InvalidCursor()
+    return value
+
+
+class Ordering:
+    """
+    One whitelisted sort: `column` in `direction`, with the primary key as
+    tie-breaker so that (column, id) is unique and can be used as a keyset.
+    NULL is the smallest value, as on MySQL and SQLite.
+    """
+
+    def __init__(self, name: str, column, id_column, descending: bool):
+        self.name = name
+        self.column = column
+        self.id_column = id_column
+        self.descending = descending
+        self.nullable = column.nullable and column is not id_column
+
+    def apply(self, query):
+        if self.descending:
+            return query.order_by(self.column.desc(), self.id_column.desc())
+        return query.order_by(self.column.asc(), self.id_column.asc())
+
+    def after(self, query, value, last_id):
+        column, id_column = self.column, self.id_column
+        if value == None:
+            if self.descending:
+                return query.filter(and_(column.is_(None), id_column < last_id))
+            return query.filter(or_(column.is_not(None), and_(column.is_(None), id_column > last_id)))
+        if self.descending:
+            condition = or_(column < value, and_(column == value, id_column < last_id))
+            return query.filter(or_(condition, column.is_(None)) if self.nullable else condition)
+        return query.filter(or_(column > value, and_(column == value, id_column > last_id)))
+
+    def cursor(self, row, total: int | None = None) -> str | None:
+        token = {
+            "o": self.name,
+            "d": "desc" if self.descending else "asc",
+            "v": encode_value(getattr(row, self.column.key)),
+            "i": getattr(row, self.id_column.key),
+            "n": total
+        }
+        return base64.urlsafe_b64encode(json.dumps(token, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> tuple:
+        try:
+            token = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            value, last_id = decode_value(token["v"], self.column), int(token["i"])
+            total = int(token["n"]) if token.get("n") != None else None
+        except (ValueError, TypeError, KeyError, InvalidOperation):
+            raise InvalidCursor()
+        if token.get("o") != self.name or token.get("d") != ("desc" if self.descending else "asc"):
+            raise InvalidCursor()
+        return value, last_id, total
+
+
+class RankOrdering:
+    """
+    Ordering by an externally computed rank (search relevance). A rank is
+    not a column, so it has no keyset: it pages by offset only.
+    """
+
+    name = "relevance"
+
+    def __init__(self, id_column, ranking: dict):
+        self.id_column = id_column
+        self.ranking = ranking
+
+    def apply(self, query):
+        return query.order_by(case(self.ranking, value=self.id_column), self.id_column.desc())
+
+    def decode(self, cursor: str) -> tuple:
+        raise InvalidCursor()
+
+    def cursor(self, row, total: int | None = None) -> str | None:
+        return None
+
+
+class SortRegistry:
+    """
+    Maps the `order`/`dir` query parameters of a listing to index-backed
+    orderings. Names may carry the table prefix the frontend historically
+    sent ("products.id"); anything not registered falls back to `default`.
+    """
+
+    def __init__(self, table: str, id_column, default: str, orderings: dict):
+        self.table = table
+        self.id_column = id_column
+        self.default = default
+        self.orderings = orderings
+
+    def ordering(self, order: str | None, direction: str | None) -> Ordering:
+        name = (order or self.default).strip()
+        if name.startswith(f"{self.table}."):
+            name = name[len(self.table) + 1:]
+        if name not in self.orderings:
+            name = self.default
+        descending = (direction or "desc").strip().lower() != "asc"
+        return Ordering(name, self.orderings[name], self.id_column, descending)
+
+
+class Page:
+
+    def __init__(self, rows: list, next_cursor: str | None, total: int | None, estimated: bool = False):
+        self.rows = rows
+        self.next_cursor = next_cursor
+        self.total = total
+        self.estimated = estimated
+
+
+def capped_count(query, cap: int) -> int:
+    subquery = query.order_by(None).limit(cap).subquery()
+    return query.session.query(func.count()).select_from(subquery).scalar()
+
+
+def paginate(query, ordering, limit: int, page: int = 1, cursor: str | None = None, estimate: bool = False) -> Page:
+    """
+    Loads one page and the filtered total. With a cursor the page starts
+    right after the row it points at (keyset) and the total travels in the
+    cursor; without one `page` is used as an offset, for clients that predate
+    cursors, and the total comes from COUNT(*) OVER () on the page query
+    itself. One extra row tells whether a next page exists. With `estimate`
+    the total is counted up to PAGE_COUNT_CAP rows only.
+    """
+    total, estimated = None, False
+    if cursor:
+        value, last_id, total = ordering.decode(cursor)
+        selected, offset = ordering.after(query, value, last_id), 0
+    else:
+        selected, offset = query, (max(page, 1) - 1) * limit
+
+    windowed = total == None and not estimate and PAGE_COUNT_WINDOW
+    if windowed:
+        selected = selected.add_columns(func.count().over().label("total_count"))
+    rows = ordering.apply(selected).limit(limit + 1).offset(offset).all()
+    if windowed:
+        total = rows[0].total_count if len(rows) > 0 else None
+        rows = [row[0] for row in rows]
+
+    if total == None and estimate:
+        total = capped_count(query, PAGE_COUNT_CAP)
+        estimated = total >= PAGE_COUNT_CAP
+    elif total == None:
+        total = query.order_by(None).count()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return Page(rows, ordering.cursor(rows[-1], total), total, estimated)
+    return Page(rows, None, total, estimated)
+
+
+class CountCache:
+    """
+    Unfiltered totals of one table (e.g. all active products, or the orders
+    of one user), cached per key and dropped whenever a row of `model` is
+    committed. With `estimate` the whole-table row count comes from the
+    database statistics instead of a COUNT(*).
+    """
+
+    def __init__(self, model, ttl: float):
+        self.model = model
+        self.cache = TTLCache(PAGE_TOTALS_SIZE, ttl)
+        on_commit((model,), self.cache.clear)
+
+    def get(self, key, query, estimate: bool = False) -> int:
+        total = self.cache.get((key, estimate))
+        if total == None:
+            if estimate:
+                total = table_rows(query.session, self.model.__tablename__)
+            if total == None:
+                total = query.order_by(None).count()
+            self.cache.set((key, estimate), total)
+        return total
+
+
+def table_rows(db, name: str) -> int | None:
+    # plain SELECTs, and the dialect from the session's primary engine rather than get_bind():
+    # anything else is routed as a write, to the primary, and pins the caller there
+    dialect = db.primary.dialect.name
+    if dialect in ("mysql", "mariadb"):
+        tables = table("TABLES", column("TABLE_ROWS"), column("TABLE_SCHEMA"), column("TABLE_NAME"), schema="information_schema")
+        statement = select(tables.c.TABLE_ROWS).where(and_(tables.c.TABLE_SCHEMA == func.database(), tables.c.TABLE_NAME == name))
+        return db.execute(statement).scalar()
+    if dialect == "sqlite":
+        stats_table = table("sqlite_stat1", column("stat"), column("tbl"))
+        try:
+            stats = db.execute(select(stats_table.c.stat).where(stats_table.c.tbl == name)).scalars().all()
+        except OperationalError:
+            return None
+        return max((int(stat.split()[0]) for stat in stats), default=None)
+    return None
@@ -0,0 +1,130 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+import threading
+import time
+
+
+class PoolStatistics:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.overflow_checkouts = 0
+        self.peak_overflow = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_checkout(self, waited: bool, elapsed: float, overflow: int):
+        with self.lock:
+            self.checkouts += 1
+            if waited:
+                self.waits += 1
+                self.total_wait += elapsed
+                self.max_wait = max(self.max_wait, elapsed)
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_timeout(self, elapsed: float):
+        with self.lock:
+            self.timeouts += 1
+            self.waits += 1
+            self.total_wait += elapsed
+            self.max_wait = max(self.max_wait, elapsed)
+
+    def record_checkin(self):
+        with self.lock:
+            self.checkins += 1
+
+    def record_connect(self):
+        with self.lock:
+            self.connects += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "peak_overflow": self.peak_overflow,
+                "total_wait_seconds": self.total_wait,
+                "max_wait_seconds": self.max_wait,
+                "avg_wait_seconds": self.total_wait / self.waits if self.waits > 0 else 0.0
+            }
+
+
+class InstrumentedPoolMixin:
+    """
+    QueuePool that counts checkouts, overflow use and the time callers spend
+    blocked on an exhausted pool. Counters survive engine.dispose(), which
+    recreates the pool object.
+    """
+
+    statistics: PoolStatistics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
+
+    def _do_get(self):
+        waited = self._max_overflow > -1 and self._overflow >= self._max_overflow and self._pool.empty()
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.statistics.record_timeout(time.perf_counter() - start)
+            raise
+        self.statistics.record_checkout(waited, time.perf_counter() - start, self.overflow())
+        return record
+
+    def _do_return_conn(self, record):
+        self.statistics.record_checkin()
+        super()._do_return_conn(record)
+
+    def _create_connection(self):
+        self.statistics.record_connect()
+        return super()._create_connection()
+
+    def status_payload(self) -> dict:
+        payload = {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout": self._timeout
+        }
+        payload.update(self.statistics.snapshot())
+        return payload
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
@@ -0,0 +1,94 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from decimal import Decimal
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, load_only, selectinload
+from .config import load_env
+from .cache import TTLCache
+from .database import on_commit
+from .model import Product
+
+import datetime
+import os
+
+load_env()
+
+PRODUCT_NEWEST_DAYS = int(os.getenv("PRODUCT_NEWEST_DAYS", "30"))
+PRODUCT_RATING_TTL = float(os.getenv("PRODUCT_RATING_TTL", "60"))
+PRICE_OLD_MARKUP = Decimal("1.05")
+
+
+CARD_COLUMNS = (Product.id, Product.name, Product.image, Product.price, Product.total_rating, Product.published_date, Product.created_at)
+
+
+def card_options(*columns) -> tuple:
+    """
+    Loader options for card listings: only the card columns (plus `columns`,
+    e.g. the sort key a cursor is built from), and the categories of the
+    whole page in one IN query instead of one query per card.
+    """
+    return (load_only(*CARD_COLUMNS, *columns), selectinload(Product.categories))
+
+
+class RatingScale:
+    """
+    Highest total_rating of the visible catalog; stars are given relative to
+    it. Cached, and dropped whenever a product is committed.
+    """
+
+    def __init__(self, ttl: float):
+        self.cache = TTLCache(1, ttl)
+
+    def max_rating(self, db: Session) -> int:
+        value = self.cache.get("max")
+        if value == None:
+            value = db.query(func.max(Product.total_rating)).filter(and_(Product.status == 1, Product.published_date <= func.now())).scalar() or 0
+            self.cache.set("max", value)
+        return value
+
+    def invalidate(self):
+        self.cache.clear()
+
+
+rating_scale = RatingScale(PRODUCT_RATING_TTL)
+on_commit((Product,), rating_scale.invalidate)
+
+
+def rating_stars(total_rating: int | None, max_rating: int) -> int:
+    if not total_rating or max_rating <= 0:
+        return 0
+    return -(-int(total_rating) * 5 // int(max_rating))
+
+
+def is_newest(row: Product, now: datetime.datetime) -> bool:
+    released = row.published_date or row.created_at
+    return released != None and released >= now - datetime.timedelta(days=PRODUCT_NEWEST_DAYS)
+
+
+def product_card(row: Product, max_rating: int, all_categories: bool = False, now: datetime.datetime | None = None) -> dict:
+    names = [category.name for category in row.categories]
+    return {
+        "id": row.id,
+        "name": row.name,
+        "image": row.image,
+        "category": ", ".join(names) if all_categories else (names[0] if len(names) > 0 else None),
+        "price": row.price,
+        "price_old": Decimal(row.price) * PRICE_OLD_MARKUP,
+        "newest": is_newest(row, now or datetime.datetime.now()),
+        "total_rating": rating_stars(row.total_rating, max_rating)
+    }
+
+
+def product_cards(db: Session, rows: list, all_categories: bool = False) -> list:
+    max_rating = rating_scale.max_rating(db)
+    now = datetime.datetime.now()
+    return [product_card(row, max_rating, all_categories, now) for row in rows]
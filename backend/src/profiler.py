@@ -0,0 +1,248 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from pathlib import Path
+from .config import load_env
+from .metrics import route_label
+
+import datetime
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+load_env()
+
+PROFILER_MAX_SECONDS = float(os.getenv("PROFILER_MAX_SECONDS", "120"))
+PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", "5"))
+PROFILER_TOP = int(os.getenv("PROFILER_TOP", "20"))
+
+BACKEND = str(Path(__file__).resolve().parent.parent) + os.sep
+# leaf frames of a thread that is only waiting for work
+IDLE_FILES = ("threading.py", "selectors.py", "queue.py")
+
+
+class ProfilerBusy(Exception):
+    pass
+
+
+def location(filename: str) -> str:
+    if filename.startswith(BACKEND):
+        return filename[len(BACKEND):]
+    if "site-packages" + os.sep in filename:
+        return filename.split("site-packages" + os.sep, 1)[1]
+    return os.path.basename(filename)
+
+
+def collapse(frame, thread_name: str) -> tuple:
+    names = []
+    while frame != None:
+        names.append(f"{location(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+        frame = frame.f_back
+    names.append(thread_name)
+    return tuple(reversed(names))
+
+
+def snapshot() -> tracemalloc.Snapshot:
+    # without the memory of the snapshots themselves
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+class Profiler:
+    """
+    One time-boxed profiling run per worker at a time, in one of two modes:
+
+    cpu: a timer thread samples the stack of every other thread each
+    `interval` ms (sys._current_frames) and counts them as collapsed stacks,
+    the input of flamegraph.pl / speedscope. Threads waiting for work are
+    left out unless `idle` is set.
+
+    memory: tracemalloc runs for the duration and, one request at a time,
+    the allocations still alive when the response starts are diffed
+    against the start of the request and summed per route and source line,
+    next to the peak traced memory of the request. Requests served in the
+    meantime are not measured but their allocations land in the diff, so
+    the sites are clearest on a quiet worker. Tracing slows the worker down
+    several times; keep runs short.
+
+    Only the worker that received the start request is profiled.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.measure = threading.Lock()
+        self.mode = None
+        self.started_at = None
+        self.deadline = 0.0
+        self.stopped = threading.Event()
+        self.thread = None
+        self.result = None
+
+    def start(self, mode: str, seconds: float, interval_ms: float = PROFILER_INTERVAL_MS, idle: bool = False, frames: int = 1):
+        with self.lock:
+            if self.mode != None:
+                raise ProfilerBusy()
+            self.mode = mode
+            self.started_at = datetime.datetime.utcnow()
+            self.deadline = time.monotonic() + min(seconds, PROFILER_MAX_SECONDS)
+            self.stopped.clear()
+            if mode == "cpu":
+                self.result = {"samples": 0, "stacks": {}}
+                target, args = self.sample, (interval_ms / 1000, idle)
+            else:
+                self.result = {"requests": 0, "skipped": 0, "routes": {}}
+                tracemalloc.start(frames)
+                target, args = self.expire, ()
+            self.thread = threading.Thread(target=target, args=args, name="profiler", daemon=True)
+            self.thread.start()
+
+    def stop(self, wait: bool = False):
+        # no waiting from a request: in memory mode the run ends after the request being measured
+        self.stopped.set()
+        thread = self.thread
+        if wait and thread != None:
+            thread.join()
+
+    def finish(self):
+        # waits for the request being measured, if any
+        with self.measure, self.lock:
+            if self.mode == "memory":
+                tracemalloc.stop()
+            self.mode = None
+            self.thread = None
+
+    def sample(self, interval: float, idle: bool):
+        own = threading.get_ident()
+        try:
+            while not self.stopped.wait(interval) and time.monotonic() < self.deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                stacks = [
+                    collapse(frame, names.get(ident, "thread")) for ident, frame in sys._current_frames().items()
+                    if ident != own and (idle or not frame.f_code.co_filename.endswith(IDLE_FILES))
+                ]
+                with self.lock:
+                    for stack in stacks:
+                        self.result["stacks"][stack] = self.result["stacks"].get(stack, 0) + 1
+                    self.result["samples"] += 1
+        finally:
+            self.finish()
+
+    def expire(self):
+        try:
+            self.stopped.wait(max(0.0, self.deadline - time.monotonic()))
+        finally:
+            self.finish()
+
+    def begin_request(self):
+        # None when the request is not measured: not profiling memory, or another request is being measured
+        if self.mode != "memory" or not self.measure.acquire(blocking=False):
+            return None
+        if not tracemalloc.is_tracing():
+            self.measure.release()
+            return None
+        tracemalloc.reset_peak()
+        return (snapshot(), tracemalloc.get_traced_memory()[0])
+
+    def end_request(self, begun: tuple, route: str):
+        try:
+            if not tracemalloc.is_tracing():
+                return
+            before, current = begun
+            peak = tracemalloc.get_traced_memory()[1] - current
+            grown = [stat for stat in snapshot().compare_to(before, "lineno") if stat.size_diff > 0]
+            with self.lock:
+                entry = self.result["routes"].setdefault(route, {"requests": 0, "peak_bytes": 0, "sites": {}})
+                entry["requests"] += 1
+                entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+                for stat in grown:
+                    frame = stat.traceback[0]
+                    site = f"{location(frame.filename)}:{frame.lineno}"
+                    size, count = entry["sites"].get(site, (0, 0))
+                    entry["sites"][site] = (size + stat.size_diff, count + stat.count_diff)
+                self.result["requests"] += 1
+        finally:
+            self.measure.release()
+
+    def skipped(self):
+        with self.lock:
+            if self.mode == "memory":
+                self.result["skipped"] += 1
+
+    def status(self) -> dict:
+        with self.lock:
+            status = {
+                "running": self.mode != None,
+                "mode": self.mode,
+                "started_at": self.started_at,
+                "seconds_left": max(0.0, round(self.deadline - time.monotonic(), 1)) if self.mode != None else 0.0
+            }
+            result = self.result or {}
+            if "stacks" in result:
+                status["samples"] = result["samples"]
+                status["stacks"] = len(result["stacks"])
+            elif "routes" in result:
+                status["requests"] = result["requests"]
+                status["skipped"] = result["skipped"]
+                status["routes"] = {
+                    route: {
+                        "requests": entry["requests"],
+                        "peak_bytes": entry["peak_bytes"],
+                        "top_sites": [
+                            {"site": site, "bytes": size, "blocks": count}
+                            for site, (size, count) in sorted(entry["sites"].items(), key=lambda item: -item[1][0])[:PROFILER_TOP]
+                        ]
+                    }
+                    for route, entry in sorted(result["routes"].items())
+                }
+            return status
+
+    def collapsed(self) -> str:
+        with self.lock:
+            stacks = dict((self.result or {}).get("stacks", {}))
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in sorted(stacks.items(), key=lambda item: -item[1]))
+
+
+profiler = Profiler()
+
+
+class ProfilerMiddleware:
+    """
+    Hands the requests to the memory mode of the profiler; a single
+    attribute check when it is not running.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or profiler.mode != "memory":
+            return await self.app(scope, receive, send)
+
+        begun = profiler.begin_request()
+        if begun == None:
+            profiler.skipped()
+            return await self.app(scope, receive, send)
+
+        ended = False
+
+        async def send_wrapper(message):
+            nonlocal ended
+            if message["type"] == "http.response.start" and not ended:
+                ended = True
+                profiler.end_request(begun, route_label(scope))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not ended:
+                profiler.end_request(begun, route_label(scope))
@@ -0,0 +1,206 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from .config import load_env
+from .metrics import route_label
+
+import datetime
+import logging
+import os
+import re
+import threading
+
+load_env()
+
+SQL_QUERY_LOG = os.getenv("SQL_QUERY_LOG", "true").lower() in ("1", "true", "yes")
+SQL_SLOW_MS = float(os.getenv("SQL_SLOW_MS", "200"))
+SQL_SLOW_KEEP = int(os.getenv("SQL_SLOW_KEEP", "100"))
+SQL_NPLUSONE_THRESHOLD = int(os.getenv("SQL_NPLUSONE_THRESHOLD", "5"))
+
+logger = logging.getLogger(__name__)
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+IN_LISTS = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s|:\w+)\s*,?)+\)", re.IGNORECASE)
+SPACES = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    # one shape whatever the literals or the length of an IN list
+    shape = LITERALS.sub("?", SPACES.sub(" ", statement).strip())
+    return IN_LISTS.sub("IN (...)", shape)
+
+
+def parameter_shape(parameters, executemany: bool = False):
+    # the types (and lengths) of the bound values, never the values themselves
+    if executemany:
+        rows = list(parameters)
+        return {"rows": len(rows), "row": parameter_shape(rows[0]) if len(rows) > 0 else None}
+    if isinstance(parameters, dict):
+        return {name: value_shape(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [value_shape(value) for value in parameters]
+    return value_shape(parameters)
+
+
+def value_shape(value) -> str:
+    if isinstance(value, (str, bytes, list, tuple)):
+        return f"{type(value).__name__}({len(value)})"
+    return type(value).__name__
+
+
+class QueryLog:
+    """
+    Statements of one request (or of a query_budget block), counted by
+    shape. A log opened inside another one also reports to its parent.
+    """
+
+    def __init__(self, scope: dict | None = None, parent=None):
+        self.scope = scope
+        self.parent = parent
+        self.total = 0
+        self.seconds = 0.0
+        self.shapes = {}
+
+    def route(self) -> str:
+        return route_label(self.scope) if self.scope != None else "unknown"
+
+    def record(self, shape: str, seconds: float):
+        log = self
+        while log != None:
+            log.total += 1
+            log.seconds += seconds
+            log.shapes[shape] = log.shapes.get(shape, 0) + 1
+            log = log.parent
+
+    def repeated(self, threshold: int = SQL_NPLUSONE_THRESHOLD) -> dict:
+        # the same SELECT again and again is a lazy load or a query in a loop
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold and shape.upper().startswith("SELECT")}
+
+
+request_queries: ContextVar[QueryLog | None] = ContextVar("request_queries", default=None)
+
+
+def query_log() -> QueryLog | None:
+    return request_queries.get()
+
+
+class QueryStats:
+    """
+    Totals per route since the worker started: requests, statements, time,
+    the statement shapes flagged as N+1 (with the most repeats seen in one
+    request) and the last SQL_SLOW_KEEP slow statements.
+    """
+
+    def __init__(self, keep: int):
+        self.lock = threading.Lock()
+        self.routes = {}
+        self.slow = deque(maxlen=keep)
+
+    def request(self, log: QueryLog, repeated: dict):
+        with self.lock:
+            route = self.routes.setdefault(log.route(), {"requests": 0, "statements": 0, "seconds": 0.0, "max_statements": 0, "n_plus_one": {}})
+            route["requests"] += 1
+            route["statements"] += log.total
+            route["seconds"] += log.seconds
+            route["max_statements"] = max(route["max_statements"], log.total)
+            for shape, count in repeated.items():
+                route["n_plus_one"][shape] = max(route["n_plus_one"].get(shape, 0), count)
+
+    def slow_statement(self, entry: dict):
+        with self.lock:
+            self.slow.append(entry)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "slow_ms": SQL_SLOW_MS,
+                "n_plus_one_threshold": SQL_NPLUSONE_THRESHOLD,
+                "routes": {name: dict(route, n_plus_one=dict(route["n_plus_one"])) for name, route in sorted(self.routes.items())},
+                "slow": list(self.slow)
+            }
+
+
+query_stats = QueryStats(SQL_SLOW_KEEP)
+
+
+def record_statement(statement: str, parameters, executemany: bool, seconds: float):
+    # called by the cursor listener of src/database.py
+    if not SQL_QUERY_LOG:
+        return
+    log = request_queries.get()
+    if log == None and seconds * 1000 < SQL_SLOW_MS:
+        return
+    shape = statement_shape(statement)
+    if log != None:
+        log.record(shape, seconds)
+    if seconds * 1000 >= SQL_SLOW_MS:
+        route = log.route() if log != None else "none"
+        parameters = parameter_shape(parameters, executemany)
+        query_stats.slow_statement({"at": datetime.datetime.utcnow(), "route": route, "ms": round(seconds * 1000, 1), "statement": shape, "parameters": parameters})
+        logger.warning("slow query (%.0f ms) on %s: %s parameters=%s", seconds * 1000, route, shape, parameters)
+
+
+class QueryLogMiddleware:
+    """
+    Opens a QueryLog per request, so that every statement is attributed to
+    the route, and reports the shapes repeated SQL_NPLUSONE_THRESHOLD times
+    or more within the request as N+1 when it ends.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not SQL_QUERY_LOG:
+            return await self.app(scope, receive, send)
+
+        log = QueryLog(scope, parent=request_queries.get())
+        reset = request_queries.set(log)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_queries.reset(reset)
+            repeated = log.repeated()
+            query_stats.request(log, repeated)
+            for shape, count in repeated.items():
+                logger.warning("N+1 on %s %s: %d x %s", scope["method"], log.route(), count, shape)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def query_budget(limit: int, repeats: int | None = None):
+    """
+    Test helper: fails when the block runs more than `limit` statements, or
+    (with `repeats`) the same SELECT `repeats` times or more. Requests sent
+    in the block through httpx.ASGITransport run in the caller's context and
+    count; the sync TestClient runs the app in another thread and does not.
+
+        with query_budget(6):
+            await client.get("/api/shop/list")
+    """
+    log = QueryLog()
+    reset = request_queries.set(log)
+    try:
+        yield log
+    finally:
+        request_queries.reset(reset)
+    if log.total > limit:
+        shapes = "\n".join(f"  {count} x {shape}" for shape, count in sorted(log.shapes.items(), key=lambda item: -item[1]))
+        raise QueryBudgetExceeded(f"{log.total} statements, budget {limit}:\n{shapes}")
+    repeated = log.repeated(repeats) if repeats != None else {}
+    if len(repeated) > 0:
+        raise QueryBudgetExceeded("repeated statements:\n" + "\n".join(f"  {count} x {shape}" for shape, count in repeated.items()))
@@ -0,0 +1,124 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from .config import load_env
+from .database import on_commit
+from .model import Setting, Payment, Size, Colour, Brand
+
+import os
+import threading
+import time
+
+load_env()
+
+REFERENCE_TTL = float(os.getenv("REFERENCE_TTL", "300"))
+REFERENCE_MODELS = (Setting, Payment, Size, Colour, Brand)
+
+
+def row_dict(model) -> dict:
+    return {column.name: getattr(model, column.name) for column in model.__table__.columns}
+
+
+def setting_decimal(settings: dict, key: str) -> Decimal:
+    value = settings.get(key)
+    return Decimal(value) if value != None else Decimal(0)
+
+
+class ReferenceSnapshot:
+    """
+    Read-only copy of the rarely changing reference tables. A snapshot is never
+    mutated; a change produces a new snapshot with a higher version.
+    """
+
+    def __init__(self, version: int, settings: dict, payments: list, sizes: list, colours: list, brands: list):
+        self.version = version
+        self.loaded_at = time.time()
+        self.settings = settings
+        self.payments_all = payments
+        self.payments = [row for row in payments if row["status"] == 1]
+        self.payments_by_id = {row["id"]: row for row in payments}
+        self.sizes = sizes
+        self.colours = colours
+        self.brands = brands
+        self.discount = setting_decimal(settings, "discount_value")
+        self.taxes = setting_decimal(settings, "taxes_value")
+        self.shipment = setting_decimal(settings, "total_shipment")
+
+    def setting(self, key: str, default=None):
+        return self.settings.get(key, default)
+
+    def payment(self, payment_id: int | None) -> dict | None:
+        return self.payments_by_id.get(payment_id)
+
+
+class ReferenceData:
+    """
+    Holds the current ReferenceSnapshot of the worker. It is loaded on first use,
+    reloaded after a commit that touched a reference table, and at the latest
+    every REFERENCE_TTL seconds so that changes made by other workers show up.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.snapshot = None
+        self.generation = 0
+        self.version = 0
+        self.loads = 0
+        self.hits = 0
+
+    def get(self, db: Session) -> ReferenceSnapshot:
+        snapshot = self.snapshot
+        if snapshot != None and snapshot.loaded_at + self.ttl >= time.time():
+            self.hits += 1
+            return snapshot
+
+        # Loading happens outside the lock: under DB_ASYNC the queries yield to
+        # the event loop, and a thread lock held across them would block it.
+        generation = self.generation
+        settings, payments, sizes, colours, brands = self.load(db)
+        with self.lock:
+            self.loads += 1
+            self.version += 1
+            snapshot = ReferenceSnapshot(self.version, settings, payments, sizes, colours, brands)
+            if generation == self.generation:
+                self.snapshot = snapshot
+            return snapshot
+
+    def load(self, db: Session) -> tuple:
+        settings = {row.key_name: row.key_value for row in db.query(Setting).all()}
+        payments = [row_dict(row) for row in db.query(Payment).order_by(Payment.name.asc()).all()]
+        sizes = [row_dict(row) for row in db.query(Size).filter(Size.status == 1).order_by(Size.name.asc()).all()]
+        colours = [row_dict(row) for row in db.query(Colour).filter(Colour.status == 1).order_by(Colour.name.asc()).all()]
+        brands = [row_dict(row) for row in db.query(Brand).filter(Brand.status == 1).order_by(Brand.name.asc()).all()]
+        return settings, payments, sizes, colours, brands
+
+    def invalidate(self):
+        with self.lock:
+            self.generation += 1
+            self.snapshot = None
+
+    def stats(self) -> dict:
+        snapshot = self.snapshot
+        return {
+            "version": snapshot.version if snapshot != None else None,
+            "loads": self.loads,
+            "invalidations": self.generation,
+            "hits": self.hits,
+            "ttl": self.ttl,
+            "age_seconds": time.time() - snapshot.loaded_at if snapshot != None else None
+        }
+
+
+reference_data = ReferenceData(REFERENCE_TTL)
+on_commit(REFERENCE_MODELS, reference_data.invalidate)
@@ -0,0 +1,97 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from fastapi import APIRouter, Depends
+from fastapi.params import Depends as DependsParam
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+from starlette.concurrency import run_in_threadpool
+from .database import DB_ASYNC, get_db, get_async_db, get_read_db, get_async_read_db
+from .metrics import METRICS_ENABLED, record_threadpool_wait
+
+import functools
+import inspect
+import time
+
+ASYNC_DEPENDENCIES = {
+    get_db: get_async_db,
+    get_read_db: get_async_read_db
+}
+
+
+def async_endpoint(endpoint):
+    # Also used for dependencies that take a `db` session, so that they share
+    # the request's AsyncSession with the handler.
+    signature = inspect.signature(endpoint)
+    db_params = [
+        name for name, param in signature.parameters.items()
+        if isinstance(param.default, DependsParam) and param.default.dependency in ASYNC_DEPENDENCIES
+    ]
+
+    if inspect.iscoroutinefunction(endpoint) or len(db_params) == 0:
+        return endpoint
+
+    name = db_params[0]
+    dependency = ASYNC_DEPENDENCIES[signature.parameters[name].default.dependency]
+
+    @functools.wraps(endpoint)
+    async def wrapper(**kwargs):
+        session: AsyncSession = kwargs.pop(name)
+        return await session.run_sync(lambda db: endpoint(**kwargs, **{name: db}))
+
+    parameters = [
+        param.replace(default=Depends(dependency), annotation=AsyncSession) if param.name == name else param
+        for param in signature.parameters.values()
+    ]
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+    return wrapper
+
+
+def offload(fn, *args, **kwargs):
+    # For blocking work that is not a database call (file I/O): a handler served
+    # on an AsyncSession runs on the event loop, inside SQLAlchemy's greenlet,
+    # so the work goes to the threadpool and is awaited there, as the hasher does.
+    if in_greenlet():
+        return await_only(run_in_threadpool(fn, *args, **kwargs))
+    return fn(*args, **kwargs)
+
+
+def threadpool_endpoint(path: str, endpoint):
+    # What FastAPI does for a sync handler, plus the time spent queued for a
+    # worker thread (the threadpool is shared by every sync handler and dependency).
+    @functools.wraps(endpoint)
+    async def wrapper(**kwargs):
+        submitted = time.perf_counter()
+
+        def run():
+            record_threadpool_wait(path, time.perf_counter() - submitted)
+            return endpoint(**kwargs)
+
+        return await run_in_threadpool(run)
+
+    return wrapper
+
+
+class DatabaseRouter(APIRouter):
+    """
+    APIRouter that serves the sync handlers on an AsyncSession when DB_ASYNC is enabled.
+    The handler body runs through AsyncSession.run_sync, so database round trips are
+    awaited on the event loop instead of holding a threadpool worker; other blocking
+    work in a handler goes through offload(). get_db and get_read_db map to their
+    AsyncSession counterparts.
+    """
+
+    def add_api_route(self, path, endpoint, **kwargs):
+        if DB_ASYNC:
+            endpoint = async_endpoint(endpoint)
+        if METRICS_ENABLED and not inspect.iscoroutinefunction(endpoint):
+            endpoint = threadpool_endpoint(path, endpoint)
+        return super().add_api_route(path, endpoint, **kwargs)
@@ -0,0 +1,300 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from bisect import bisect_left, insort
+from collections import Counter
+from heapq import nsmallest
+from sqlalchemy import desc, or_
+from sqlalchemy.orm import Session
+from .config import load_env
+from .cache import TTLCache
+from .database import DB_CONNECTION, on_commit
+from .model import Product
+
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+
+load_env()
+
+SEARCH_ENGINE = os.getenv("SEARCH_ENGINE", "auto")
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "1000"))
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1000"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "60"))
+SEARCH_INDEX_TTL = float(os.getenv("SEARCH_INDEX_TTL", "300"))
+
+FIELD_WEIGHTS = {"name": 3.0, "sku": 3.0, "details": 1.0, "description": 1.0}
+PREFIX_FACTOR = 0.5
+SKU_EXACT_BOOST = 1000.0
+SKU_PREFIX_BOOST = 100.0
+
+TOKEN = re.compile(r"\w+")
+
+
+def fold(value: str) -> str:
+    # composed accents, then case-insensitive in every script
+    return unicodedata.normalize("NFKC", value).casefold()
+
+
+def tokenize(value: str | None) -> list:
+    return TOKEN.findall(fold(value)) if value else []
+
+
+def normalize_query(query: str | None) -> str:
+    return " ".join(tokenize(query))
+
+
+def normalize_sku(value: str | None) -> str:
+    # the whole code, separators included ("AB-123"), unlike the text tokens
+    return fold(value).strip() if value else ""
+
+
+def sku_boost(sku: str, query: str) -> float:
+    sku = normalize_sku(sku)
+    if sku == query:
+        return SKU_EXACT_BOOST
+    if sku.startswith(query):
+        return SKU_PREFIX_BOOST
+    return 0.0
+
+
+class LocalSearchIndex:
+    """
+    In-process inverted index over product name, sku, details and description.
+    Every query token must match a term exactly or as a prefix; documents are
+    ranked by field-weighted tf-idf, prefix matches counting half, and the
+    query taken whole as a SKU puts an exact SKU first and SKU prefixes next.
+    Used for SQLite and whenever no FULLTEXT index is available.
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self.terms = []
+        self.skus = []
+        self.documents = {}
+
+    def add(self, product_id: int, sku: str, name: str, details: str, description: str):
+        self.remove(product_id)
+        weights = Counter()
+        for field, value in (("name", name), ("sku", sku), ("details", details), ("description", description)):
+            for token in tokenize(value):
+                weights[token] += FIELD_WEIGHTS[field]
+        for token, weight in weights.items():
+            if token not in self.postings:
+                self.postings[token] = {}
+                insort(self.terms, token)
+            self.postings[token][product_id] = weight
+        sku = normalize_sku(sku)
+        insort(self.skus, (sku, product_id))
+        self.documents[product_id] = (sku, tuple(weights))
+
+    def remove(self, product_id: int):
+        document = self.documents.pop(product_id, None)
+        if document == None:
+            return
+        for token in document[1]:
+            self.postings[token].pop(product_id, None)
+        position = bisect_left(self.skus, (document[0], product_id))
+        if position < len(self.skus) and self.skus[position] == (document[0], product_id):
+            del self.skus[position]
+
+    def matches(self, token: str) -> dict:
+        scores = {}
+        total = max(len(self.documents), 1)
+        position = bisect_left(self.terms, token)
+        while position < len(self.terms) and self.terms[position].startswith(token):
+            term = self.terms[position]
+            postings = self.postings[term]
+            if len(postings) > 0:
+                factor = 1.0 if term == token else PREFIX_FACTOR
+                idf = math.log(1 + total / len(postings))
+                for product_id, weight in postings.items():
+                    score = weight * idf * factor
+                    if score > scores.get(product_id, 0.0):
+                        scores[product_id] = score
+            position += 1
+        return scores
+
+    def search(self, query: str, sku: str, limit: int) -> list:
+        tokens = query.split()
+        if len(tokens) == 0:
+            return []
+
+        scores = None
+        for token in tokens:
+            matched = self.matches(token)
+            if scores == None:
+                scores = matched
+            else:
+                scores = {product_id: score + matched[product_id] for product_id, score in scores.items() if product_id in matched}
+            if len(scores) == 0:
+                break
+
+        position = bisect_left(self.skus, (sku, 0)) if sku != "" else len(self.skus)
+        while position < len(self.skus) and self.skus[position][0].startswith(sku):
+            code, product_id = self.skus[position]
+            scores[product_id] = scores.get(product_id, 0.0) + sku_boost(code, sku)
+            position += 1
+
+        return nsmallest(limit, scores.items(), key=lambda item: (-item[1], -item[0]))
+
+
+class LocalSearch:
+    """
+    Keeps a LocalSearchIndex of the active products in sync with the products
+    table: loaded on first use, re-indexing only the products touched by a
+    commit, and rebuilt every SEARCH_INDEX_TTL seconds to pick up changes made
+    by other workers.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.index = None
+        self.generation = 0
+        self.dirty = set()
+        self.built_at = 0.0
+        self.rebuilds = 0
+        self.updates = 0
+
+    def load(self, db: Session, ids: set | None) -> list:
+        # inactive products are never listed, they must not take places in the ranking
+        rows = db.query(Product.id, Product.sku, Product.name, Product.details, Product.description).filter(Product.status == 1)
+        if ids != None:
+            rows = rows.filter(Product.id.in_(ids))
+        return rows.all()
+
+    def prepare(self, db: Session):
+        with self.lock:
+            rebuild = self.index == None or self.built_at + self.ttl < time.time()
+            ids = set(self.dirty)
+            self.dirty.clear()
+            generation = self.generation
+
+        if rebuild:
+            index = LocalSearchIndex()
+            for row in self.load(db, None):
+                index.add(row.id, row.sku, row.name, row.details, row.description)
+            with self.lock:
+                if generation == self.generation:
+                    self.index = index
+                    self.built_at = time.time()
+                    self.rebuilds += 1
+        elif len(ids) > 0:
+            rows = self.load(db, ids)
+            with self.lock:
+                if generation == self.generation and self.index != None:
+                    for product_id in ids:
+                        self.index.remove(product_id)
+                    for row in rows:
+                        self.index.add(row.id, row.sku, row.name, row.details, row.description)
+                    self.updates += 1
+
+    def search(self, db: Session, query: str, sku: str, limit: int) -> list:
+        self.prepare(db)
+        with self.lock:
+            return self.index.search(query, sku, limit) if self.index != None else []
+
+    def changed(self, changed: set | None):
+        with self.lock:
+            if changed == None:
+                self.generation += 1
+                self.index = None
+            else:
+                self.dirty.update(product_id for _, product_id in changed)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "engine": "local",
+                "documents": len(self.index.documents) if self.index != None else None,
+                "terms": len(self.index.postings) if self.index != None else None,
+                "rebuilds": self.rebuilds,
+                "updates": self.updates,
+                "age_seconds": time.time() - self.built_at if self.index != None else None
+            }
+
+
+class FulltextSearch:
+    """
+    MySQL FULLTEXT path: boolean-mode MATCH ... AGAINST with every token as a
+    required prefix (`+token*`), plus exact/prefix SKU matches that the
+    products.sku index answers.
+    """
+
+    def search(self, db: Session, query: str, sku: str, limit: int) -> list:
+        from sqlalchemy.dialects.mysql import match
+
+        terms = " ".join(f"+{token}*" for token in query.split())
+        relevance = match(Product.name, Product.details, Product.description, against=terms).in_boolean_mode()
+        rows = (
+            db.query(Product.id, Product.sku, relevance.label("relevance"))
+            .filter(Product.status == 1)
+            .filter(or_(relevance > 0, Product.sku.startswith(sku, autoescape=True)))
+            .order_by(desc("relevance"))
+            .limit(limit)
+            .all()
+        )
+        scores = {row.id: float(row.relevance or 0) + sku_boost(row.sku, sku) for row in rows}
+        return sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+
+    def changed(self, changed: set | None):
+        pass
+
+    def stats(self) -> dict:
+        return {"engine": "fulltext"}
+
+
+class ProductSearch:
+    """
+    Ranked ids of active products for a free-text query, at most `limit` of
+    them. Results are cached per normalized query and dropped whenever a
+    product changes.
+    """
+
+    def __init__(self, engine, cache: TTLCache, limit: int):
+        self.engine = engine
+        self.cache = cache
+        self.limit = limit
+
+    def search(self, db: Session, query: str | None) -> list:
+        normalized, sku = normalize_query(query), normalize_sku(query)
+        if normalized == "":
+            return []
+        ranked = self.cache.get((normalized, sku))
+        if ranked == None:
+            ranked = self.engine.search(db, normalized, sku, self.limit)
+            self.cache.set((normalized, sku), ranked)
+        return ranked
+
+    def capped(self, ranked: list) -> bool:
+        # matches beyond the limit were cut, counts over the ranking are a lower bound
+        return len(ranked) >= self.limit
+
+    def changed(self, changed: set | None):
+        self.engine.changed(changed)
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return {"index": self.engine.stats(), "cache": self.cache.stats()}
+
+
+def search_engine():
+    if SEARCH_ENGINE == "fulltext" or (SEARCH_ENGINE == "auto" and DB_CONNECTION == "mysql"):
+        return FulltextSearch()
+    return LocalSearch(SEARCH_INDEX_TTL)
+
+
+product_search = ProductSearch(search_engine(), TTLCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL), SEARCH_MAX_RESULTS)
+on_commit((Product,), product_search.changed, keys=True)
@@ -1,40 +1,138 @@
-"""
- * This file is part of the Sandy Andryanto Online Store Website.
- *
- * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
- * @copyright  2025
- *
- * For the full copyright and license information,
- * please view the LICENSE.md file that was distributed
- * with this source code.
-"""
-
-from fastapi import Request, HTTPException
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from .auth import decodeJWT
-
-class JWTBearer(HTTPBearer):
-    def __init__(self, auto_error: bool = True):
-        super(JWTBearer, self).__init__(auto_error=auto_error)
-
-    async def __call__(self, request: Request):
-        credentials: HTTPAuthorizationCredentials = await super(JWTBearer, self).__call__(request)
-        if credentials:
-            if not credentials.scheme == "Bearer":
-                raise HTTPException(status_code=403, detail="Invalid authentication scheme.")
-            if not self.verify_jwt(credentials.credentials):
-                raise HTTPException(status_code=403, detail="Invalid token or expired token.")
-            return credentials.credentials
-        else:
-            raise HTTPException(status_code=403, detail="Invalid authorization code.")
-
-    def verify_jwt(self, jwtoken: str) -> bool:
-        isTokenValid: bool = False
-
-        try:
-            payload = decodeJWT(jwtoken)
-        except:
-            payload = None
-        if payload:
-            isTokenValid = True
-        return isTokenValid
\ No newline at end of file
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from fastapi import Depends, Request, HTTPException
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+from .auth import decodeJWT, token_user_id
+from .cache import user_cache
+from .database import DB_ASYNC, get_db
+from .model import User
+from .router import async_endpoint
+from .config import load_env
+from .tracing import span
+
+import hmac
+import os
+
+load_env()
+
+INTERNAL_TOKEN = os.getenv("INTERNAL_TOKEN")
+INTERNAL_ALLOW_LOOPBACK = os.getenv("INTERNAL_ALLOW_LOOPBACK", "false").lower() in ("1", "true", "yes")
+LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+class JWTBearer(HTTPBearer):
+    def __init__(self, auto_error: bool = True):
+        super(JWTBearer, self).__init__(auto_error=auto_error)
+
+    async def __call__(self, request: Request):
+        with span("JWTBearer"):
+            credentials: HTTPAuthorizationCredentials = await super(JWTBearer, self).__call__(request)
+            if credentials:
+                if not credentials.scheme == "Bearer":
+                    raise HTTPException(status_code=403, detail="Invalid authentication scheme.")
+                payload = self.decode_jwt(credentials.credentials)
+                if not payload:
+                    raise HTTPException(status_code=403, detail="Invalid token or expired token.")
+                request.state.jwt_payload = payload
+                return credentials.credentials
+            else:
+                raise HTTPException(status_code=403, detail="Invalid authorization code.")
+
+    def decode_jwt(self, jwtoken: str) -> dict | None:
+        try:
+            return decodeJWT(jwtoken)
+        except:
+            return None
+
+    def verify_jwt(self, jwtoken: str) -> bool:
+        isTokenValid: bool = False
+
+        payload = self.decode_jwt(jwtoken)
+        if payload:
+            isTokenValid = True
+        return isTokenValid
+
+
+jwt_bearer = JWTBearer()
+
+
+def auth_principal(request: Request, token: str = Depends(jwt_bearer), db: Session = Depends(get_db)) -> User:
+    """
+    The authenticated user of the current request. The token is decoded once by
+    jwt_bearer and the user is loaded once on the request's own session, which
+    FastAPI shares with the handler's `db` dependency.
+    """
+    payload = request.state.jwt_payload
+    user_id = token_user_id(payload)
+    if user_id != None:
+        user = db.get(User, user_id)
+    else:
+        user = db.query(User).filter(User.email == payload["UserId"]).first()
+    if user == None:
+        raise HTTPException(status_code=403, detail="Invalid token or expired token.")
+    return user
+
+
+def user_projection(user: User) -> dict:
+    return {column.name: getattr(user, column.name) for column in User.__table__.columns if column.name != "password"}
+
+
+def auth_profile(request: Request, token: str = Depends(jwt_bearer), db: Session = Depends(get_db)) -> dict:
+    """
+    Cached projection of the authenticated user (no password) for handlers that
+    only need the id or profile fields. Handlers that change a user must call
+    user_cache.invalidate().
+    """
+    payload = request.state.jwt_payload
+    user_id = token_user_id(payload)
+    if user_id != None:
+        profile = user_cache.get_by_id(user_id)
+    else:
+        profile = user_cache.get_by_email(payload["UserId"])
+    if profile != None:
+        return profile
+    if user_id != None:
+        user = db.get(User, user_id)
+    else:
+        user = db.query(User).filter(User.email == payload["UserId"]).first()
+    if user == None:
+        raise HTTPException(status_code=403, detail="Invalid token or expired token.")
+    profile = user_projection(user)
+    user_cache.put(profile)
+    return profile
+
+
+if DB_ASYNC:
+    auth_principal = async_endpoint(auth_principal)
+    auth_profile = async_endpoint(auth_profile)
+
+
+class InternalAccess:
+    """
+    Guards the internal/admin endpoints: callers must send X-Internal-Token (or
+    `Authorization: Bearer`, for scrapers) matching INTERNAL_TOKEN. Without a
+    token the endpoints do not exist, unless INTERNAL_ALLOW_LOOPBACK opts in
+    to loopback clients; behind a reverse proxy every client is loopback, so
+    that is for local development only.
+    """
+
+    async def __call__(self, request: Request):
+        if INTERNAL_TOKEN:
+            scheme, _, bearer = request.headers.get("Authorization", "").partition(" ")
+            token = request.headers.get("X-Internal-Token") or (bearer if scheme.lower() == "bearer" else "")
+            if not hmac.compare_digest(token, INTERNAL_TOKEN):
+                raise HTTPException(status_code=403, detail="Invalid internal token.")
+        elif not INTERNAL_ALLOW_LOOPBACK:
+            raise HTTPException(status_code=404, detail="Not Found")
+        elif request.client == None or request.client.host not in LOOPBACK_HOSTS:
+            raise HTTPException(status_code=403, detail="Internal endpoints are only available from localhost.")
+        return True
@@ -0,0 +1,241 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from fastapi import encoders
+from .config import load_env
+from .metrics import route_label
+from .querylog import statement_shape
+
+import datetime
+import itertools
+import json
+import logging
+import os
+import queue
+import random
+import secrets
+import threading
+import time
+
+load_env()
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "200"))
+TRACE_FILE = os.getenv("TRACE_FILE")
+TRACE_QUEUE_SIZE = int(os.getenv("TRACE_QUEUE_SIZE", "1000"))
+
+logger = logging.getLogger(__name__)
+
+
+class Trace:
+
+    def __init__(self):
+        self.id = secrets.token_hex(16)
+        self.started_at = datetime.datetime.utcnow()
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.ids = itertools.count(1)
+
+
+class Span:
+
+    def __init__(self, trace: Trace, name: str, parent: int | None = None, attributes: dict | None = None):
+        self.trace = trace
+        self.id = next(trace.ids)
+        self.parent = parent
+        self.name = name
+        self.attributes = attributes or {}
+        self.start = time.perf_counter()
+        self.duration = None
+        trace.spans.append(self)
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.start
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "parent": self.parent,
+            "name": self.name,
+            "start_ms": round((self.start - self.trace.origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3) if self.duration != None else None,
+            "attributes": self.attributes
+        }
+
+
+current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Child span of the current one; does nothing (and costs one context
+    variable lookup) when the request is not sampled.
+    """
+    parent = current_span.get()
+    if parent == None:
+        yield None
+        return
+    child = Span(parent.trace, name, parent.id, attributes)
+    reset = current_span.set(child)
+    try:
+        yield child
+    except BaseException as error:
+        child.attributes["error"] = type(error).__name__
+        raise
+    finally:
+        current_span.reset(reset)
+        child.finish()
+
+
+def jsonable_encoder(obj, *args, **kwargs):
+    if current_span.get() == None:
+        return encoders.jsonable_encoder(obj, *args, **kwargs)
+    with span("jsonable_encoder"):
+        return encoders.jsonable_encoder(obj, *args, **kwargs)
+
+
+def record_statement(statement: str, started: float, seconds: float):
+    # called by the cursor listener of src/database.py once the statement is done
+    parent = current_span.get()
+    if parent == None:
+        return
+    statement_span = Span(parent.trace, "db.statement", parent.id, {"statement": statement_shape(statement)})
+    statement_span.start = started
+    statement_span.duration = seconds
+
+
+def before_flush(session, flush_context, instances):
+    parent = current_span.get()
+    if parent != None:
+        session.info["trace_flush"] = Span(parent.trace, "orm.flush", parent.id, {"new": len(session.new), "dirty": len(session.dirty), "deleted": len(session.deleted)})
+
+
+def after_flush(session, flush_context):
+    flush_span = session.info.pop("trace_flush", None)
+    if flush_span != None:
+        flush_span.finish()
+
+
+class TraceExport:
+    """
+    Finished traces, newest last, in a ring buffer of TRACE_BUFFER_SIZE and,
+    when TRACE_FILE is set, appended to that file as one JSON line each by a
+    writer thread. The request only queues the record: when the writer falls
+    TRACE_QUEUE_SIZE records behind, new ones are dropped from the file (and
+    counted) rather than making requests wait for the disk.
+    """
+
+    def __init__(self, size: int, path: str | None, pending: int):
+        self.lock = threading.Lock()
+        self.traces = deque(maxlen=size)
+        self.path = path
+        self.queue = queue.Queue(maxsize=pending)
+        self.writer = None
+        self.dropped = 0
+
+    def export(self, trace: Trace):
+        record = {
+            "trace_id": trace.id,
+            "started_at": trace.started_at.isoformat() + "Z",
+            "spans": [item.to_dict() for item in trace.spans]
+        }
+        with self.lock:
+            self.traces.append(record)
+            if not self.path:
+                return
+            if self.writer == None:
+                self.writer = threading.Thread(target=self.write, name="trace-export", daemon=True)
+                self.writer.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+
+    def write(self):
+        reported = 0
+        while True:
+            records = [self.queue.get()]
+            while not self.queue.empty() and len(records) < 100:
+                records.append(self.queue.get_nowait())
+            closing = None in records
+            lines = [json.dumps(record, default=str) + "\n" for record in records if record != None]
+            try:
+                with open(self.path, "a") as handle:
+                    handle.writelines(lines)
+            except OSError:
+                logger.exception("could not append traces to %s", self.path)
+            with self.lock:
+                dropped = self.dropped
+            if dropped > reported:
+                logger.warning("trace file writer fell behind, %d traces dropped so far", dropped)
+                reported = dropped
+            if closing:
+                return
+
+    def close(self):
+        # writes what is queued, at shutdown
+        with self.lock:
+            writer, self.writer = self.writer, None
+        if writer != None:
+            self.queue.put(None)
+            writer.join()
+
+    def dump(self, limit: int = 50, min_ms: float = 0.0, route: str | None = None) -> list:
+        with self.lock:
+            traces = list(self.traces)
+        selected = []
+        for record in reversed(traces):
+            root = record["spans"][0]
+            if (root["duration_ms"] or 0) < min_ms or (route != None and root["attributes"].get("route") != route):
+                continue
+            selected.append(record)
+            if len(selected) >= limit:
+                break
+        return selected
+
+
+trace_export = TraceExport(TRACE_BUFFER_SIZE, TRACE_FILE, TRACE_QUEUE_SIZE)
+
+
+class TracingMiddleware:
+    """
+    Traces TRACE_SAMPLE_RATE of the requests: the root span covers the whole
+    response, children are opened with span() by the dependencies, the
+    hasher, the ORM flushes, SQL statements and serialization.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or TRACE_SAMPLE_RATE <= 0 or random.random() >= TRACE_SAMPLE_RATE:
+            return await self.app(scope, receive, send)
+
+        root = Span(Trace(), "request", None, {"method": scope["method"], "path": scope["path"]})
+        reset = current_span.set(root)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                root.attributes["status"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_span.reset(reset)
+            root.finish()
+            root.attributes["route"] = route_label(scope)
+            trace_export.export(root.trace)
@@ -0,0 +1,87 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from fastapi import Depends
+from fastapi.responses import JSONResponse, PlainTextResponse
+from .tracing import jsonable_encoder
+from .security import InternalAccess
+from .database import pool_status
+from .cache import user_cache
+from .auth import token_cache
+from .hasher import hasher
+from .metrics import render, PROMETHEUS_CONTENT_TYPE
+from .querylog import query_stats
+from .tracing import trace_export
+from .profiler import ProfilerBusy, PROFILER_INTERVAL_MS, profiler
+from .reference import reference_data
+from .facets import facet_store
+from .search import product_search
+from .view_home import home_page
+from .router import DatabaseRouter
+
+view_internal = DatabaseRouter()
+
+@view_internal.get("/api/internal/pool", dependencies=[Depends(InternalAccess())])
+def view_internal_pool():
+    return JSONResponse(content=jsonable_encoder(pool_status()), status_code=200)
+
+@view_internal.get("/api/internal/cache", dependencies=[Depends(InternalAccess())])
+def view_internal_cache():
+    payload = {
+        "users": user_cache.stats(),
+        "tokens": token_cache.stats(),
+        "reference": reference_data.stats(),
+        "home_page": home_page.stats(),
+        "facets": facet_store.stats(),
+        "search": product_search.stats()
+    }
+    return JSONResponse(content=jsonable_encoder(payload), status_code=200)
+
+@view_internal.get("/api/internal/hasher", dependencies=[Depends(InternalAccess())])
+def view_internal_hasher():
+    return JSONResponse(content=jsonable_encoder(hasher.stats()), status_code=200)
+
+@view_internal.get("/api/internal/metrics", dependencies=[Depends(InternalAccess())])
+def view_internal_metrics():
+    return PlainTextResponse(content=render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+@view_internal.get("/api/internal/queries", dependencies=[Depends(InternalAccess())])
+def view_internal_queries():
+    return JSONResponse(content=jsonable_encoder(query_stats.stats()), status_code=200)
+
+@view_internal.get("/api/internal/traces", dependencies=[Depends(InternalAccess())])
+def view_internal_traces(limit: int = 50, min_ms: float = 0.0, route: str | None = None):
+    return JSONResponse(content=jsonable_encoder(trace_export.dump(limit, min_ms, route)), status_code=200)
+
+@view_internal.post("/api/internal/profiler/start", dependencies=[Depends(InternalAccess())])
+def view_internal_profiler_start(mode: str = "cpu", seconds: float = 10, interval_ms: float = PROFILER_INTERVAL_MS, idle: bool = False, frames: int = 1):
+    if mode not in ("cpu", "memory"):
+        return JSONResponse(content="The profiler mode must be cpu or memory.", status_code=400)
+    if seconds <= 0 or interval_ms <= 0 or frames < 1:
+        return JSONResponse(content="The seconds, interval_ms and frames must be positive.", status_code=400)
+    try:
+        profiler.start(mode, seconds, interval_ms, idle, frames)
+    except ProfilerBusy:
+        return JSONResponse(content="A profiling run is already in progress on this worker.", status_code=400)
+    return JSONResponse(content=jsonable_encoder(profiler.status()), status_code=200)
+
+@view_internal.post("/api/internal/profiler/stop", dependencies=[Depends(InternalAccess())])
+def view_internal_profiler_stop():
+    profiler.stop()
+    return JSONResponse(content=jsonable_encoder(profiler.status()), status_code=200)
+
+@view_internal.get("/api/internal/profiler", dependencies=[Depends(InternalAccess())])
+def view_internal_profiler():
+    return JSONResponse(content=jsonable_encoder(profiler.status()), status_code=200)
+
+@view_internal.get("/api/internal/profiler/collapsed", dependencies=[Depends(InternalAccess())])
+def view_internal_profiler_collapsed():
+    return PlainTextResponse(content=profiler.collapsed())
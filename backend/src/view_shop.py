@@ -1,143 +1,114 @@
-"""
- * This file is part of the Sandy Andryanto Online Store Website.
- *
- * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
- * @copyright  2025
- *
- * For the full copyright and license information,
- * please view the LICENSE.md file that was distributed
- * with this source code.
-"""
-
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy import func, desc
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import text
-from sqlalchemy import or_, and_
-from .database import get_db
-from .model import *
-
-import random
-import math
-
-view_shop = APIRouter()
-
-@view_shop.get("/api/shop/filter")
-def view_shop_filter(db: Session = Depends(get_db)):
-    
-    getTopSellings = db.query(Product).filter(and_(Product.status == 1, Product.published_date <= func.now())).order_by(desc(Product.total_rating)).limit(3).all()
-    topPrice =  db.query(Product).filter(and_(Product.status == 1, Product.published_date <= func.now())).order_by(desc(Product.price)).first()
-    minPrice =  db.query(Product).filter(and_(Product.status == 1, Product.published_date <= func.now())).order_by(Product.price).first()
-    
-    getCategories = (
-        db.query(
-            Category.id.label("id"),
-            Category.name.label("name"),
-            func.count(products_categories.c.product_id).label("total")
-        )
-        .join(products_categories, Category.id == products_categories.c.category_id)
-        .group_by(Category.id)
-        .all()
-    )
-    
-    getBrands = (
-        db.query(
-            Brand.id.label("id"),
-            Brand.name.label("name"),
-            func.count(Product.id).label("total")
-        )
-        .join(Product, Brand.id == Product.brand_id)
-        .group_by(Brand.id)
-        .all()
-    )
-
-    categories = [{"id": row.id, "name": row.name, "total": row.total} for row in getCategories]
-    brands = [{"id": row.id, "name": row.name, "total": row.total} for row in getBrands]
-    topProduct =  db.query(Product).filter(and_(Product.status == 1, Product.published_date <= func.now())).order_by(desc(Product.total_rating)).first()
-    
-    products = list(map(lambda row: {
-        "id": row.id,
-        "name": row.name,
-        "image": row.image,
-        "category": [cat.name for cat in row.categories][0],
-        "price": row.price,
-        "price_old": Decimal(row.price) + (Decimal(row.price) * Decimal(0.05)),
-        "newest": True if random.randint(1,2) == 1 else False,
-        "discount": True if random.randint(1,2) == 1 else False,
-        "total_rating":math.ceil(((Decimal(row.total_rating) / Decimal(topProduct.total_rating) * 100) / 20))
-    }, getTopSellings))
-    
-    
-    payload = {
-       "categories": categories,
-       "brands":brands,
-       "tops": products,
-       "maxPrice": topPrice.price,
-       "minPrice": minPrice.price
-    }
-    return JSONResponse(content=jsonable_encoder(payload), status_code=200)
-
-@view_shop.get("/api/shop/list")
-def view_shop_list(
-        db: Session = Depends(get_db),
-        page: int = 1,
-        limit: int = 10,
-        order: str = "products.id",
-        dir: str = "desc",
-        search: str | None = None,
-        brand: str | None = None,
-        category: str | None = None,
-        priceMin: str | None = None,
-        priceMax: str | None = None
-    ):
-    
-    if order == 'id':
-        order = 'products.id'
-   
-    offset = ((page-1)*limit)
-    topProduct =  db.query(Product).filter(and_(Product.status == 1, Product.published_date <= func.now())).order_by(desc(Product.total_rating)).first()
-    total = db.query(Product).filter(Product.status == 1).count()
-    data = db.query(Product).order_by(text(f"{order} {dir}")).filter(Product.status == 1)
-    
-    if search != None:
-        data = data.filter(or_(Product.name.ilike(f'%{search}%'), Product.sku.ilike(f'%{search}%'), Product.description.ilike(f'%{search}%'), Product.details.ilike(f'%{search}%')))
-        
-    if category != None:
-        category_ids = [int(x) for x in category.split(",")] 
-        data = data.join(Product.categories).filter(Category.id.in_(category_ids))
-        
-    if brand != None:
-        brand_ids = [int(x) for x in brand.split(",")] 
-        data = data.filter(Product.brand_id.in_(brand_ids))
-        
-    if priceMin != None and priceMax != None:
-        data = data.filter(Product.price >= priceMin).filter(Product.price <= priceMax)
-       
-        
-    total_filtered = data.count()
-    data = data.limit(limit).offset(offset)
-    
-    resultProducts = list(map(lambda row: {
-        "id": row.id,
-        "name": row.name,
-        "image": row.image,
-        "category": ", ".join([cat.name for cat in row.categories] ),
-        "price": row.price,
-        "price_old": Decimal(row.price) + (Decimal(row.price) * Decimal(0.05)),
-        "newest": True if random.randint(1,2) == 1 else False,
-        "discount": True if random.randint(1,2) == 1 else False,
-        "total_rating":math.ceil(((Decimal(row.total_rating) / Decimal(topProduct.total_rating) * 100) / 20))
-    }, data))
-
-    payload = {
-        "total_filtered": total_filtered,
-        "total_all": total,
-        "list": resultProducts,
-        "limit": limit,
-        "order": order,
-        "sort": dir
-    }
-   
-    return JSONResponse(content=jsonable_encoder(payload), status_code=200)
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from fastapi import Depends, Request
+from fastapi.responses import JSONResponse
+from .tracing import jsonable_encoder
+from sqlalchemy import func, desc
+from sqlalchemy.orm import Session
+from sqlalchemy import or_, and_
+from .database import get_read_db
+from .facets import facet_store
+from .search import product_search
+from .pagination import CountCache, RankOrdering, SortRegistry, PAGE_TOTALS_TTL, page_size, paginate
+from .product_card import card_options, product_cards
+from .router import DatabaseRouter
+from .model import *
+
+
+view_shop = DatabaseRouter()
+
+product_totals = CountCache(Product, PAGE_TOTALS_TTL)
+
+shop_orderings = SortRegistry("products", Product.id, "id", {
+    "id": Product.id,
+    "price": Product.price,
+    "total_rating": Product.total_rating,
+    "total_order": Product.total_order,
+    "published_date": Product.published_date,
+    "publishedAt": Product.published_date
+})
+
+@view_shop.get("/api/shop/filter")
+def view_shop_filter(db: Session = Depends(get_read_db)):
+    
+    getTopSellings = db.query(Product).options(*card_options()).filter(and_(Product.status == 1, Product.published_date <= func.now())).order_by(desc(Product.total_rating)).limit(3).all()
+    facets = facet_store.get(db)
+    
+    products = product_cards(db, getTopSellings)
+    
+    
+    payload = {
+       "categories": facets["categories"],
+       "brands": facets["brands"],
+       "tops": products,
+       "maxPrice": facets["maxPrice"],
+       "minPrice": facets["minPrice"]
+    }
+    return JSONResponse(content=jsonable_encoder(payload), status_code=200)
+
+@view_shop.get("/api/shop/list")
+def view_shop_list(
+        db: Session = Depends(get_read_db),
+        page: int = 1,
+        limit: int = 10,
+        order: str = "products.id",
+        dir: str = "desc",
+        search: str | None = None,
+        brand: str | None = None,
+        category: str | None = None,
+        priceMin: str | None = None,
+        priceMax: str | None = None,
+        cursor: str | None = None,
+        estimate: bool = False
+    ):
+    
+    limit = page_size(limit)
+    ordering = shop_orderings.ordering(order, dir)
+    total = product_totals.get("active", db.query(Product).filter(Product.status == 1), estimate)
+    data = db.query(Product).options(*card_options(ordering.column)).filter(Product.status == 1)
+    capped = False
+    
+    if search != None and search.strip() != "":
+        ranked = [product_id for product_id, _ in product_search.search(db, search)]
+        capped = product_search.capped(ranked)
+        data = data.filter(Product.id.in_(ranked))
+        if order == "relevance" and len(ranked) > 0:
+            ordering = RankOrdering(Product.id, {product_id: position for position, product_id in enumerate(ranked)})
+        
+    if category != None:
+        category_ids = [int(x) for x in category.split(",")] 
+        data = data.join(Product.categories).filter(Category.id.in_(category_ids))
+        
+    if brand != None:
+        brand_ids = [int(x) for x in brand.split(",")] 
+        data = data.filter(Product.brand_id.in_(brand_ids))
+        
+    if priceMin != None and priceMax != None:
+        data = data.filter(Product.price >= priceMin).filter(Product.price <= priceMax)
+       
+        
+    result = paginate(data, ordering, limit, page, cursor, estimate)
+    resultProducts = product_cards(db, result.rows, all_categories=True)
+
+    payload = {
+        "total_filtered": result.total,
+        "total_all": total,
+        "total_estimated": result.estimated or capped,
+        "search_capped": capped,
+        "list": resultProducts,
+        "limit": limit,
+        "order": ordering.name,
+        "sort": dir,
+        "next_cursor": result.next_cursor
+    }
+   
+    return JSONResponse(content=jsonable_encoder(payload), status_code=200)
@@ -0,0 +1,42 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from conftest import INTERNAL_TOKEN
+from src import security
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_token_is_required(client):
+    assert (await client.get("/api/internal/queries")).status_code == 403
+    assert (await client.get("/api/internal/queries", headers={"X-Internal-Token": "wrong"})).status_code == 403
+    assert (await client.get("/api/internal/queries", headers={"X-Internal-Token": INTERNAL_TOKEN})).status_code == 200
+    assert (await client.get("/api/internal/queries", headers={"Authorization": "Bearer " + INTERNAL_TOKEN})).status_code == 200
+
+
+async def test_closed_without_a_token(app, monkeypatch):
+    monkeypatch.setattr(security, "INTERNAL_TOKEN", None)
+    # behind a reverse proxy every request comes from loopback
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as local:
+        assert (await local.get("/api/internal/queries")).status_code == 404
+
+        monkeypatch.setattr(security, "INTERNAL_ALLOW_LOOPBACK", True)
+        assert (await local.get("/api/internal/queries")).status_code == 200
+
+
+async def test_loopback_opt_in_rejects_remote_clients(client, monkeypatch):
+    monkeypatch.setattr(security, "INTERNAL_TOKEN", None)
+    monkeypatch.setattr(security, "INTERNAL_ALLOW_LOOPBACK", True)
+    assert (await client.get("/api/internal/queries")).status_code == 403
@@ -0,0 +1,67 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from src.materializer import MaterializedDocument
+
+import threading
+import time
+
+import pytest
+
+
+class SlowBuild:
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self.release = threading.Event()
+
+    def __call__(self, db):
+        self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("build failed")
+        return {"calls": self.calls}
+
+
+def burst(document: MaterializedDocument, build: SlowBuild, requests: int = 8) -> list:
+    with ThreadPoolExecutor(requests) as pool:
+        futures = [pool.submit(document.get, None) for _ in range(requests)]
+        while document.building == None:
+            time.sleep(0.001)
+        # let the others queue up behind the first build
+        time.sleep(0.05)
+        build.release.set()
+        return futures
+
+
+def test_cold_burst_builds_once():
+    build = SlowBuild()
+    document = MaterializedDocument("test", build, 60)
+    futures = burst(document, build)
+
+    assert build.calls == 1
+    assert len({future.result().etag for future in futures}) == 1
+
+
+def test_failed_build_is_retried_by_the_next_request():
+    build = SlowBuild(fail=True)
+    document = MaterializedDocument("test", build, 60)
+    futures = burst(document, build)
+
+    assert build.calls == 1
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result()
+
+    build.fail = False
+    assert document.get(None).body == b'{"calls":2}'
@@ -0,0 +1,50 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+import base64
+import json
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def forge(value, order: str = "price") -> str:
+    token = {"o": order, "d": "desc", "v": value, "i": 3, "n": 9}
+    return base64.urlsafe_b64encode(json.dumps(token).encode()).decode().rstrip("=")
+
+
+async def test_cursor_pages_through_the_listing(client):
+    first = (await client.get("/api/shop/list", params={"order": "price", "limit": 2})).json()
+    response = await client.get("/api/shop/list", params={"order": "price", "limit": 2, "cursor": first["next_cursor"]})
+    assert response.status_code == 200
+    assert {row["id"] for row in response.json()["list"]}.isdisjoint(row["id"] for row in first["list"])
+
+
+@pytest.mark.parametrize("value, order", [
+    ({"x": 1}, "price"),
+    ([1, 2], "price"),
+    ({"d": ["1"]}, "price"),
+    ({"d": "NaN"}, "price"),
+    ("cheap", "price"),
+    ({"t": "yesterday"}, "published_date"),
+    (12.5, "total_rating"),
+    (True, "total_rating"),
+    ("3", "id")
+])
+async def test_forged_cursor_is_a_bad_request(client, value, order):
+    response = await client.get("/api/shop/list", params={"order": order, "cursor": forge(value, order)})
+    assert response.status_code == 400
+
+
+async def test_garbage_cursor_is_a_bad_request(client):
+    response = await client.get("/api/shop/list", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
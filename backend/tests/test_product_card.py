@@ -0,0 +1,87 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from conftest import drop_document
+from src.consistency import CONSISTENCY_HEADER, sign_token
+from src.querylog import SQL_NPLUSONE_THRESHOLD, query_budget
+
+import time
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def primary() -> dict:
+    # rows written below go to the primary only, reads have to follow them there
+    return {CONSISTENCY_HEADER: sign_token(time.time() + 60)}
+
+
+async def statements(client, url: str, reset=None, **kwargs) -> int:
+    # the page is requested once beforehand so that cached totals and ratings do not skew the count
+    await client.get(url, **kwargs)
+    if reset != None:
+        reset()
+    with query_budget(100, SQL_NPLUSONE_THRESHOLD) as log:
+        response = await client.get(url, **kwargs)
+    assert response.status_code == 200
+    return log.total
+
+
+async def test_shop_list_statements_do_not_grow_with_the_page(client):
+    small = await statements(client, "/api/shop/list", params={"limit": 2})
+    large = await statements(client, "/api/shop/list", params={"limit": 8})
+    assert small == large
+
+
+async def test_home_page_statements_do_not_grow_with_the_catalog(client):
+    from src.database import SessionLocal
+    from src.model import Product
+    from src.view_home import home_page
+
+    def drop():
+        # without a document the request builds it inline, in the measured context
+        drop_document(home_page)
+
+    async def build() -> tuple:
+        drop()
+        count = await statements(client, "/api/home/page", reset=drop, headers=primary())
+        return count, len((await client.get("/api/home/page")).json()["products"])
+
+    with SessionLocal() as db:
+        hidden = [row.id for row in db.query(Product).filter(Product.status == 1).order_by(Product.id).offset(2)]
+        full, full_cards = await build()
+        db.query(Product).filter(Product.id.in_(hidden)).update({"status": 0})
+        db.commit()
+        try:
+            few, few_cards = await build()
+        finally:
+            db.query(Product).filter(Product.id.in_(hidden)).update({"status": 1})
+            db.commit()
+            drop()
+
+    assert few_cards < full_cards
+    assert few == full
+
+
+async def test_review_listing_statements_do_not_grow_with_the_reviews(client, auth_headers, user):
+    from src.database import SessionLocal
+    from src.model import ProductReview
+
+    url = "/api/order/review/2"
+    headers = {**auth_headers, **primary()}
+    before = await statements(client, url, headers=headers)
+    with SessionLocal() as db:
+        db.add_all([ProductReview(product_id=2, user_id=user["id"], rating=20 * (index + 1), review=f"Review {index}") for index in range(5)])
+        db.commit()
+    after = await statements(client, url, headers=headers)
+    assert len((await client.get(url, headers=headers)).json()) >= 5
+    assert before == after
@@ -0,0 +1,74 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from conftest import drop_document
+from src.querylog import query_budget
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+# budgets hold with cold caches (reference data, facets, ratings, totals); the
+# same SELECT four times in one request is a query in a loop
+REPEATS = 4
+
+
+async def test_shop_list(client):
+    with query_budget(4, REPEATS):
+        response = await client.get("/api/shop/list", params={"limit": 8})
+    assert response.status_code == 200
+
+
+async def test_shop_list_filtered(client):
+    params = {"search": "product", "category": "1,2", "brand": "1,2,3", "priceMin": "0", "priceMax": "100000", "order": "relevance"}
+    with query_budget(4, REPEATS):
+        response = await client.get("/api/shop/list", params=params)
+    assert response.status_code == 200
+
+
+async def test_shop_filter(client):
+    with query_budget(6, REPEATS):
+        response = await client.get("/api/shop/filter")
+    assert response.status_code == 200
+
+
+async def test_home_page_build(client):
+    from src.view_home import home_page
+
+    drop_document(home_page)
+    with query_budget(7, REPEATS):
+        response = await client.get("/api/home/page")
+    assert response.status_code == 200
+
+
+async def test_home_page_is_served_from_memory(client):
+    await client.get("/api/home/page")
+    with query_budget(0):
+        response = await client.get("/api/home/page")
+    assert response.status_code == 200
+
+
+async def test_product_detail(client, auth_headers):
+    with query_budget(11, REPEATS):
+        response = await client.get("/api/order/cart/1", headers=auth_headers)
+    assert response.status_code == 200
+
+
+async def test_add_to_cart(client, auth_headers):
+    from src.database import SessionLocal
+    from src.model import ProductInventory
+
+    with SessionLocal() as db:
+        inventory = db.query(ProductInventory).filter(ProductInventory.product_id == 1).first()
+    form = {"size_id": inventory.size_id, "colour_id": inventory.colour_id, "qty": 1}
+    with query_budget(13, REPEATS):
+        response = await client.post("/api/order/cart/1", json=form, headers=auth_headers)
+    assert response.status_code == 200
@@ -0,0 +1,62 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from src.consistency import CONSISTENCY_HEADER
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def reviews(client, headers: dict) -> list:
+    response = await client.get("/api/order/review/1", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_read_after_write_is_served_by_the_primary(client, auth_headers):
+    before = await reviews(client, auth_headers)
+
+    response = await client.post("/api/order/review/1", json={"rating": 80, "review": "Read your writes"}, headers=auth_headers)
+    assert response.status_code == 200
+    token = response.headers[CONSISTENCY_HEADER]
+    client.cookies.clear()
+
+    # without the token the read goes to the replica, which never sees the write
+    assert len(await reviews(client, auth_headers)) == len(before)
+    # echoing the token, as the frontend does, keeps it on the primary
+    fresh = await reviews(client, {**auth_headers, CONSISTENCY_HEADER: token})
+    assert len(fresh) == len(before) + 1
+    assert fresh[0]["review"] == "Read your writes"
+
+
+async def test_reads_do_not_issue_a_token(client, auth_headers):
+    response = await client.get("/api/order/review/1", headers=auth_headers)
+    assert CONSISTENCY_HEADER not in response.headers
+
+
+async def test_estimated_totals_do_not_issue_a_token(client):
+    from src.view_shop import product_totals
+
+    # the table statistics lookup runs on a cache miss only
+    product_totals.cache.clear()
+    response = await client.get("/api/shop/list", params={"estimate": "true"})
+    assert response.status_code == 200
+    assert CONSISTENCY_HEADER not in response.headers
+
+
+async def test_forged_token_is_ignored(client, auth_headers):
+    before = await reviews(client, auth_headers)
+    await client.post("/api/order/review/1", json={"rating": 60, "review": "Forged token"}, headers=auth_headers)
+    client.cookies.clear()
+
+    forged = await reviews(client, {**auth_headers, CONSISTENCY_HEADER: "9999999999.0000"})
+    assert len(forged) == len(before)
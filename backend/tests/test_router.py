@@ -0,0 +1,28 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from sqlalchemy.util.concurrency import greenlet_spawn
+from src.router import offload
+
+import threading
+
+import pytest
+
+
+def test_offload_runs_inline_in_a_sync_handler():
+    assert offload(threading.get_ident) == threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_offload_leaves_the_event_loop_inside_run_sync():
+    # AsyncSession.run_sync runs the handler in a greenlet on the event loop thread
+    loop_thread = threading.get_ident()
+    assert await greenlet_spawn(offload, threading.get_ident) != loop_thread
@@ -0,0 +1,140 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from src.search import LocalSearchIndex, SKU_EXACT_BOOST, normalize_query, normalize_sku, product_search
+
+import pytest
+
+
+def test_inactive_products_are_not_ranked(database):
+    from src.database import SessionLocal
+    from src.model import Product
+
+    with SessionLocal() as db:
+        product = db.query(Product).filter(Product.sku == "P003").one()
+        product.status = 0
+        db.commit()
+        try:
+            product_search.changed(None)
+            ranked = [product_id for product_id, _ in product_search.search(db, "product")]
+            assert product.id not in ranked
+            assert len(ranked) > 0
+        finally:
+            product.status = 1
+            db.commit()
+            product_search.changed(None)
+
+
+@pytest.mark.anyio
+async def test_capped_search_is_flagged(client, monkeypatch):
+    response = await client.get("/api/shop/list", params={"search": "product"})
+    assert response.status_code == 200
+    assert response.json()["search_capped"] == False
+
+    monkeypatch.setattr(product_search, "limit", 3)
+    product_search.changed(None)
+    try:
+        response = await client.get("/api/shop/list", params={"search": "product"})
+        payload = response.json()
+        assert payload["search_capped"] == True
+        assert payload["total_estimated"] == True
+        assert payload["total_filtered"] == 3
+    finally:
+        product_search.changed(None)
+
+
+def ranked(index: LocalSearchIndex, query: str) -> list:
+    return [product_id for product_id, _ in index.search(normalize_query(query), normalize_sku(query), 10)]
+
+
+def test_sku_with_separators_is_an_exact_match():
+    index = LocalSearchIndex()
+    index.add(1, "AB-123", "Runner", None, None)
+    index.add(2, "AB-1234", "Runner", None, None)
+    index.add(3, "XY-9", "AB 123 compatible strap", None, None)
+
+    scores = dict(index.search(normalize_query("ab-123"), normalize_sku("ab-123"), 10))
+    assert ranked(index, "ab-123") == [1, 2, 3]
+    assert scores[1] >= SKU_EXACT_BOOST
+
+
+def test_accented_words_are_tokens():
+    index = LocalSearchIndex()
+    index.add(1, "C1", "Café crème", None, None)
+    index.add(2, "C2", "Cafe latte", None, None)
+
+    assert normalize_query("CAFÉ Crème") == "café crème"
+    assert ranked(index, "crème") == [1]
+    assert ranked(index, "CAFÉ") == [1]
+
+
+def test_query_tokens_match_as_prefixes():
+    index = LocalSearchIndex()
+    index.add(1, "S1", "Leather sneakers", None, None)
+    index.add(2, "S2", "Sneak peek poster", None, None)
+    index.add(3, "S3", "Canvas boots", None, None)
+
+    assert set(ranked(index, "snea")) == {1, 2}
+    # every token has to match
+    assert ranked(index, "lea snea") == [1]
+    assert ranked(index, "boo snea") == []
+
+
+def test_exact_terms_and_weighted_fields_rank_first():
+    index = LocalSearchIndex()
+    index.add(1, "T1", "Plain tee", None, "A shirt for every day")
+    index.add(2, "T2", "Shirt", None, None)
+    index.add(3, "T3", "Shirts pack", None, None)
+    index.add(4, "T4", "Hoodie", None, None)
+
+    # an exact term outweighs a prefix of a longer one, and the name outweighs the description
+    assert ranked(index, "shirt") == [2, 3, 1]
+
+
+def test_rare_terms_weigh_more():
+    index = LocalSearchIndex()
+    index.add(1, "R1", "Red wool scarf", None, None)
+    index.add(2, "R2", "Red cotton scarf", None, None)
+    index.add(3, "R3", "Red cotton hat", None, None)
+
+    scores = dict(index.search(normalize_query("wool"), normalize_sku("wool"), 10))
+    common = dict(index.search(normalize_query("red"), normalize_sku("red"), 10))
+    assert scores[1] > common[1]
+
+
+def test_exact_sku_then_sku_prefix_then_text():
+    index = LocalSearchIndex()
+    index.add(1, "P10", "Belt", None, None)
+    index.add(2, "P100", "Belt", None, None)
+    index.add(3, "X1", "P10 compatible belt", "P10 P10 P10", "P10")
+    index.add(4, "P1", "Belt", None, None)
+
+    assert ranked(index, "p10") == [1, 2, 3]
+
+
+def test_committed_products_are_reindexed(database):
+    from src.database import SessionLocal
+    from src.model import Product
+
+    with SessionLocal() as db:
+        product = db.query(Product).filter(Product.sku == "P004").one()
+        name = product.name
+        assert product.id not in [product_id for product_id, _ in product_search.search(db, "zanzibar")]
+
+        product.name = "Zanzibar espadrilles"
+        db.commit()
+        try:
+            assert [product_id for product_id, _ in product_search.search(db, "zanzib")] == [product.id]
+            assert product.id not in [product_id for product_id, _ in product_search.search(db, name)]
+        finally:
+            product.name = name
+            db.commit()
+        assert product_search.search(db, "zanzibar") == []
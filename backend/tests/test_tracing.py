@@ -0,0 +1,60 @@
+"""
+ * This file is part of the Sandy Andryanto Online Store Website.
+ *
+ * @author     Sandy Andryanto <sandy.andryanto.official@gmail.com>
+ * @copyright  2025
+ *
+ * For the full copyright and license information,
+ * please view the LICENSE.md file that was distributed
+ * with this source code.
+"""
+
+from src import tracing
+from src.tracing import Span, Trace, TraceExport
+
+import json
+import threading
+
+
+def finished_trace() -> Trace:
+    trace = Trace()
+    Span(trace, "request").finish()
+    return trace
+
+
+def test_file_is_written_by_the_writer_thread(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    export = TraceExport(10, str(path), 10)
+    traces = [finished_trace() for _ in range(3)]
+    for trace in traces:
+        export.export(trace)
+    export.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["trace_id"] for line in lines] == [trace.id for trace in traces]
+    assert export.dropped == 0
+
+
+def test_slow_disk_drops_records_instead_of_waiting(tmp_path, monkeypatch):
+    entered, release = threading.Event(), threading.Event()
+
+    def slow_open(*args, **kwargs):
+        entered.set()
+        release.wait(5)
+        return open(*args, **kwargs)
+
+    monkeypatch.setattr(tracing, "open", slow_open, raising=False)
+    path = tmp_path / "traces.jsonl"
+    export = TraceExport(10, str(path), 1)
+
+    export.export(finished_trace())
+    assert entered.wait(5)
+    # the writer holds the first record, the queue takes one more, the rest are dropped
+    for _ in range(3):
+        export.export(finished_trace())
+    assert export.dropped == 2
+    assert len(export.dump()) == 4
+
+    release.set()
+    export.close()
+    assert len(path.read_text().splitlines()) == 2
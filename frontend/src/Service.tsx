@@ -1,4 +1,31 @@
-import axios from "axios"
+import axios, { type AxiosInstance } from "axios"
+
+// Read-your-writes: the backend answers a write with X-Consistency-Token; sending it back
+// until it expires keeps the following reads on the primary database instead of a replica.
+const consistencyHeader = "X-Consistency-Token"
+const consistencyStorage = "consistency_token"
+
+const withConsistency = (instance: AxiosInstance) => {
+    instance.interceptors.request.use((config) => {
+        const consistencyToken = localStorage.getItem(consistencyStorage)
+        if (consistencyToken !== null) {
+            if (parseInt(consistencyToken.split(".")[0]) * 1000 > Date.now()) {
+                config.headers.set(consistencyHeader, consistencyToken)
+            } else {
+                localStorage.removeItem(consistencyStorage)
+            }
+        }
+        return config
+    })
+    instance.interceptors.response.use((response) => {
+        const issued = response.headers[consistencyHeader.toLowerCase()]
+        if (issued) {
+            localStorage.setItem(consistencyStorage, issued)
+        }
+        return response
+    })
+    return instance
+}
 
 const http = (auth:boolean, token?: string) => {
 
@@ -24,7 +51,7 @@ const http = (auth:boolean, token?: string) => {
         }
     }
 
-    return axios.create({ baseURL: `${import.meta.env.VITE_APP_BACKEND_URL}`, headers: headers })
+    return withConsistency(axios.create({ baseURL: `${import.meta.env.VITE_APP_BACKEND_URL}`, headers: headers }))
 }
 
 const ping = async () => {
@@ -74,7 +101,7 @@ const profile = {
     upload: async (formData:unknown) => {
         const auth_token = localStorage.getItem('auth_token')
         const headerUpload = { 'Content-Type': 'multipart/form-data', "Authorization ": `Bearer ${auth_token}`}
-        return await axios.create({ baseURL: `${import.meta.env.VITE_APP_BACKEND_URL}`, headers: headerUpload }).post("/api/profile/upload", formData)
+        return await withConsistency(axios.create({ baseURL: `${import.meta.env.VITE_APP_BACKEND_URL}`, headers: headerUpload })).post("/api/profile/upload", formData)
     },
 }
 
@@ -337,6 +337,7 @@ const StorePage = () => {
                         <option value={'total_rating|desc'}>Rating</option>
                         <option value={'price|asc'}>Lowest Price</option>
                         <option value={'price|desc'}>Highest Price</option>
+                        <option value={'relevance|desc'}>Relevance</option>
                       </Form.Select>
                   </Form.Group>
                 </Col>